@@ -17,11 +17,13 @@ from benchexec import __version__, util
 sys.dont_write_bytecode = True  # prevent creation of .pyc files
 
 
-def add_basic_executor_options(argument_parser):
-    """Add some basic options for an executor to an argparse argument_parser."""
+def add_basic_executor_options(argument_parser, args_required=True):
+    """Add some basic options for an executor to an argparse argument_parser.
+    @param args_required: whether a command line to run needs to be given
+    """
     argument_parser.add_argument(
         "args",
-        nargs="+",
+        nargs="+" if args_required else "*",
         metavar="ARG",
         help='command line to run (prefix with "--" to ensure all arguments are treated correctly)',
     )
@@ -325,6 +325,22 @@ class BenchExec:
             """,
         )
 
+        parser.add_argument(
+            "--order-by-results",
+            dest="order_by_results",
+            action="append",
+            default=[],
+            metavar="RESULT_FILE",
+            help="""
+                Start runs in order of decreasing expected wall time
+                instead of in the order of the benchmark definition.
+                The expected wall time of each run is taken from the given
+                result XML file of a previous execution
+                (runs that are not found there are started first).
+                This option can be specified several times.
+            """,
+        )
+
         parser.add_argument(
             "--commit",
             dest="commit",
@@ -489,6 +505,15 @@ def add_container_args(parser):
             help="disable use of containers for isolation of runs",
         )
         containerexecutor.add_basic_container_args(container_args)
+        container_args.add_argument(
+            "--tool-info-processes",
+            dest="tool_info_processes",
+            type=int,
+            default=None,
+            metavar="N",
+            help="Use up to N processes for the containerized tool-info module "
+            "(default: number of parallel runs)",
+        )
 
 
 def parse_time_arg(s):
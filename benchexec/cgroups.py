@@ -285,6 +285,16 @@ class Cgroups(ABC):
         """
         pass
 
+    def wait_until_empty(self, timeout):
+        """
+        Wait until the kernel reports that no process is left in this cgroup,
+        which means that their resource usage is fully accounted.
+        @param timeout: the maximal time to wait in seconds
+        @return True if the cgroup is known to be empty,
+            False if it is not or if this is not supported
+        """
+        return False
+
     @abstractmethod
     def read_max_mem_usage(self):
         pass
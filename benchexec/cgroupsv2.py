@@ -633,6 +633,23 @@ class CgroupsV2(Cgroups):
                 return int(v) / 1_000_000
         return None
 
+    def wait_until_empty(self, timeout):
+        # The kernel notifies pollers of cgroup.events if "populated" changes,
+        # which happens when the last process exits.
+        deadline = time.monotonic() + timeout
+        with open(self.path / "cgroup.events", "rb", buffering=0) as events_file:
+            poller = select.poll()
+            poller.register(events_file, select.POLLPRI | select.POLLERR)
+            while True:
+                events_file.seek(0)
+                events = dict(line.split() for line in events_file.read().splitlines())
+                if events.get(b"populated") == b"0":
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                poller.poll(remaining * 1000)
+
     def read_max_mem_usage(self):
         # Was only added in Linux 5.19
         if self.has_value(self.MEMORY, "peak"):
@@ -42,6 +42,7 @@ __all__ = [
     "make_bind_mount",
     "make_overlay_mount",
     "mount_proc",
+    "plan_mount_hierarchy",
     "remount_with_additional_flags",
     "setup_cgroup_namespace",
     "setup_container_system_config",
@@ -214,12 +215,13 @@ def execute_in_namespace(func, use_network_ns=True):
     # and we expect practically all BenchExec users to fall in this category. For others
     # there is still the pure Python callback, which in practice works totally fine as
     # long as there does not exist a huge number of threads.
-    # There is a workaround using sys.setswitchinterval(), however, it is too late to
-    # apply it here in this function, because gil_drop_request could already be set.
     # Summary:
     # - For Linux x86_64 we use native code from _generate_native_clone_child_callback()
-    # - Otherwise, we use sys.setswitchinterval() as workaround in localexecution.py.
-    # - Direct users of ContainerExecutor are fine in practice if they use few threads.
+    # - ContainerExecutor calls this function in a single-threaded zygote process,
+    #   where the problem cannot occur.
+    # - If ContainerExecutor cannot use its zygote, it calls this function directly,
+    #   and we use sys.setswitchinterval() as workaround in localexecution.py.
+    # - Other callers are fine in practice if they use few threads.
 
     func_p = _CLONE_NESTED_CALLBACK(func)  # store in variable to avoid GC
 
@@ -241,8 +243,9 @@ def _python_clone_child_callback(func_p):
     # world, so it could be too late. For more information cf. execute_in_namespace()
     # and https://github.com/sosy-lab/benchexec/issues/435.
     # Thus we use this function only as fallback of architectures where we have no
-    # native callback. For benchexec we combine it with the sys.setswitchinterval()
-    # workaround in localexecution.py. Other users of ContainerExecutor should be safe
+    # native callback. ContainerExecutor is safe because it clones from a
+    # single-threaded zygote process (or uses the sys.setswitchinterval() workaround
+    # in localexecution.py if it cannot use the zygote). Other callers should be safe
     # as long as they do not use many threads. We cannot do anything before cloning
     # because it might be too late anyway (gil_drop_request could be set already).
     ctypes.pythonapi.PyOS_AfterFork_Child()
@@ -414,7 +417,36 @@ def activate_network_interface(iface):
         sock.close()
 
 
-def duplicate_mount_hierarchy(mount_base, temp_base, work_base, dir_modes):
+def plan_mount_hierarchy(dir_modes, previous_plan=None):
+    """
+    Determine the directory mode of each current mount point of the system,
+    such that duplicate_mount_hierarchy() does not need to do this for every run.
+    The result is a template that is valid for the given dir_modes
+    and can be passed to duplicate_mount_hierarchy() in a child process
+    that sees the same mount points.
+    Mount points that appear later on are handled by duplicate_mount_hierarchy()
+    as usual, so using an outdated plan is safe but less efficient.
+    @param dir_modes: the directory modes to apply
+    @param previous_plan: an optional earlier result of this function for the same
+        dir_modes, entries of which will be reused
+    @return a dict mapping (mountpoint, fstype) to the directory mode
+    """
+    previous_plan = previous_plan or {}
+    plan = {}
+    for _source, mountpoint, fstype, _options in get_mount_points():
+        key = (mountpoint, fstype)
+        if key not in plan:
+            plan[key] = (
+                previous_plan[key]
+                if key in previous_plan
+                else determine_directory_mode(dir_modes, mountpoint, fstype)
+            )
+    return plan
+
+
+def duplicate_mount_hierarchy(
+    mount_base, temp_base, work_base, dir_modes, mount_plan=None
+):
     """
     Setup a copy of the system's mount hierarchy below a specified directory,
     and apply all specified directory modes (e.g., read-only access or hidden)
@@ -424,6 +456,7 @@ def duplicate_mount_hierarchy(mount_base, temp_base, work_base, dir_modes):
     @param temp_base: the base directory for all temporary files
     @param work_base: the base directory for all overlayfs work files
     @param dir_modes: the directory modes to apply (without mount_base prefix)
+    @param mount_plan: optional result of plan_mount_hierarchy() for dir_modes
     """
     # Create a copy of all mountpoints.
     # Setting MS_PRIVATE flag discouples the new mounts from the original mounts,
@@ -481,7 +514,7 @@ def duplicate_mount_hierarchy(mount_base, temp_base, work_base, dir_modes):
     overlay_count = 0
 
     # Check if we need to use fuse-overlayfs for all overlay mounts.
-    use_fuse = check_use_fuse_overlayfs(mount_base, dir_modes)
+    use_fuse = check_use_fuse_overlayfs(mount_base, dir_modes, mount_plan)
 
     # Create overlay mounts for all mount points.
     fuse_overlay_mount_path = (
@@ -506,7 +539,7 @@ def duplicate_mount_hierarchy(mount_base, temp_base, work_base, dir_modes):
         if not util.path_is_below(full_mountpoint, mount_base):
             continue
         mountpoint = full_mountpoint[len(mount_base) :] or b"/"
-        mode = determine_directory_mode(dir_modes, mountpoint, fstype)
+        mode = _get_planned_directory_mode(dir_modes, mount_plan, mountpoint, fstype)
         if not mode:
             continue
 
@@ -750,6 +783,15 @@ def determine_directory_mode(dir_modes, path, fstype=None):
     return result_mode
 
 
+def _get_planned_directory_mode(dir_modes, mount_plan, mountpoint, fstype):
+    """
+    Like determine_directory_mode(), but use the result from mount_plan if present.
+    """
+    if mount_plan and (mountpoint, fstype) in mount_plan:
+        return mount_plan[(mountpoint, fstype)]
+    return determine_directory_mode(dir_modes, mountpoint, fstype)
+
+
 def _decode_path(path):
     """
     Replace tab, space, newline, and backslash escapes with actual characters.
@@ -884,10 +926,11 @@ def make_overlay_mount(mount, lower, upper, work):
     )
 
 
-def check_use_fuse_overlayfs(mount_base, dir_modes):
+def check_use_fuse_overlayfs(mount_base, dir_modes, mount_plan=None):
     """
     Check whether an overlay mountpoint requires the use of fuse-overlayfs
     by determining if there are any sub-mounts below it.
+    @param mount_plan: optional result of plan_mount_hierarchy() for dir_modes
     """
     mount_points = [
         (full_mountpoint, fstype)
@@ -897,7 +940,7 @@ def check_use_fuse_overlayfs(mount_base, dir_modes):
 
     for full_mountpoint, fstype in mount_points:
         mountpoint = full_mountpoint[len(mount_base) :] or b"/"
-        mode = determine_directory_mode(dir_modes, mountpoint, fstype)
+        mode = _get_planned_directory_mode(dir_modes, mount_plan, mountpoint, fstype)
 
         if not mode or not os.path.exists(mountpoint):
             continue
@@ -8,6 +8,7 @@
 import argparse
 import collections
 import errno
+import functools
 import glob
 import logging
 import os
@@ -21,6 +22,7 @@ import subprocess
 import sys
 import tempfile
 import traceback
+import weakref
 
 from benchexec import (
     BenchExecException,
@@ -45,6 +47,15 @@ sys.dont_write_bytecode = True  # prevent creation of .pyc files
 _MAX_RESULT_FILE_LOG_COUNT = 1000
 """How many result files to log at most."""
 
+# Error codes from child to parent
+_CHILD_OSERROR = 128
+_CHILD_UNKNOWN_ERROR = 129
+
+# Markers sent from parent to child/grandchild, cf. _start_execution_in_container()
+_MARKER_USER_MAPPING_COMPLETED = b"A"
+_MARKER_PARENT_COMPLETED = b"B"
+_MARKER_PARENT_POST_RUN_COMPLETED = b"C"
+
 
 def add_basic_container_args(argument_parser):
     argument_parser.add_argument(
@@ -393,6 +404,8 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
             key=lambda tupl: len(tupl[0]),
         )
         self._dir_modes = collections.OrderedDict(sorted_special_dirs)
+        self._mount_plan = None
+        self._zygote = None
 
         def is_accessible(path):
             mode = container.determine_directory_mode(self._dir_modes, path)
@@ -406,12 +419,6 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
                 " and the total number of CPU cores leaks into the container."
             )
 
-        if not NATIVE_CLONE_CALLBACK_SUPPORTED:
-            logging.debug(
-                "Using a non-robust fallback for clone callback. If you have many "
-                "threads please read https://github.com/sosy-lab/benchexec/issues/435"
-            )
-
         self._cgroups = Cgroups.dummy()
         if cgroup_access:
             self._cgroups = Cgroups.initialize(allowed_versions=[2])
@@ -596,6 +603,7 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
         # child: child process in new namespace (PID 1 in inner namespace),
         #        configures inner namespace, serves as dummy init,
         #        collects result of grandchild and passes it to parent
+        #        (typically created by a _ContainerZygote on behalf of the parent)
         # grandchild: child of child process (PID 2 in inner namespace), exec()s tool
 
         # We need the following communication steps between these processes:
@@ -611,10 +619,6 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
         # We cannot use the same pipe for both directions, because otherwise a sender
         # might read the bytes it has sent itself.
 
-        # Error codes from child to parent
-        CHILD_OSERROR = 128
-        CHILD_UNKNOWN_ERROR = 129
-
         # "downstream" pipe parent->grandchild
         from_parent, to_grandchild = os.pipe()
         # "upstream" pipe grandchild/child->parent
@@ -625,9 +629,6 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
         # and finally the parent sends its completion marker.
         # After the run, the child sends the result of the grand child and then waits
         # for the post_run marker, before it terminates.
-        MARKER_USER_MAPPING_COMPLETED = b"A"
-        MARKER_PARENT_COMPLETED = b"B"
-        MARKER_PARENT_POST_RUN_COMPLETED = b"C"
 
         # If the current directory is within one of the bind mounts we create,
         # we need to cd into this directory again, otherwise we would not see the
@@ -639,240 +640,28 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
             root_dir = os.path.abspath(root_dir)
             cwd = os.path.abspath(cwd)
 
-        use_cgroup_ns = cgroups.version == 2
-
-        def grandchild():
-            """Setup everything inside the process that finally exec()s the tool."""
-            try:
-                # We know that this process has PID 2 in the inner namespace,
-                # but we actually need to know its PID in the outer namespace
-                # such that parent can put us into the correct cgroups.  According to
-                # http://man7.org/linux/man-pages/man7/pid_namespaces.7.html,
-                # there are two ways to achieve this: sending a message with the PID
-                # via a socket (but Python 2 lacks a convenient API for sendmsg),
-                # and reading /proc/self in the outer procfs instance
-                # (that's what we do).
-                my_outer_pid = container.get_my_pid_from_procfs()
-
-                container.mount_proc(self._container_system_config)
-                container.reset_signal_handling()
-                child_setup_fn()  # Do some other setup the caller wants.
-
-                # Signal readiness to parent by sending our PID
-                # and wait until parent is also ready
-                os.write(to_parent, str(my_outer_pid).encode())
-                received = os.read(from_parent, 1)
-                assert received == MARKER_PARENT_COMPLETED, received
-
-                # Finalize setup
-                # We want to do as little as possible here because measurements are
-                # already running, but we can only setup the cgroup namespace
-                # once we are in the desired cgroup.
-                if use_cgroup_ns:
-                    container.setup_cgroup_namespace()
-                container.drop_capabilities()
-            except BaseException as e:
-                # When using runexec, this logging will end up in the output.log file,
-                # where usually the tool output is. This is suboptimal, but probably
-                # better than swallowing it. (In cases where this logs something,
-                # there will be no tool output, so at least no confusion.)
-                # For a complete solution we would have to send the exception via
-                # the to_parent pipe.
-                logging.error(
-                    "Error during final preparation of container in target process: %s",
-                    e,
-                )
-                raise
-            finally:
-                # close remaining ends of pipe
-                os.close(from_parent)
-                os.close(to_parent)
-            # here Python will exec() the tool for us
-
-        def child():
-            """Setup everything inside the container,
-            start the tool, and wait for result."""
-            try:
-                logging.debug(
-                    "Child: child process of RunExecutor with PID %d started",
-                    container.get_my_pid_from_procfs(),
-                )
-
-                # Put all received signals on hold until we handle them later.
-                container.block_all_signals()
-
-                # We want to avoid leaking file descriptors to the executed child.
-                # It is also nice if the child has only the minimal necessary file
-                # descriptors, to avoid keeping other pipes and files open, e.g.,
-                # those that the parent uses to communicate with other containers
-                # (if containers are started in parallel).
-                # Thus we do not use the close_fds feature of subprocess.Popen,
-                # but do the same here manually. We keep the relevant ends of our pipes,
-                # and stdin/out/err of child and grandchild.
-                necessary_fds = {
-                    sys.stdin,
-                    sys.stdout,
-                    sys.stderr,
-                    to_parent,
-                    from_parent,
-                    stdin,
-                    stdout,
-                    stderr,
-                } - {None}
-                container.close_open_fds(keep_files=necessary_fds)
-
-                try:
-                    if self._container_system_config:
-                        # A standard hostname increases reproducibility.
-                        try:
-                            socket.sethostname(container.CONTAINER_HOSTNAME)
-                        except PermissionError:
-                            logging.warning(
-                                "Changing hostname in container prevented "
-                                "by system configuration, "
-                                "real hostname will leak into the container."
-                            )
-
-                    if not self._allow_network:
-                        container.activate_network_interface("lo")
-
-                    # Wait until user mapping is finished,
-                    # this is necessary for filesystem writes
-                    received = os.read(from_parent, len(MARKER_USER_MAPPING_COMPLETED))
-                    assert received == MARKER_USER_MAPPING_COMPLETED, received
-
-                    if root_dir is not None:
-                        self._setup_root_filesystem(root_dir)
-                    else:
-                        self._setup_container_filesystem(
-                            temp_dir,
-                            output_dir if result_files_patterns else None,
-                            memlimit,
-                            memory_nodes,
-                        )
-
-                    # Marking this process as "non-dumpable" (no core dumps) also
-                    # forbids several other ways how other processes can access and
-                    # influence it:
-                    # ptrace is forbidden and much of /proc/<child>/ is inaccessible.
-                    # We set this to prevent the benchmarked tool from messing with this
-                    # process or using it to escape from the container. More info:
-                    # http://man7.org/linux/man-pages/man5/proc.5.html
-                    # It needs to be done after MARKER_USER_MAPPING_COMPLETED.
-                    libc.prctl(libc.PR_SET_DUMPABLE, libc.SUID_DUMP_DISABLE, 0, 0, 0)
-                except OSError as e:
-                    logging.critical(
-                        "Failed to configure container with operation '%s': %s",
-                        # Show executed statement, often the error does not contain
-                        # information about what was attempted.
-                        traceback.extract_tb(e.__traceback__, limit=-1)[0].line,
-                        e,
-                    )
-                    if container.check_apparmor_userns_restriction(e):
-                        logging.critical(container._ERROR_MSG_USER_NS_RESTRICTION)
-                    return CHILD_OSERROR
-
-                try:
-                    os.chdir(cwd)
-                except OSError as e:
-                    logging.critical(
-                        "Cannot change into working directory inside container: %s", e
-                    )
-                    return CHILD_OSERROR
-
-                container.setup_seccomp_filter()
-
-                try:
-                    grandchild_proc = subprocess.Popen(
-                        args,
-                        stdin=stdin,
-                        stdout=stdout,
-                        stderr=stderr,
-                        env=env,
-                        close_fds=False,
-                        preexec_fn=grandchild,  # noqa: PLW1509
-                    )
-                except (OSError, RuntimeError) as e:
-                    logging.critical("Cannot start process: %s", e)
-                    return CHILD_OSERROR
-
-                # keep capability for unmount if necessary later
-                necessary_capabilities = (
-                    [libc.CAP_SYS_ADMIN] if result_files_patterns else []
-                )
-                container.drop_capabilities(keep=necessary_capabilities)
-
-                # Close other fds that were still necessary above.
-                container.close_open_fds(
-                    keep_files={sys.stdout, sys.stderr, to_parent, from_parent}
-                )
-
-                # Set up signal handlers to forward signals to grandchild
-                # (because we are PID 1, there is a special signal handling otherwise).
-                # cf. dumb-init project: https://github.com/Yelp/dumb-init
-                # Also wait for grandchild and return its result.
-                grandchild_result = container.wait_for_child_and_forward_signals(
-                    grandchild_proc.pid, args[0]
-                )
-
-                logging.debug(
-                    "Child: process %s terminated with exit code %d.",
-                    args[0],
-                    grandchild_result[0],
-                )
-
-                if result_files_patterns:
-                    # Remove the bind mount that _setup_container_filesystem added
-                    # such that the parent can access the result files.
-                    libc.umount(temp_dir.encode())
-
-                # Re-allow access to /proc/<child>/...,
-                # this is used by the parent for accessing output files
-                libc.prctl(libc.PR_SET_DUMPABLE, libc.SUID_DUMP_USER, 0, 0, 0)
-
-                try:
-                    os.write(to_parent, pickle.dumps(grandchild_result))
-                except BrokenPipeError:
-                    # Happens e.g. in nested BenchExec executions if parent is killed
-                    # before child. If parent is killed, nothing matters anymore.
-                    logging.debug("Broken pipe to parent, already terminated?")
-                    os.close(to_parent)
-                    os.close(from_parent)
-                    return 0
-                os.close(to_parent)
-
-                # Now the parent copies the output files, we need to wait until this is
-                # finished. If the child terminates, the container file system and its
-                # tmpfs go away.
-                received = os.read(from_parent, 1)
-                assert received == MARKER_PARENT_POST_RUN_COMPLETED, received
-                os.close(from_parent)
-
-                return 0
-            except OSError:
-                logging.exception("Error in child process of RunExecutor")
-                return CHILD_OSERROR
-            except subprocess.SubprocessError as e:
-                # only reason should be "Exception occurred in preexec_fn"
-                if "Exception occurred in preexec_fn" in str(e):
-                    logging.error(
-                        "Error during final preparation of container in target process,"
-                        " check logs."
-                    )
-                else:
-                    logging.exception("Error in child process of RunExecutor")
-                return CHILD_UNKNOWN_ERROR
-            except BaseException:
-                # Need to catch everything because this method always needs to return an
-                # int (we are inside a C callback that requires returning int).
-                logging.exception("Error in child process of RunExecutor")
-                return CHILD_UNKNOWN_ERROR
+        child_args = {
+            "args": args,
+            "stdin": stdin,
+            "stdout": stdout,
+            "stderr": stderr,
+            "env": env,
+            "root_dir": root_dir,
+            "cwd": cwd,
+            "temp_dir": temp_dir,
+            "memlimit": memlimit,
+            "memory_nodes": memory_nodes,
+            "output_dir": output_dir,
+            "result_files_patterns": result_files_patterns,
+            "child_setup_fn": child_setup_fn,
+            "use_cgroup_ns": cgroups.version == 2,
+            "from_parent": from_parent,
+            "to_parent": to_parent,
+        }
 
         try:  # parent
             try:
-                child_pid = container.execute_in_namespace(
-                    child, use_network_ns=not self._allow_network
-                )
+                child_pid, wait_for_child = self._create_container_child(child_args)
             except OSError as e:
                 if (
                     e.errno == errno.EPERM
@@ -906,10 +695,7 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
             def check_child_exit_code():
                 """Check if the child process terminated cleanly
                 and raise an error otherwise."""
-                child_exitcode, _child_rusage = self._wait_for_process(
-                    child_pid, args[0]
-                )
-                child_exitcode = util.ProcessExitCode.from_raw(child_exitcode)
+                child_exitcode = util.ProcessExitCode.from_raw(wait_for_child())
                 logging.debug(
                     "Parent: child process of RunExecutor with PID %d"
                     " terminated with %s.",
@@ -919,13 +705,13 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
 
                 if child_exitcode:
                     if child_exitcode.value:
-                        if child_exitcode.value == CHILD_OSERROR:
+                        if child_exitcode.value == _CHILD_OSERROR:
                             # This was an OSError in the child,
                             # details were already logged
                             raise BenchExecException(
                                 "execution in container failed, check log for details"
                             )
-                        elif child_exitcode.value == CHILD_UNKNOWN_ERROR:
+                        elif child_exitcode.value == _CHILD_UNKNOWN_ERROR:
                             raise BenchExecException("unexpected error in container")
                         raise OSError(
                             child_exitcode.value, os.strerror(child_exitcode.value)
@@ -942,7 +728,7 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
 
             container.setup_user_mapping(child_pid, uid=self._uid, gid=self._gid)
             # signal child to continue
-            os.write(to_grandchild, MARKER_USER_MAPPING_COMPLETED)
+            os.write(to_grandchild, _MARKER_USER_MAPPING_COMPLETED)
 
             try:
                 # Wait with timeout until from_grandchild becomes ready to be read.
@@ -955,11 +741,12 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
                         "Killing it and trying again.",
                         child_pid,
                     )
-                    # As long as we have not sent MARKER_PARENT_COMPLETED, the tool is
+                    # As long as we have not sent _MARKER_PARENT_COMPLETED, the tool is
                     # not yet started and it is safe to kill the child and restart.
                     # Killing child (PID 1 in container) will also kill grandchild if it
                     # already exists.
                     util.kill_process(child_pid)
+                    wait_for_child()
                     # Open pipes will be close in finally.
                     # Signal retry to caller.
                     return None
@@ -1008,7 +795,7 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
             parent_setup = parent_setup_fn()
 
             # Signal grandchild that setup is finished
-            os.write(to_grandchild, MARKER_PARENT_COMPLETED)
+            os.write(to_grandchild, _MARKER_PARENT_COMPLETED)
 
             # Copy file descriptor, otherwise we could not close from_grandchild in
             # finally block and would leak a file descriptor in case of exception.
@@ -1056,7 +843,7 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
                 )
 
             os.close(from_grandchild_copy)
-            os.write(to_grandchild_copy, MARKER_PARENT_POST_RUN_COMPLETED)
+            os.write(to_grandchild_copy, _MARKER_PARENT_POST_RUN_COMPLETED)
             os.close(to_grandchild_copy)  # signal child that it can terminate
             check_child_exit_code()
 
@@ -1064,6 +851,329 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
 
         return grandchild_pid, grandchild_cgroups, wait_for_grandchild
 
+    def _create_container_child(self, child_args):
+        """Start the child process of a container for the given arguments
+        of _run_container_child().
+        If possible, the child is created by a zygote process,
+        otherwise directly by the current process.
+        @return: a tuple of the PID of the child and a function that waits for the
+            termination of the child and returns its raw exit code
+        """
+        child_pid = None
+        zygote = self._get_zygote()
+        if zygote is not None:
+            try:
+                child_pid = zygote.start_child(child_args)
+            except (BrokenPipeError, ConnectionResetError):
+                # The zygote terminated before it received the request,
+                # so we can safely retry with a new one.
+                self._close_zygote()
+                zygote = self._get_zygote()
+                if zygote is not None:
+                    child_pid = zygote.start_child(child_args)
+        if child_pid is not None:
+            return child_pid, lambda: zygote.wait_for_child(child_pid)
+
+        logging.debug("Creating child process of container without zygote.")
+        if not NATIVE_CLONE_CALLBACK_SUPPORTED:
+            logging.debug(
+                "Using a non-robust fallback for clone callback. If you have many "
+                "threads please read https://github.com/sosy-lab/benchexec/issues/435"
+            )
+        child_pid = self._clone_container_child(child_args)
+        return child_pid, lambda: self._wait_for_process(
+            child_pid, child_args["args"][0]
+        )[0]
+
+    def _get_zygote(self):
+        """Return the zygote of this executor, starting a new one if necessary.
+        @return: a _ContainerZygote or None if no zygote can be started
+        """
+        if self._zygote is not None and not self._zygote.is_alive():
+            logging.warning(
+                "Zygote process %d for containers terminated, starting a new one.",
+                self._zygote.pid,
+            )
+            self._close_zygote()
+        if self._zygote is None:
+            try:
+                self._zygote = _ContainerZygote(self)
+            except OSError as e:
+                logging.warning("Cannot start zygote process for containers: %s", e)
+                return None
+            self._zygote_finalizer = weakref.finalize(self, self._zygote.close)
+        return self._zygote
+
+    def _close_zygote(self):
+        if self._zygote is not None:
+            self._zygote_finalizer()
+            self._zygote = None
+
+    def _clone_container_child(self, child_args):
+        """Create the child process of a container in fresh namespaces,
+        which executes _run_container_child() with the given arguments.
+        @return: the PID of the child process
+        """
+        if child_args["root_dir"] is None:
+            # Determine directory modes of all mount points here once
+            # instead of in every child (only new mount points need to be handled).
+            self._mount_plan = container.plan_mount_hierarchy(
+                self._dir_modes, self._mount_plan
+            )
+        return container.execute_in_namespace(
+            functools.partial(self._run_container_child, **child_args),
+            use_network_ns=not self._allow_network,
+        )
+
+    def _run_container_child(
+        self,
+        args,
+        stdin,
+        stdout,
+        stderr,
+        env,
+        root_dir,
+        cwd,
+        temp_dir,
+        memlimit,
+        memory_nodes,
+        output_dir,
+        result_files_patterns,
+        child_setup_fn,
+        use_cgroup_ns,
+        from_parent,
+        to_parent,
+    ):
+        """Setup everything inside the container,
+        start the tool, and wait for result.
+        This is executed in the child process (PID 1 in the container).
+        @return: the exit code for the child process
+        """
+
+        def grandchild():
+            """Setup everything inside the process that finally exec()s the tool."""
+            try:
+                # We know that this process has PID 2 in the inner namespace,
+                # but we actually need to know its PID in the outer namespace
+                # such that parent can put us into the correct cgroups.  According to
+                # http://man7.org/linux/man-pages/man7/pid_namespaces.7.html,
+                # there are two ways to achieve this: sending a message with the PID
+                # via a socket (but Python 2 lacks a convenient API for sendmsg),
+                # and reading /proc/self in the outer procfs instance
+                # (that's what we do).
+                my_outer_pid = container.get_my_pid_from_procfs()
+
+                container.mount_proc(self._container_system_config)
+                container.reset_signal_handling()
+                child_setup_fn()  # Do some other setup the caller wants.
+
+                # Signal readiness to parent by sending our PID
+                # and wait until parent is also ready
+                os.write(to_parent, str(my_outer_pid).encode())
+                received = os.read(from_parent, 1)
+                assert received == _MARKER_PARENT_COMPLETED, received
+
+                # Finalize setup
+                # We want to do as little as possible here because measurements are
+                # already running, but we can only setup the cgroup namespace
+                # once we are in the desired cgroup.
+                if use_cgroup_ns:
+                    container.setup_cgroup_namespace()
+                container.drop_capabilities()
+            except BaseException as e:
+                # When using runexec, this logging will end up in the output.log file,
+                # where usually the tool output is. This is suboptimal, but probably
+                # better than swallowing it. (In cases where this logs something,
+                # there will be no tool output, so at least no confusion.)
+                # For a complete solution we would have to send the exception via
+                # the to_parent pipe.
+                logging.error(
+                    "Error during final preparation of container in target process: %s",
+                    e,
+                )
+                raise
+            finally:
+                # close remaining ends of pipe
+                os.close(from_parent)
+                os.close(to_parent)
+            # here Python will exec() the tool for us
+
+        try:
+            logging.debug(
+                "Child: child process of RunExecutor with PID %d started",
+                container.get_my_pid_from_procfs(),
+            )
+
+            # Put all received signals on hold until we handle them later.
+            container.block_all_signals()
+
+            # We want to avoid leaking file descriptors to the executed child.
+            # It is also nice if the child has only the minimal necessary file
+            # descriptors, to avoid keeping other pipes and files open, e.g.,
+            # those that the parent uses to communicate with other containers
+            # (if containers are started in parallel).
+            # Thus we do not use the close_fds feature of subprocess.Popen,
+            # but do the same here manually. We keep the relevant ends of our pipes,
+            # and stdin/out/err of child and grandchild.
+            necessary_fds = {
+                sys.stdin,
+                sys.stdout,
+                sys.stderr,
+                to_parent,
+                from_parent,
+                stdin,
+                stdout,
+                stderr,
+            } - {None}
+            container.close_open_fds(keep_files=necessary_fds)
+
+            try:
+                if self._container_system_config:
+                    # A standard hostname increases reproducibility.
+                    try:
+                        socket.sethostname(container.CONTAINER_HOSTNAME)
+                    except PermissionError:
+                        logging.warning(
+                            "Changing hostname in container prevented "
+                            "by system configuration, "
+                            "real hostname will leak into the container."
+                        )
+
+                if not self._allow_network:
+                    container.activate_network_interface("lo")
+
+                # Wait until user mapping is finished,
+                # this is necessary for filesystem writes
+                received = os.read(from_parent, len(_MARKER_USER_MAPPING_COMPLETED))
+                assert received == _MARKER_USER_MAPPING_COMPLETED, received
+
+                if root_dir is not None:
+                    self._setup_root_filesystem(root_dir)
+                else:
+                    self._setup_container_filesystem(
+                        temp_dir,
+                        output_dir if result_files_patterns else None,
+                        memlimit,
+                        memory_nodes,
+                    )
+
+                # Marking this process as "non-dumpable" (no core dumps) also
+                # forbids several other ways how other processes can access and
+                # influence it:
+                # ptrace is forbidden and much of /proc/<child>/ is inaccessible.
+                # We set this to prevent the benchmarked tool from messing with this
+                # process or using it to escape from the container. More info:
+                # http://man7.org/linux/man-pages/man5/proc.5.html
+                # It needs to be done after _MARKER_USER_MAPPING_COMPLETED.
+                libc.prctl(libc.PR_SET_DUMPABLE, libc.SUID_DUMP_DISABLE, 0, 0, 0)
+            except OSError as e:
+                logging.critical(
+                    "Failed to configure container with operation '%s': %s",
+                    # Show executed statement, often the error does not contain
+                    # information about what was attempted.
+                    traceback.extract_tb(e.__traceback__, limit=-1)[0].line,
+                    e,
+                )
+                if container.check_apparmor_userns_restriction(e):
+                    logging.critical(container._ERROR_MSG_USER_NS_RESTRICTION)
+                return _CHILD_OSERROR
+
+            try:
+                os.chdir(cwd)
+            except OSError as e:
+                logging.critical(
+                    "Cannot change into working directory inside container: %s", e
+                )
+                return _CHILD_OSERROR
+
+            container.setup_seccomp_filter()
+
+            try:
+                grandchild_proc = subprocess.Popen(
+                    args,
+                    stdin=stdin,
+                    stdout=stdout,
+                    stderr=stderr,
+                    env=env,
+                    close_fds=False,
+                    preexec_fn=grandchild,  # noqa: PLW1509
+                )
+            except (OSError, RuntimeError) as e:
+                logging.critical("Cannot start process: %s", e)
+                return _CHILD_OSERROR
+
+            # keep capability for unmount if necessary later
+            necessary_capabilities = (
+                [libc.CAP_SYS_ADMIN] if result_files_patterns else []
+            )
+            container.drop_capabilities(keep=necessary_capabilities)
+
+            # Close other fds that were still necessary above.
+            container.close_open_fds(
+                keep_files={sys.stdout, sys.stderr, to_parent, from_parent}
+            )
+
+            # Set up signal handlers to forward signals to grandchild
+            # (because we are PID 1, there is a special signal handling otherwise).
+            # cf. dumb-init project: https://github.com/Yelp/dumb-init
+            # Also wait for grandchild and return its result.
+            grandchild_result = container.wait_for_child_and_forward_signals(
+                grandchild_proc.pid, args[0]
+            )
+
+            logging.debug(
+                "Child: process %s terminated with exit code %d.",
+                args[0],
+                grandchild_result[0],
+            )
+
+            if result_files_patterns:
+                # Remove the bind mount that _setup_container_filesystem added
+                # such that the parent can access the result files.
+                libc.umount(temp_dir.encode())
+
+            # Re-allow access to /proc/<child>/...,
+            # this is used by the parent for accessing output files
+            libc.prctl(libc.PR_SET_DUMPABLE, libc.SUID_DUMP_USER, 0, 0, 0)
+
+            try:
+                os.write(to_parent, pickle.dumps(grandchild_result))
+            except BrokenPipeError:
+                # Happens e.g. in nested BenchExec executions if parent is killed
+                # before child. If parent is killed, nothing matters anymore.
+                logging.debug("Broken pipe to parent, already terminated?")
+                os.close(to_parent)
+                os.close(from_parent)
+                return 0
+            os.close(to_parent)
+
+            # Now the parent copies the output files, we need to wait until this is
+            # finished. If the child terminates, the container file system and its
+            # tmpfs go away.
+            received = os.read(from_parent, 1)
+            assert received == _MARKER_PARENT_POST_RUN_COMPLETED, received
+            os.close(from_parent)
+
+            return 0
+        except OSError:
+            logging.exception("Error in child process of RunExecutor")
+            return _CHILD_OSERROR
+        except subprocess.SubprocessError as e:
+            # only reason should be "Exception occurred in preexec_fn"
+            if "Exception occurred in preexec_fn" in str(e):
+                logging.error(
+                    "Error during final preparation of container in target process,"
+                    " check logs."
+                )
+            else:
+                logging.exception("Error in child process of RunExecutor")
+            return _CHILD_UNKNOWN_ERROR
+        except BaseException:
+            # Need to catch everything because this method always needs to return an
+            # int (we are inside a C callback that requires returning int).
+            logging.exception("Error in child process of RunExecutor")
+            return _CHILD_UNKNOWN_ERROR
+
     def _setup_container_filesystem(self, temp_dir, output_dir, memlimit, memory_nodes):
         """Setup the filesystem layout in the container.
         As first step, we create a copy of all existing mountpoints in mount_base,
@@ -1112,7 +1222,7 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
 
         # Copy all mounts to mount_base and apply directory modes
         container.duplicate_mount_hierarchy(
-            mount_base, temp_base, work_base, self._dir_modes
+            mount_base, temp_base, work_base, self._dir_modes, self._mount_plan
         )
 
         # Now configure some special hard-coded cases
@@ -1271,5 +1381,187 @@ class ContainerExecutor(baseexecutor.BaseExecutor):
         )
 
 
+_ZYGOTE_FD_ARGS = ("stdin", "stdout", "stderr", "from_parent", "to_parent")
+"""Arguments of _run_container_child() that are file descriptors."""
+
+_ZYGOTE_EXECUTOR_STATE = (
+    "_allow_network",
+    "_container_system_config",
+    "_container_tmpfs",
+    "_dir_modes",
+    "_mount_plan",
+    "_use_namespaces",
+)
+"""Attributes of ContainerExecutor that are necessary for _clone_container_child()."""
+
+_BENCHEXEC_IMPORT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_ZYGOTE_MAX_REQUEST_SIZE = 1024 * 1024
+_ZYGOTE_MAX_RESPONSE_SIZE = 1024
+
+
+class _ContainerZygote:
+    """
+    A helper process that creates the child processes of containers
+    on behalf of a ContainerExecutor.
+    The zygote is a fresh Python process that has only a single thread,
+    so the clone() for each run neither happens in the (potentially large and
+    multi-threaded) process of the executor nor is affected by
+    https://github.com/sosy-lab/benchexec/issues/435,
+    and state like the plan of the mount hierarchy is kept across runs.
+    It is started with subprocess instead of os.fork(),
+    which is safe even if the executor process already has several threads.
+    The zygote handles one request at a time: it creates the child,
+    sends back its PID, and after the child terminated, its exit code.
+    File descriptors for the child are passed over a Unix socket.
+    """
+
+    def __init__(self, executor):
+        self._socket, zygote_socket = socket.socketpair(
+            socket.AF_UNIX, socket.SOCK_SEQPACKET
+        )
+        # make benchexec importable even if it is not installed
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [_BENCHEXEC_IMPORT_PATH, env.get("PYTHONPATH")])
+        )
+        try:
+            with zygote_socket:
+                self._process = subprocess.Popen(
+                    [
+                        sys.executable,
+                        "-c",
+                        (
+                            "from benchexec import containerexecutor; "
+                            "containerexecutor._zygote_main()"
+                        ),
+                        str(zygote_socket.fileno()),
+                        str(logging.getLogger().getEffectiveLevel()),
+                    ],
+                    pass_fds=[zygote_socket.fileno()],
+                    env=env,
+                )
+            self._socket.send(
+                pickle.dumps(
+                    {name: getattr(executor, name) for name in _ZYGOTE_EXECUTOR_STATE}
+                )
+            )
+        except BaseException:
+            self.close()
+            raise
+        self.pid = self._process.pid
+        self._terminated = False
+        logging.debug("Started zygote process with PID %d for containers.", self.pid)
+
+    @staticmethod
+    def _serve(executor, zygote_socket):
+        """Main loop of the zygote process, handles requests until the executor
+        closes the connection."""
+        while True:
+            request, fds, _flags, _address = socket.recv_fds(
+                zygote_socket, _ZYGOTE_MAX_REQUEST_SIZE, len(_ZYGOTE_FD_ARGS)
+            )
+            if not request:
+                return
+
+            try:
+                child_args, fd_args = pickle.loads(request)
+                child_args.update(zip(fd_args, fds))
+                child_pid = executor._clone_container_child(child_args)
+            except OSError as e:
+                zygote_socket.send(pickle.dumps(("failed", e.errno or 0)))
+                continue
+            finally:
+                for fd in fds:
+                    os.close(fd)
+
+            zygote_socket.send(pickle.dumps(("started", child_pid)))
+            _pid, exitcode = os.waitpid(child_pid, 0)
+            zygote_socket.send(pickle.dumps(("terminated", child_pid, exitcode)))
+
+    def is_alive(self):
+        return not self._terminated and self._process.poll() is None
+
+    def _receive(self):
+        response = self._socket.recv(_ZYGOTE_MAX_RESPONSE_SIZE)
+        if not response:
+            self._terminated = True
+            raise BenchExecException(
+                f"Zygote process {self.pid} for containers terminated unexpectedly."
+            )
+        return pickle.loads(response)
+
+    def start_child(self, child_args):
+        """Let the zygote create the child process of a container.
+        @param child_args: the arguments for _run_container_child()
+        @return: the PID of the child, or None if the arguments cannot be passed
+            to the zygote (e.g., because child_setup_fn cannot be pickled)
+        """
+        fd_args = [
+            name
+            for name in _ZYGOTE_FD_ARGS
+            if child_args[name] is not None
+            and not (isinstance(child_args[name], int) and child_args[name] < 0)
+        ]
+        fds = [
+            arg if isinstance(arg, int) else arg.fileno()
+            for arg in (child_args[name] for name in fd_args)
+        ]
+        other_args = {
+            name: arg for name, arg in child_args.items() if name not in fd_args
+        }
+        try:
+            request = pickle.dumps((other_args, fd_args))
+            socket.send_fds(self._socket, [request], fds)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            logging.debug("Cannot pass arguments to zygote: %s", e)
+            return None
+        except OSError as e:
+            if e.errno != errno.EMSGSIZE:
+                raise
+            logging.debug("Cannot pass arguments to zygote: %s", e)
+            return None
+
+        while True:
+            response = self._receive()
+            if response[0] == "started":
+                return response[1]
+            elif response[0] == "failed":
+                raise OSError(response[1], os.strerror(response[1]))
+            # else termination of a previous child that nobody waited for
+
+    def wait_for_child(self, child_pid):
+        """Wait for the termination of a child created by start_child().
+        @return: the raw exit code of the child
+        """
+        while True:
+            response = self._receive()
+            if response[0] == "terminated" and response[1] == child_pid:
+                return response[2]
+
+    def close(self):
+        """Let the zygote terminate and wait for it."""
+        self._socket.close()
+        if hasattr(self, "_process"):
+            self._process.wait()
+
+
+def _zygote_main():
+    """Entry point of the zygote process, cf. _ContainerZygote."""
+    container.block_all_signals()
+    zygote_socket = socket.socket(fileno=int(sys.argv[1]))
+    util.setup_logging(level=int(sys.argv[2]))
+    try:
+        state = pickle.loads(zygote_socket.recv(_ZYGOTE_MAX_REQUEST_SIZE))
+        # The zygote only needs the container configuration of the executor,
+        # so we do not call __init__, which would check the configuration again.
+        executor = ContainerExecutor.__new__(ContainerExecutor)
+        executor.__dict__.update(state)
+        _ContainerZygote._serve(executor, zygote_socket)
+    except BaseException:
+        logging.exception("Error in zygote process of ContainerExecutor")
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -13,9 +13,12 @@ import inspect
 import logging
 import multiprocessing
 import os
+import pickle
+import queue
 import signal
 import socket
 import tempfile
+import threading
 
 from benchexec import (
     BenchExecException,
@@ -44,32 +47,58 @@ class ContainerizedTool:
     But the use of containers in BenchExec is for safety and robustness, not security.
     """
 
-    def __init__(self, tool_module, config):
+    def __init__(self, tool_module, config, max_processes=1):
         """Load tool-info module in subprocess.
         @param tool_module: The name of the module to load.
             Needs to define class named Tool.
         @param config: A config object suitable for
             benchexec.containerexecutor.handle_basic_container_args()
+        @param max_processes: How many subprocesses with the tool-info module
+            may be used for handling concurrent calls. Only one is started initially,
+            more are started on demand if all existing ones are busy.
         """
+        self._tool_module = tool_module
+        self._container_options = containerexecutor.handle_basic_container_args(config)
+        self._max_processes = max_processes
+        self._pools = []
+        self._starting_pools = 0
+        self._pools_lock = threading.Lock()
+        # Pools that are currently not executing a call. LIFO order keeps using
+        # the same few processes if there is only little concurrency.
+        self._idle_pools = queue.LifoQueue()
+
+        self._idle_pools.put(self._start_pool())
+
+    def _start_pool(self):
+        """Start a new subprocess, put it into a container, and load the tool-info
+        module in it."""
         # We use multiprocessing.Pool as an easy way for RPC with another process.
-        self._pool = multiprocessing.Pool(1, _init_worker_process)
+        # Additional pools are started while worker threads of benchexec are running,
+        # so we must not fork this process but let the single-threaded forkserver
+        # create the subprocesses.
+        pool = multiprocessing.get_context("forkserver").Pool(
+            1, _init_worker_process, [logging.getLogger().getEffectiveLevel()]
+        )
 
         # Call function that loads tool module and returns its doc
         try:
-            self._setup_container(tool_module, config)
+            self._setup_container(pool)
         except BaseException as e:
-            self._pool.terminate()
+            pool.terminate()
             raise e
 
-    def _setup_container(self, tool_module, config):
-        container_options = containerexecutor.handle_basic_container_args(config)
+        with self._pools_lock:
+            self._pools.append(pool)
+        return pool
+
+    def _setup_container(self, pool):
         temp_dir = tempfile.mkdtemp(prefix="Benchexec_tool_info_container_")
 
         try:
-            self.__doc__, _ = self._pool.apply(
+            self.__doc__, _ = pool.apply(
                 _init_container_and_load_tool,
-                [_init_container, tool_module, temp_dir],
-                container_options,
+                [_init_container, self._tool_module, temp_dir],
+                self._container_options,
             )
         finally:
             # Outside the container, the temp_dir is just an empty directory, because
@@ -77,31 +106,97 @@ class ContainerizedTool:
             with contextlib.suppress(OSError):
                 os.rmdir(temp_dir)
 
+    def _acquire_pool(self):
+        """Get a pool that is not used by any other thread,
+        starting a new one if all are busy and the limit is not yet reached."""
+        try:
+            return self._idle_pools.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._pools_lock:
+            start_pool = len(self._pools) + self._starting_pools < self._max_processes
+            if start_pool:
+                self._starting_pools += 1
+        if start_pool:
+            try:
+                logging.debug(
+                    "Starting additional process for tool-info module %s.",
+                    self._tool_module,
+                )
+                return self._start_pool()
+            except Exception as e:
+                logging.warning(
+                    "Could not start additional process for tool-info module: %s", e
+                )
+                with self._pools_lock:
+                    self._max_processes = len(self._pools)
+            finally:
+                with self._pools_lock:
+                    self._starting_pools -= 1
+
+        return self._idle_pools.get()
+
     def close(self):
-        self._forward_call("close", [], {})
-        self._pool.close()
+        with self._pools_lock:
+            pools = list(self._pools)
+        for pool in pools:
+            pool.apply(_call_tool_func, ["close", [], {}])
+            pool.close()
 
     def _forward_call(self, method_name, args, kwargs):
         """Call given method indirectly on the tool instance in the container."""
-        return self._pool.apply(_call_tool_func, [method_name, list(args), kwargs])
+        pool = self._acquire_pool()
+        try:
+            return pool.apply(_call_tool_func, [method_name, list(args), kwargs])
+        finally:
+            self._idle_pools.put(pool)
 
     @classmethod
     def _add_proxy_function(cls, method_name, method):
         """Add function to given class that calls the specified method indirectly."""
 
-        @functools.wraps(method)  # lets proxy_function look like method (name and doc)
-        def proxy_function(self, *args, **kwargs):
-            return self._forward_call(method_name, args, kwargs)
+        if method_name in _MEMOIZED_METHODS:
+            # These methods are called often (e.g., per run) but would always return
+            # the same result for the same arguments, so we avoid the (potentially
+            # slow, cf. https://github.com/python/cpython/issues/98493) calls.
+            # Arguments and results are kept pickled, because arguments are often
+            # not hashable and callers get a fresh copy of the result as without cache.
+            @functools.lru_cache(maxsize=_MEMOIZED_CALLS_CACHE_SIZE)
+            def forward_memoized_call(self, pickled_args):
+                args, kwargs = pickle.loads(pickled_args)
+                return pickle.dumps(self._forward_call(method_name, args, kwargs))
+
+            @functools.wraps(method)
+            def proxy_function(self, *args, **kwargs):
+                pickled_result = forward_memoized_call(
+                    self, pickle.dumps((args, kwargs))
+                )
+                return pickle.loads(pickled_result)
 
-        if method_name == "working_directory":
-            # Add a cache. This method is called per run but would always return the
-            # same result. On some systems the calls are slow and this is worth it:
-            # https://github.com/python/cpython/issues/98493
-            proxy_function = functools.lru_cache()(proxy_function)
+        else:
+            # functools.wraps lets proxy_function look like method (name and doc)
+            @functools.wraps(method)
+            def proxy_function(self, *args, **kwargs):
+                return self._forward_call(method_name, args, kwargs)
 
         setattr(cls, member_name, proxy_function)
 
 
+_MEMOIZED_METHODS = {
+    "cmdline",
+    "environment",
+    "name",
+    "program_files",
+    "project_url",
+    "version",
+    "working_directory",
+}
+"""Methods of the tool-info API whose result depends only on the arguments."""
+
+_MEMOIZED_CALLS_CACHE_SIZE = 1024
+
+
 # The following will automatically add forwarding methods for all methods defined by the
 # current tool-info API. This should work without any version-specific adjustments,
 # so we declare compatibility with the latest version with @CURRENT_BASETOOL.register.
@@ -115,9 +210,12 @@ for member_name, member in inspect.getmembers(
     ContainerizedTool._add_proxy_function(member_name, member)
 
 
-def _init_worker_process():
+def _init_worker_process(log_level):
     """Initial setup of worker process from multiprocessing module."""
 
+    # The process is not a fork of benchexec, so logging needs to be set up.
+    util.setup_logging(level=log_level)
+
     # Need to reset signal handling because multiprocessing relies on SIGTERM
     # but benchexec adds a handler for it.
     signal.signal(signal.SIGTERM, signal.SIG_DFL)
@@ -5,21 +5,49 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import errno
 import logging
 import os
+import stat
+import struct
 import threading
 import time
 
-from benchexec import container, util
+from benchexec import container, libc, resourcemonitor, util
 
 _CHECK_INTERVAL_SECONDS = 60
 _DURATION_WARNING_THRESHOLD = 1
+_STEP_SIZE = 1000  # number of files or directory entries handled in one callback
 
+_INOTIFY_MASK = (
+    libc.IN_CREATE
+    | libc.IN_DELETE
+    | libc.IN_MOVED_FROM
+    | libc.IN_MOVED_TO
+    | libc.IN_ONLYDIR
+    | libc.IN_DONT_FOLLOW
+    | libc.IN_EXCL_UNLINK
+)
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len of struct inotify_event
+_INOTIFY_BUFFER_SIZE = 64 * 1024
 
-class FileHierarchyLimitThread(threading.Thread):
+
+class FileHierarchyLimit:
     """
-    Thread that periodically checks whether a given file hierarchy exceeds some limits.
+    Checks whether a given file hierarchy exceeds some limits.
     After this happens, the process is terminated.
+
+    The set of files is tracked incrementally from inotify events
+    of all directories in the hierarchy, which are handled by the shared
+    ResourceMonitor. The whole hierarchy is scanned only initially, and again
+    if the kernel dropped events or if there are not enough inotify watches
+    available (in the latter case periodically).
+    The sizes of all known files are checked periodically,
+    because inotify does not report all writes (e.g., not those through an
+    overlay mount to its upper directory), and reacting on every write
+    would be expensive.
+    Scanning and checking is split into small steps such that the ResourceMonitor
+    is not blocked by large file hierarchies.
     """
 
     def __init__(
@@ -30,9 +58,6 @@ class FileHierarchyLimitThread(threading.Thread):
         pid_to_kill,
         callbackFn=lambda reason: None,
     ):
-        super().__init__()
-        self.name = "FileHierarchyLimitThread-" + self.name
-
         assert os.path.isdir(path)
         self._path = path
         self._files_count_limit = files_count_limit
@@ -40,9 +65,249 @@ class FileHierarchyLimitThread(threading.Thread):
 
         self._pid_to_kill = pid_to_kill
         self._callback = callbackFn
-        self._finished = threading.Event()
+        self._lock = threading.Lock()
+        self._finished = False
+        self._monitor = resourcemonitor.ResourceMonitor.get_instance()
+        self._timer = None
+
+        self._inotify_fd = None
+        self._watched_dirs = {}  # inotify watch descriptor -> directory
+        self._file_sizes = {}  # file -> size
+        self._files_size = 0  # sum of self._file_sizes
+
+        self._pending_dirs = []  # directories that still need to be listed
+        self._pending_files = []  # files whose size needs to be checked
+        self._scan_entries = None  # iterator of directory that is being listed
+        self._step_timer = None
+        self._rescan_start_time = None  # set while a rescan is in progress
+
+    def start(self):
+        with self._lock:
+            self._timer = self._monitor.call_soon(self._start)
+
+    def _start(self):
+        with self._lock:
+            if self._finished:
+                return
+            try:
+                self._inotify_fd = libc.inotify_init1(
+                    libc.IN_NONBLOCK | libc.IN_CLOEXEC
+                )
+            except OSError as e:
+                logging.warning(
+                    "Cannot watch file hierarchy for enforcement of limits, "
+                    "falling back to periodic scanning: %s",
+                    e.strerror,
+                )
+            else:
+                self._monitor.add_reader(self._inotify_fd, self._handle_events)
+
+            self._rescan()
+            self._timer = self._monitor.call_at(
+                time.monotonic() + _CHECK_INTERVAL_SECONDS, self._check_periodically
+            )
+
+    def _rescan(self):
+        """Forget all information about files and start scanning the whole hierarchy."""
+        if self._scan_entries is not None:
+            self._scan_entries.close()
+            self._scan_entries = None
+        self._watched_dirs.clear()
+        self._file_sizes.clear()
+        self._files_size = 0
+        self._pending_dirs.clear()
+        self._pending_files.clear()
+        self._rescan_start_time = time.monotonic()
+        self._add_directory(self._path)
+
+    def _rescan_finished(self):
+        duration = time.monotonic() - self._rescan_start_time
+        self._rescan_start_time = None
+        logging.debug(
+            "FileHierarchyLimit for process %d: "
+            "files count: %d, files size: %d, scan duration %fs",
+            self._pid_to_kill,
+            len(self._file_sizes),
+            self._files_size,
+            duration,
+        )
+        if duration > _DURATION_WARNING_THRESHOLD:
+            logging.warning(
+                "Scanning file hierarchy for enforcement of limits took %ds.",
+                duration,
+            )
+
+    def _add_directory(self, path):
+        # Watch before listing the directory such that we do not miss new files.
+        if self._inotify_fd is not None:
+            try:
+                wd = libc.inotify_add_watch(
+                    self._inotify_fd, os.fsencode(path), _INOTIFY_MASK
+                )
+                self._watched_dirs[wd] = path
+            except OSError as e:
+                if e.errno == errno.ENOSPC:
+                    logging.warning(
+                        "Not enough inotify watches available for enforcement of "
+                        "file-hierarchy limits, falling back to periodic scanning. "
+                        "Increase fs.inotify.max_user_watches to avoid this."
+                    )
+                    self._monitor.remove_reader(self._inotify_fd)
+                    self._inotify_fd = None
+                elif e.errno not in [errno.ENOENT, errno.ENOTDIR]:
+                    raise  # otherwise directory was just deleted or replaced
+        self._pending_dirs.append(path)
+        self._schedule_step()
+
+    def _remove_directory(self, path):
+        prefix = os.path.join(path, "")
+        for wd, watched_dir in list(self._watched_dirs.items()):
+            if watched_dir == path or watched_dir.startswith(prefix):
+                del self._watched_dirs[wd]
+                if self._inotify_fd is not None:
+                    try:
+                        libc.inotify_rm_watch(self._inotify_fd, wd)
+                    except OSError:
+                        pass  # directory is already gone
+        for file in [f for f in self._file_sizes if f.startswith(prefix)]:
+            self._remove_file(file)
+
+    def _update_file(self, path):
+        # file with the path as visible for tool
+        tool_path = "/" + os.path.relpath(path, self._path)
+        if container.is_container_system_config_file(tool_path):
+            return
+        try:
+            file_stat = os.lstat(path)
+        except OSError:
+            file_stat = None  # possibly just deleted
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            self._remove_file(path)
+            return
+        self._files_size += file_stat.st_size - self._file_sizes.get(path, 0)
+        self._file_sizes[path] = file_stat.st_size
+
+    def _remove_file(self, path):
+        self._files_size -= self._file_sizes.pop(path, 0)
+
+    def _schedule_step(self):
+        if self._step_timer is None:
+            self._step_timer = self._monitor.call_soon(self._step)
 
-    def _check_limit(self, files_count, files_size):
+    def _has_pending_work(self):
+        return bool(
+            self._scan_entries is not None or self._pending_dirs or self._pending_files
+        )
+
+    def _step(self):
+        with self._lock:
+            self._step_timer = None
+            if self._finished:
+                return
+            for _ in range(_STEP_SIZE):
+                if not self._handle_pending_work_item():
+                    break
+
+            if self._check_limit():
+                self._cancel()
+            elif self._has_pending_work():
+                self._schedule_step()
+            elif self._rescan_start_time is not None:
+                self._rescan_finished()
+
+    def _handle_pending_work_item(self):
+        """Handle a single entry of a directory listing or a single file.
+        @return whether there was something to do
+        """
+        if self._scan_entries is not None:
+            try:
+                entry = next(self._scan_entries, None)
+            except OSError:
+                entry = None  # directory was just deleted
+            if entry is None:
+                self._scan_entries.close()
+                self._scan_entries = None
+            elif entry.is_dir(follow_symlinks=False):
+                self._add_directory(entry.path)
+            else:
+                self._update_file(entry.path)
+        elif self._pending_dirs:
+            try:
+                self._scan_entries = os.scandir(self._pending_dirs.pop())
+            except (FileNotFoundError, NotADirectoryError):
+                pass  # just deleted or replaced
+        elif self._pending_files:
+            file = self._pending_files.pop()
+            if file in self._file_sizes:
+                self._update_file(file)
+        else:
+            return False
+        return True
+
+    def _handle_events(self):
+        with self._lock:
+            if self._finished or self._inotify_fd is None:
+                return
+            try:
+                # watching might get disabled while handling events
+                while self._inotify_fd is not None:
+                    data = os.read(self._inotify_fd, _INOTIFY_BUFFER_SIZE)
+                    if not data:
+                        break
+                    self._handle_event_data(data)
+            except BlockingIOError:
+                pass  # all events handled
+
+            if self._files_count_limit and self._check_limit():
+                self._cancel()
+
+    def _handle_event_data(self, data):
+        offset = 0
+        while offset < len(data) and self._inotify_fd is not None:
+            wd, mask, _cookie, name_length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            name = data[offset : offset + name_length].rstrip(b"\0")
+            offset += name_length
+
+            if mask & libc.IN_Q_OVERFLOW:
+                logging.debug("Inotify event queue overflowed, rescanning.")
+                self._rescan()
+                continue
+            directory = self._watched_dirs.get(wd)
+            if mask & libc.IN_IGNORED:
+                self._watched_dirs.pop(wd, None)
+                continue
+            if directory is None:
+                continue  # event for already removed watch
+            path = os.path.join(directory, os.fsdecode(name))
+
+            if mask & libc.IN_ISDIR:
+                if mask & (libc.IN_DELETE | libc.IN_MOVED_FROM):
+                    self._remove_directory(path)
+                elif mask & (libc.IN_CREATE | libc.IN_MOVED_TO):
+                    self._add_directory(path)
+            elif mask & (libc.IN_DELETE | libc.IN_MOVED_FROM):
+                self._remove_file(path)
+            elif mask & (libc.IN_CREATE | libc.IN_MOVED_TO):
+                self._update_file(path)
+
+    def _check_periodically(self):
+        with self._lock:
+            if self._finished:
+                return
+            if not self._has_pending_work():
+                if self._inotify_fd is None:
+                    self._rescan()
+                else:
+                    self._pending_files = list(self._file_sizes)
+                    self._schedule_step()
+            self._timer = self._monitor.call_at(
+                time.monotonic() + _CHECK_INTERVAL_SECONDS, self._check_periodically
+            )
+
+    def _check_limit(self):
+        files_count = len(self._file_sizes)
+        files_size = self._files_size
         if self._files_count_limit and files_count > self._files_count_limit:
             reason = "files-count"
         elif self._files_size_limit and files_size > self._files_size_limit:
@@ -60,48 +325,22 @@ class FileHierarchyLimitThread(threading.Thread):
         util.kill_process(self._pid_to_kill)
         return reason
 
-    def run(self):
-        while not self._finished.is_set():
-            self._finished.wait(_CHECK_INTERVAL_SECONDS)
-
-            files_count = 0
-            files_size = 0
-            start_time = time.monotonic()
-            for current_dir, _dirs, files in os.walk(self._path):
-                for file in files:
-                    abs_file = os.path.join(current_dir, file)
-                    file = "/" + os.path.relpath(file, self._path)
-                    # file has now the path as visible for tool
-                    if (
-                        not container.is_container_system_config_file(file)
-                        and os.path.isfile(abs_file)
-                        and not os.path.islink(abs_file)
-                    ):
-                        files_count += 1
-                        if self._files_size_limit:
-                            try:
-                                files_size += os.path.getsize(abs_file)
-                            except OSError:
-                                # possibly just deleted
-                                pass
-            if self._check_limit(files_count, files_size):
-                return
-
-            duration = time.monotonic() - start_time
-
-            logging.debug(
-                "FileHierarchyLimitThread for process %d: "
-                "files count: %d, files size: %d, scan duration %fs",
-                self._pid_to_kill,
-                files_count,
-                files_size,
-                duration,
-            )
-            if duration > _DURATION_WARNING_THRESHOLD:
-                logging.warning(
-                    "Scanning file hierarchy for enforcement of limits took %ds.",
-                    duration,
-                )
-
     def cancel(self):
-        self._finished.set()
+        with self._lock:
+            self._cancel()
+
+    def _cancel(self):
+        if self._finished:
+            return
+        self._finished = True
+        if self._timer:
+            self._timer.cancel()
+        if self._step_timer:
+            self._step_timer.cancel()
+        if self._scan_entries is not None:
+            self._scan_entries.close()
+            self._scan_entries = None
+        if self._inotify_fd is not None:
+            # closing the inotify instance also removes all its watches
+            self._monitor.remove_reader(self._inotify_fd)
+            self._inotify_fd = None
@@ -5,13 +5,17 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import bz2
+import gzip
 import logging
+import math
 import os
 import queue
 import resource
 import sys
 import threading
 import time
+from xml.etree import ElementTree
 
 from benchexec import (
     BenchExecException,
@@ -132,6 +136,8 @@ def execute_benchmark(benchmark, output_handler):
             "and thus makes the performance unreliable."
         )
 
+    expected_walltimes = _load_expected_walltimes(benchmark.config.order_by_results)
+
     throttle_check = systeminfo.CPUThrottleCheck()
     swap_check = systeminfo.SwapCheck()
 
@@ -156,6 +162,7 @@ def execute_benchmark(benchmark, output_handler):
                 coreAssignment,
                 memoryAssignment,
                 cpu_packages,
+                expected_walltimes,
             )
 
     if throttle_check.has_throttled():
@@ -173,9 +180,88 @@ def execute_benchmark(benchmark, output_handler):
     return 0
 
 
+def _load_expected_walltimes(result_files):
+    """
+    Read the wall times of all runs from the given result XML files
+    of previous executions.
+    @param result_files: a list of (possibly compressed) result XML files
+    @return: a dict from run identifiers to wall times (in seconds)
+    """
+    expected_walltimes = {}
+    for result_file in result_files:
+        if result_file.endswith(".bz2"):
+            open_func = bz2.open
+        elif result_file.endswith(".gz"):
+            open_func = gzip.open
+        else:
+            open_func = open
+        try:
+            with open_func(result_file, "rb") as f:
+                result_elem = ElementTree.parse(f).getroot()  # noqa: S314
+        except (OSError, ElementTree.ParseError) as e:
+            logging.warning(
+                "Could not read result file %s for ordering runs: %s", result_file, e
+            )
+            continue
+
+        base_dir = os.path.dirname(result_file)
+        for run_elem in result_elem.iter("run"):
+            values = {
+                column.get("title"): column.get("value")
+                for column in run_elem.findall("column")
+            }
+            value = values.get("walltime") or values.get("cputime")
+            try:
+                walltime = float(value.removesuffix("s"))
+            except (AttributeError, ValueError):
+                continue
+
+            identifier = run_elem.get("name")
+            if run_elem.get("files"):
+                # names of runs with input files are relative to the result file
+                identifier = os.path.abspath(os.path.join(base_dir, identifier))
+            expected_walltimes[identifier] = max(
+                walltime, expected_walltimes.get(identifier, 0)
+            )
+
+    if result_files:
+        logging.debug("Found expected wall times for %d runs.", len(expected_walltimes))
+    return expected_walltimes
+
+
+def _order_runs(runs, expected_walltimes):
+    """
+    Sort the given runs such that runs with the longest expected wall time
+    are started first, which reduces the time in which only few runs are left
+    and most cores are idle.
+    Runs without an expected wall time are considered to be the most expensive ones.
+    The order is stable, i.e., runs with equal expected wall time keep their order.
+    """
+    if not expected_walltimes:
+        return list(runs)
+
+    def expected_walltime(run):
+        if run.sourcefiles:
+            identifier = os.path.abspath(run.identifier)
+        else:
+            identifier = run.identifier
+        return expected_walltimes.get(identifier, math.inf)
+
+    return sorted(runs, key=expected_walltime, reverse=True)
+
+
 def _execute_run_set(
-    runSet, benchmark, output_handler, coreAssignment, memoryAssignment, cpu_packages
+    runSet,
+    benchmark,
+    output_handler,
+    coreAssignment,
+    memoryAssignment,
+    cpu_packages,
+    expected_walltimes=None,
 ):
+    if expected_walltimes is None:
+        expected_walltimes = {}
+
     # get times before runSet
     energy_measurement = EnergyMeasurement.create_if_supported()
     ruBefore = resource.getrusage(resource.RUSAGE_CHILDREN)
@@ -186,7 +272,7 @@ def _execute_run_set(
     output_handler.output_before_run_set(runSet)
 
     # put all runs into a queue
-    for run in runSet.runs:
+    for run in _order_runs(runSet.runs, expected_walltimes):
         _Worker.working_queue.put(run)
 
     # keep a counter of unfinished runs for the below assertion
@@ -199,6 +285,8 @@ def _execute_run_set(
             unfinished_runs -= 1
 
     if not containerexecutor.NATIVE_CLONE_CALLBACK_SUPPORTED:
+        # Container children are normally created by a single-threaded zygote,
+        # but not if this is impossible, e.g., for arguments that cannot be pickled.
         logging.debug(
             "Using sys.setswitchinterval() workaround for #435 in container "
             "mode because native callback is not available."
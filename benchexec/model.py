@@ -148,11 +148,13 @@ def handle_files_from_task_definition(patterns, task_def_file):
     return result
 
 
-def load_tool_info(tool_name: str, config):
+def load_tool_info(tool_name: str, config, num_of_threads: int = 1):
     """
     Load the tool-info class.
     @param tool_name: The name of the tool-info module.
     Either a full Python package name or a name within the benchexec.tools package.
+    @param num_of_threads: The number of threads that will use the tool-info module,
+    used as default for the number of processes of a containerized tool-info module.
     @return: A tuple of the full name of the used tool-info module and an instance of the tool-info class.
     """
     tool_module = tool_name if "." in tool_name else f"benchexec.tools.{tool_name}"
@@ -161,7 +163,14 @@ def load_tool_info(tool_name: str, config):
             # lazy import because it can fail if container mode is not supported
             from benchexec import containerized_tool
 
-            tool = containerized_tool.ContainerizedTool(tool_module, config)
+            max_processes = getattr(config, "tool_info_processes", None)
+            if max_processes is None:
+                max_processes = num_of_threads
+            if max_processes < 1:
+                sys.exit("At least one process for the tool-info module is required.")
+            tool = containerized_tool.ContainerizedTool(
+                tool_module, config, max_processes
+            )
         else:
             tool = __import__(tool_module, fromlist=["Tool"]).Tool()
             tool = tooladapter.adapt_to_current_version(tool)
@@ -286,11 +295,20 @@ class Benchmark:
                 f"Its root element is not named 'benchmark'."
             )
 
+        self.num_of_threads = int(rootTag.get("threads", 1))
+        if config.num_of_threads is not None:
+            self.num_of_threads = config.num_of_threads
+        if self.num_of_threads < 1:
+            logging.error("At least ONE thread must be given!")
+            sys.exit()
+
         # get tool
         tool_name = rootTag.get("tool")
         if not tool_name:
             sys.exit("A tool needs to be specified in the benchmark definition file.")
-        (self.tool_module, self.tool) = load_tool_info(tool_name, config)
+        (self.tool_module, self.tool) = load_tool_info(
+            tool_name, config, self.num_of_threads
+        )
         self.tool_name = self.tool.name()
         # will be set from the outside if necessary (may not be the case in SaaS environments)
         self.tool_version = None
@@ -374,13 +392,6 @@ class Benchmark:
             # if only cputime_hard is given, set cputime to same value
             self.rlimits = self.rlimits._replace(cputime=self.rlimits.cputime_hard)
 
-        self.num_of_threads = int(rootTag.get("threads", 1))
-        if config.num_of_threads is not None:
-            self.num_of_threads = config.num_of_threads
-        if self.num_of_threads < 1:
-            logging.error("At least ONE thread must be given!")
-            sys.exit()
-
         # get global options and property file
         self.options = util.get_list_from_xml(rootTag)
         self.propertytag = get_propertytag(rootTag)
@@ -10,7 +10,7 @@ import os
 import threading
 from ctypes import cdll
 
-from benchexec import util
+from benchexec import resourcemonitor, util
 
 _libc = cdll.LoadLibrary("libc.so.6")
 _EFD_CLOEXEC = 0x80000  # from <sys/eventfd.h>: mark eventfd as close-on-exec
@@ -18,9 +18,9 @@ _EFD_CLOEXEC = 0x80000  # from <sys/eventfd.h>: mark eventfd as close-on-exec
 _BYTE_FACTOR = 1000  # byte in kilobyte
 
 
-class KillProcessOnOomThread(threading.Thread):
+class KillProcessOnOom:
     """
-    Thread that kills the process when they run out of memory.
+    Handler that kills the process when they run out of memory.
     Usually the kernel would do this by itself,
     but sometimes the process still hangs because it does not even have
     enough memory left to get killed
@@ -33,6 +33,8 @@ class KillProcessOnOomThread(threading.Thread):
     and telling the kernel to notify us about OOMs by writing the event file
     descriptor and an file descriptor of the memory.oom_control file
     to cgroup.event_control.
+    The event file descriptor is watched by the shared ResourceMonitor,
+    so no separate thread is necessary.
     The kernel-side process killing is disabled by writing 1 to memory.oom_control.
     Sources:
     https://www.kernel.org/doc/Documentation/cgroups/memory.txt
@@ -44,12 +46,12 @@ class KillProcessOnOomThread(threading.Thread):
     """
 
     def __init__(self, cgroups, pid_to_kill, callbackFn=lambda reason: None):
-        super().__init__()
-        self.name = "KillProcessOnOomThread-" + self.name
-        self._finished = threading.Event()
+        self._lock = threading.Lock()
+        self._finished = False
         self._pid_to_kill = pid_to_kill
         self._cgroups = cgroups
         self._callback = callbackFn
+        self._monitor = resourcemonitor.ResourceMonitor.get_instance()
 
         cgroup = cgroups[cgroups.MEMORY]  # for raw access
         ofd = os.open(os.path.join(cgroup, "memory.oom_control"), os.O_WRONLY)
@@ -78,42 +80,34 @@ class KillProcessOnOomThread(threading.Thread):
         finally:
             os.close(ofd)
 
-    def run(self):
-        # os.close gets called in finally,
-        # which sometimes is executed while the process is shutting down already.
-        # It happens that the Python interpreter has already cleaned up at this point
-        # and "os" resolves to None, leading to an AttributeError.
-        # Thus we keep our own reference to this function.
-        # (Should not happen anymore since this is no longer a daemon thread,
-        # but should not hurt anyway.)
-        close = os.close
-        try:
-            # In an eventfd, there are always 8 bytes for the event number.
-            # We just do a blocking read to wait for the event.
-            _ = os.read(self._efd, 8)
-            # If read returned, this means the kernel sent us an event.
-            # It does so either on OOM or if the cgroup is removed.
-            if not self._finished.is_set():
-                self._callback("memory")
-                logging.debug(
-                    "Killing process %s due to out-of-memory event from kernel.",
-                    self._pid_to_kill,
-                )
-                util.kill_process(self._pid_to_kill)
-                # Also kill all children of subprocesses directly.
-                with open(
-                    os.path.join(self._cgroups[self._cgroups.MEMORY], "tasks"), "rt"
-                ) as tasks:
-                    for task in tasks:
-                        util.kill_process(int(task))
-
-                # We now need to increase the memory limit of this cgroup
-                # to give the process a chance to terminate
-                self._reset_memory_limit("memory.memsw.limit_in_bytes")
-                self._reset_memory_limit("memory.limit_in_bytes")
-
-        finally:
-            close(self._efd)
+    def start(self):
+        self._monitor.add_reader(self._efd, self._handle_event)
+
+    def _handle_event(self):
+        # The kernel sends us an event either on OOM or if the cgroup is removed.
+        # In both cases we are no longer interested in further events.
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+            self._monitor.remove_reader(self._efd)
+            self._callback("memory")
+            logging.debug(
+                "Killing process %s due to out-of-memory event from kernel.",
+                self._pid_to_kill,
+            )
+            util.kill_process(self._pid_to_kill)
+            # Also kill all children of subprocesses directly.
+            with open(
+                os.path.join(self._cgroups[self._cgroups.MEMORY], "tasks"), "rt"
+            ) as tasks:
+                for task in tasks:
+                    util.kill_process(int(task))
+
+            # We now need to increase the memory limit of this cgroup
+            # to give the process a chance to terminate
+            self._reset_memory_limit("memory.memsw.limit_in_bytes")
+            self._reset_memory_limit("memory.limit_in_bytes")
 
     def _reset_memory_limit(self, limitFile):
         if self._cgroups.has_value(self._cgroups.MEMORY, limitFile):
@@ -140,4 +134,7 @@ class KillProcessOnOomThread(threading.Thread):
                 )
 
     def cancel(self):
-        self._finished.set()
+        with self._lock:
+            if not self._finished:
+                self._finished = True
+                self._monitor.remove_reader(self._efd)
@@ -8,21 +8,19 @@
 import base64
 import bz2
 import collections
+import concurrent.futures
 import datetime
 import decimal
 import io
 import logging
-import math
 import os
 import shlex
 import sys
 import threading
 import time
 import zipfile
-
-# Need to disable pytype for minidom due to https://github.com/google/pytype/issues/1130
-from xml.dom import minidom  # pytype: disable=pyi-error
 from xml.etree import ElementTree
+from xml.sax.saxutils import escape
 
 import benchexec
 from benchexec import filewriter, intel_cpu_energy, result, util
@@ -121,7 +119,11 @@ class OutputHandler:
             self.log_zip = zipfile.ZipFile(
                 benchmark.log_zip, mode="w", compression=zipfile.ZIP_DEFLATED
             )
-            self.log_zip_lock = threading.Lock()
+            # Logs are compressed and written to the ZIP file in the background
+            # such that the worker threads do not have to wait for this.
+            self.log_zip_writer = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="LogZipWriter"
+            )
             self.all_created_files.add(benchmark.log_zip)
 
     def store_system_info(
@@ -410,13 +412,14 @@ class OutputHandler:
         # write (empty) results to XML if we have a file for the rundefinition
         if self.results_per_rundefinition or not self.results_per_taskset:
             runSet.xml_file_name = xml_file_name
-            self._write_rough_result_xml_to_file(runSet.xml, runSet.xml_file_name)
-            runSet.xml_file_last_modified_time = time.monotonic()
+            header_xml = self.runs_to_xml(runSet, [], block_name)
+            header_xml.attrib.update(runSet.xml.attrib)
+            runSet.xml_journal = _ResultXmlJournal(runSet.xml_file_name, header_xml)
             self.all_created_files.add(runSet.xml_file_name)
             self.xml_file_names.append(runSet.xml_file_name)
         else:
             # make sure to never write intermediate files
-            runSet.xml_file_last_modified_time = math.inf
+            runSet.xml_journal = None
 
     def output_for_skipping_run_set(self, runSet, reason=None):
         """
@@ -569,14 +572,9 @@ class OutputHandler:
             self.txt_file.append(run.resultline + "\n", keep=False)
             self.statistics.add_result(run)
 
-            # we don't want to write this file to often, it can slow down the whole script,
-            # so we wait at least 10 seconds between two write-actions
-            currentTime = time.monotonic()
-            if currentTime - run.runSet.xml_file_last_modified_time > 60:
-                self._write_rough_result_xml_to_file(
-                    run.runSet.xml, run.runSet.xml_file_name
-                )
-                run.runSet.xml_file_last_modified_time = time.monotonic()
+            # append result to intermediate file such that it does not get lost
+            if run.runSet.xml_journal:
+                run.runSet.xml_journal.append(run.xml)
 
         finally:
             OutputHandler.print_lock.release()
@@ -585,15 +583,23 @@ class OutputHandler:
             log_file_path = os.path.relpath(
                 run.log_file, os.path.join(self.benchmark.log_folder, os.pardir)
             )
-            with self.log_zip_lock:
-                self.log_zip.write(run.log_file, log_file_path)
-            os.remove(run.log_file)
+            self.log_zip_writer.submit(
+                self._move_log_file_to_zip, run.log_file, log_file_path
+            )
         else:
             self.all_created_files.add(run.log_file)
 
         if os.path.isdir(run.result_files_folder):
             self.all_created_files.add(run.result_files_folder)
 
+    def _move_log_file_to_zip(self, log_file, log_file_path):
+        try:
+            self.log_zip.write(log_file, log_file_path)
+            os.remove(log_file)
+        except Exception:
+            # exceptions would otherwise be silently ignored by the executor
+            logging.exception("Could not add log file %s to ZIP file.", log_file)
+
     def output_after_run_set(
         self, runSet, cputime=None, walltime=None, energy={}, cache={}, end_time=None
     ):
@@ -611,6 +617,8 @@ class OutputHandler:
 
         # Write results to files. This overwrites the intermediate files written
         # from output_after_run with the proper results.
+        if runSet.xml_journal:
+            runSet.xml_journal.close()
         if self.results_per_rundefinition or not self.results_per_taskset:
             self._write_pretty_result_xml_to_file(runSet.xml, runSet.xml_file_name)
 
@@ -870,14 +878,15 @@ class OutputHandler:
         self.txt_file.close()
 
         if self.compress_results:
-            with self.log_zip_lock:
-                zip_is_empty = not self.log_zip.namelist()
-                self.log_zip.close()
+            # wait until all pending log files are written
+            self.log_zip_writer.shutdown(wait=True)
+            zip_is_empty = not self.log_zip.namelist()
+            self.log_zip.close()
 
-                if zip_is_empty:
-                    # remove useless ZIP file, e.g., because all runs were skipped
-                    os.remove(self.benchmark.log_zip)
-                    self.all_created_files.remove(self.benchmark.log_zip)
+            if zip_is_empty:
+                # remove useless ZIP file, e.g., because all runs were skipped
+                os.remove(self.benchmark.log_zip)
+                self.all_created_files.remove(self.benchmark.log_zip)
 
         # remove useless log folder if it is empty,
         # e.g., because all logs were written to the ZIP file
@@ -906,27 +915,11 @@ class OutputHandler:
         fileName = fileName.removeprefix(runSet.common_prefix)
         return fileName.ljust(runSet.max_length_of_filename + 4)
 
-    def _write_rough_result_xml_to_file(self, xml, filename):
-        """Write a rough string version of the XML (for temporary files)."""
-        # Write content to temp file first
-        error = xml.get("error", None)
-        xml.set("error", "incomplete")  # Mark result file as incomplete
-        temp_filename = filename + ".tmp"
-        with open(temp_filename, "wb") as file:
-            ElementTree.ElementTree(xml).write(
-                file, encoding="utf-8", xml_declaration=True
-            )
-        os.replace(temp_filename, filename)
-        if error is not None:
-            xml.set("error", error)
-        else:
-            del xml.attrib["error"]
-
     def _write_pretty_result_xml_to_file(self, xml, filename):
         """Writes a nicely formatted XML file with DOCTYPE, and compressed if necessary."""
         if self.compress_results:
             actual_filename = filename + ".bz2"
-            open_func = bz2.BZ2File
+            open_func = _ParallelBZ2File
         else:
             # write content to temp file first to prevent losing data
             # in existing file if writing fails
@@ -936,15 +929,13 @@ class OutputHandler:
         with io.TextIOWrapper(
             open_func(actual_filename, "wb"), encoding="utf-8"
         ) as file:
-            rough_string = ElementTree.tostring(xml, encoding="unicode")
-            reparsed = minidom.parseString(rough_string)
-            doctype = minidom.DOMImplementation().createDocumentType(
-                "result", RESULT_XML_PUBLIC_ID, RESULT_XML_SYSTEM_ID
-            )
-            reparsed.insertBefore(doctype, reparsed.documentElement)
-            reparsed.writexml(
-                file, indent="", addindent="  ", newl="\n", encoding="utf-8"
+            file.write('<?xml version="1.0" encoding="utf-8"?>\n')
+            file.write(
+                f"<!DOCTYPE result\n"
+                f"  PUBLIC '{RESULT_XML_PUBLIC_ID}'\n"
+                f"  '{RESULT_XML_SYSTEM_ID}'>\n"
             )
+            _write_pretty_xml(xml, file)
 
         if self.compress_results:
             # try to delete uncompressed file (would have been overwritten in no-compress-mode)
@@ -961,6 +952,136 @@ class OutputHandler:
         return filename
 
 
+_BZ2_CHUNK_SIZE = 900 * 1000  # block size of bzip2 with the default compresslevel
+
+
+class _ParallelBZ2File(io.BufferedIOBase):
+    """
+    A write-only replacement for bz2.BZ2File that compresses with all CPU cores.
+    The content is split into chunks that are compressed independently of each other
+    and written as a sequence of bzip2 streams.
+    This is still a regular bzip2 file that can be read by bzip2 and bz2.BZ2File.
+    """
+
+    def __init__(self, filename, mode="wb"):
+        assert mode == "wb"
+        self._file = open(filename, "wb")  # noqa: SIM115
+        self._buffer = bytearray()
+        self._pending_chunks = collections.deque()
+        workers = os.cpu_count() or 1
+        self._max_pending_chunks = 2 * workers  # limits memory usage
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="BZ2Compressor"
+        )
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        self._buffer += data
+        while len(self._buffer) >= _BZ2_CHUNK_SIZE:
+            self._compress_chunk(bytes(self._buffer[:_BZ2_CHUNK_SIZE]))
+            del self._buffer[:_BZ2_CHUNK_SIZE]
+        return len(data)
+
+    def _compress_chunk(self, chunk):
+        # bz2.compress releases the GIL, so chunks are compressed in parallel
+        self._pending_chunks.append(self._executor.submit(bz2.compress, chunk))
+        while len(self._pending_chunks) > self._max_pending_chunks:
+            self._file.write(self._pending_chunks.popleft().result())
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._compress_chunk(bytes(self._buffer))
+            while self._pending_chunks:
+                self._file.write(self._pending_chunks.popleft().result())
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._file.close()
+            super().close()
+
+
+_XML_TEXT_ENTITIES = {'"': "&quot;"}
+_XML_ATTRIBUTE_ENTITIES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+
+
+def _write_pretty_xml(elem, file, indent=""):
+    """
+    Write the given XML element with all its children to the given file,
+    nicely indented with one element per line.
+    This is streamed directly into the file without creating further copies
+    of the XML tree, and the format is the same as that of minidom.writexml().
+    """
+    file.write(indent)
+    file.write("<")
+    file.write(elem.tag)
+    for key, value in elem.items():
+        file.write(f' {key}="{escape(value, _XML_ATTRIBUTE_ENTITIES)}"')
+
+    if len(elem):
+        file.write(">\n")
+        child_indent = indent + "  "
+        if elem.text:
+            file.write(f"{child_indent}{escape(elem.text, _XML_TEXT_ENTITIES)}\n")
+        for child in elem:
+            _write_pretty_xml(child, file, child_indent)
+            if child.tail:
+                file.write(f"{child_indent}{escape(child.tail, _XML_TEXT_ENTITIES)}\n")
+        file.write(f"{indent}</{elem.tag}>\n")
+    elif elem.text:
+        file.write(f">{escape(elem.text, _XML_TEXT_ENTITIES)}</{elem.tag}>\n")
+    else:
+        file.write("/>\n")
+
+
+class _ResultXmlJournal:
+    """
+    Intermediate result file for a run set, to which the result of each run
+    is appended as soon as it is available, such that results are not lost
+    if benchexec is killed.
+    Thus the file contains only finished runs, in the order of their completion.
+    The file is kept well-formed after each run by overwriting
+    the closing tag of the root element, so the cost for each run is constant.
+    """
+
+    def __init__(self, filename, header_xml):
+        # Mark result file as incomplete
+        header_xml.set("error", "incomplete")
+        content = ElementTree.tostring(
+            header_xml, encoding="unicode", short_empty_elements=False
+        )
+        closing_tag = f"</{header_xml.tag}>"
+        assert content.endswith(closing_tag)
+        content = content[: -len(closing_tag)]
+        self._closing_tag = (closing_tag + "\n").encode()
+
+        self._file = open(filename, "wb")  # noqa: SIM115
+        self._file.write(b"<?xml version='1.0' encoding='utf-8'?>\n")
+        self._file.write(content.encode())
+        self._file.write(b"\n")
+        self._end_of_runs = self._file.tell()
+        self._write_closing_tag()
+
+    def _write_closing_tag(self):
+        self._file.write(self._closing_tag)
+        self._file.flush()
+
+    def append(self, run_xml):
+        self._file.seek(self._end_of_runs)
+        ElementTree.ElementTree(run_xml).write(self._file, encoding="utf-8")
+        self._file.write(b"\n")
+        self._end_of_runs = self._file.tell()
+        self._write_closing_tag()
+
+    def close(self):
+        self._file.close()
+
+
 class Statistics:
     def __init__(self):
         self.dic = collections.defaultdict(int)
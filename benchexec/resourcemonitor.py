@@ -0,0 +1,153 @@
+# This file is part of BenchExec, a framework for reliable benchmarking:
+# https://github.com/sosy-lab/benchexec
+#
+# SPDX-FileCopyrightText: 2007-2025 Dirk Beyer <https://www.sosy-lab.org>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import heapq
+import itertools
+import logging
+import os
+import selectors
+import threading
+import time
+
+
+class ResourceMonitor(threading.Thread):
+    """
+    A single thread that executes the checks of resource limits for all runs
+    that are executed by this process, instead of one thread per run and limit.
+    Checks are registered as callbacks that are executed at a given point in time
+    or whenever a file descriptor (e.g., an eventfd from the kernel) is readable.
+    All callbacks are executed within the monitor thread,
+    so they need to return quickly and must not block.
+
+    Use get_instance() to get the shared instance of this class.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """Return the (already started) monitor that is shared within this process."""
+        with cls._instance_lock:
+            if cls._instance is None or not cls._instance.is_alive():
+                cls._instance = cls()
+                cls._instance.start()
+            return cls._instance
+
+    def __init__(self):
+        super().__init__(name="ResourceMonitor", daemon=True)
+        self._lock = threading.Lock()
+        self._timers = []  # heap of _Timer instances
+        self._timer_ids = itertools.count()
+
+        self._selector = selectors.DefaultSelector()
+        # The pipe is used for waking up the monitor if a new timer is registered.
+        self._wakeup_read, self._wakeup_write = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+        self._selector.register(self._wakeup_read, selectors.EVENT_READ)
+
+    def call_at(self, deadline, callback):
+        """
+        Execute the given function in the monitor thread
+        as soon as time.monotonic() reaches the given deadline.
+        @return a handle with a cancel() method
+        """
+        timer = _Timer(deadline, next(self._timer_ids), callback)
+        with self._lock:
+            heapq.heappush(self._timers, timer)
+            is_first = self._timers[0] is timer
+        if is_first:
+            self._wakeup()
+        return timer
+
+    def call_soon(self, callback):
+        """Execute the given function in the monitor thread as soon as possible."""
+        return self.call_at(time.monotonic(), callback)
+
+    def add_reader(self, fd, callback):
+        """
+        Execute the given function in the monitor thread
+        whenever the given file descriptor is readable.
+        The file descriptor is owned by the monitor afterwards
+        and will be closed by remove_reader().
+        """
+        self.call_soon(
+            lambda: self._selector.register(fd, selectors.EVENT_READ, callback)
+        )
+
+    def remove_reader(self, fd):
+        """
+        Stop watching the given file descriptor and close it.
+        This happens asynchronously in the monitor thread,
+        such that the file descriptor is never closed while it is being used.
+        """
+
+        def remove():
+            self._selector.unregister(fd)
+            os.close(fd)
+
+        self.call_soon(remove)
+
+    def _wakeup(self):
+        try:
+            os.write(self._wakeup_write, b"\0")
+        except BlockingIOError:
+            pass  # pipe is full, so monitor will wake up anyway
+
+    def _next_timeout(self):
+        with self._lock:
+            while self._timers and self._timers[0].cancelled:
+                heapq.heappop(self._timers)
+            if not self._timers:
+                return None
+            return max(0, self._timers[0].deadline - time.monotonic())
+
+    def run(self):
+        while True:
+            for key, _events in self._selector.select(self._next_timeout()):
+                if key.fd == self._wakeup_read:
+                    try:
+                        while os.read(self._wakeup_read, 4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                else:
+                    _run_callback(key.data)
+
+            now = time.monotonic()
+            due_timers = []
+            with self._lock:
+                while self._timers and self._timers[0].deadline <= now:
+                    due_timers.append(heapq.heappop(self._timers))
+            for timer in due_timers:
+                if not timer.cancelled:
+                    _run_callback(timer.callback)
+
+
+def _run_callback(callback):
+    try:
+        callback()
+    except Exception:
+        # The monitor thread must never die, otherwise limits are no longer enforced
+        logging.exception("Exception in resource monitor.")
+
+
+class _Timer:
+    """A callback that is registered for a specific time in a ResourceMonitor."""
+
+    __slots__ = ("_id", "callback", "cancelled", "deadline")
+
+    def __init__(self, deadline, timer_id, callback):
+        self.deadline = deadline
+        self._id = timer_id
+        self.callback = callback
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.deadline, self._id) < (other.deadline, other._id)
+
+    def cancel(self):
+        self.cancelled = True
@@ -7,13 +7,16 @@
 
 import argparse
 import collections
+import contextlib
 import datetime
 import decimal
+import json
 import logging
 import multiprocessing
 import os
 import shlex
 import signal
+import socketserver
 import subprocess
 import sys
 import tempfile
@@ -28,18 +31,21 @@ from benchexec import (
     containerexecutor,
     intel_cpu_energy,
     oomhandler,
+    resourcemonitor,
     resources,
     systeminfo,
     util,
 )
 from benchexec.cgroups import Cgroups
-from benchexec.filehierarchylimit import FileHierarchyLimitThread
+from benchexec.filehierarchylimit import FileHierarchyLimit
 from benchexec.util import print_decimal
 
 sys.dont_write_bytecode = True  # prevent creation of .pyc files
 
 _WALLTIME_LIMIT_DEFAULT_OVERHEAD = 30  # seconds more than cputime limit
 _BYTE_FACTOR = 1000  # byte in kilobyte
+_MIN_TIMELIMIT_CHECK_INTERVAL = 0.1  # seconds
+_CGROUP_EMPTY_TIMEOUT = 1  # seconds to wait for all processes of a run to be gone
 _LOG_SHRINK_MARKER = "\n\n\nWARNING: YOUR LOGFILE WAS TOO LONG, SOME LINES IN THE MIDDLE WERE REMOVED.\n\n\n\n"
 
 
@@ -177,9 +183,46 @@ def main(argv=None):
         help="working directory for executing the command (default is current directory)",
     )
 
-    baseexecutor.add_basic_executor_options(parser)
+    service_args = parser.add_argument_group("optional arguments for service mode")
+    service_args.add_argument(
+        "--serve",
+        metavar="SOCKET",
+        help="do not execute a single command but listen on a Unix socket at the "
+        "given path for run requests in JSON format (cf. doc/runexec.md)",
+    )
+
+    baseexecutor.add_basic_executor_options(parser, args_required=False)
 
     options = parser.parse_args(argv[1:])
+    if options.serve:
+        if options.args:
+            parser.error("A command line to run cannot be given together with --serve.")
+        run_options = [
+            "timelimit",
+            "softtimelimit",
+            "walltimelimit",
+            "cores",
+            "memoryNodes",
+            "memlimit",
+            "input",
+            "maxOutputSize",
+            "filesCountLimit",
+            "filesSizeLimit",
+            "dir",
+        ]
+        for run_option in run_options:
+            if getattr(options, run_option) is not None:
+                parser.error(
+                    f"--{run_option} cannot be used together with --serve, "
+                    f"it needs to be given in each run request."
+                )
+        if options.result_files:
+            parser.error(
+                "--result-files cannot be used together with --serve, "
+                "it needs to be given in each run request."
+            )
+    elif not options.args:
+        parser.error("the following arguments are required: ARG")
     baseexecutor.handle_basic_executor_options(options)
     logging.debug("This is runexec %s.", __version__)
 
@@ -229,12 +272,17 @@ def main(argv=None):
             cgroup_values[(subsystem, option)] = value
             cgroup_subsystems.add(subsystem)
 
-        executor = RunExecutor(
-            cleanup_temp_dir=options.cleanup,
-            additional_cgroup_subsystems=list(cgroup_subsystems),
-            use_namespaces=options.container,
+        executor_options = {
+            "cleanup_temp_dir": options.cleanup,
+            "additional_cgroup_subsystems": list(cgroup_subsystems),
+            "use_namespaces": options.container,
             **container_options,
-        )
+        }
+        if options.serve:
+            _serve(options.serve, executor_options, cgroup_values)
+            return
+
+        executor = RunExecutor(**executor_options)
 
         # Ensure that process gets killed on interrupt/kill signal,
         # and avoid KeyboardInterrupt because it could occur anywhere.
@@ -314,6 +362,315 @@ def main(argv=None):
         print(f"{energy_key}={energy_value}J")
 
 
+# Keys of run requests for runexec --serve that correspond directly to parameters of
+# RunExecutor.execute_run(): request key -> (parameter name, parser for strings)
+_RUN_REQUEST_PARAMETERS = {
+    "timelimit": ("hardtimelimit", util.parse_timespan_value),
+    "softtimelimit": ("softtimelimit", util.parse_timespan_value),
+    "walltimelimit": ("walltimelimit", util.parse_timespan_value),
+    "memlimit": ("memlimit", util.parse_memory_value),
+    "cores": ("cores", util.parse_int_list),
+    "memoryNodes": ("memory_nodes", util.parse_int_list),
+    "dir": ("workingDir", None),
+    "maxOutputSize": ("maxLogfileSize", util.parse_memory_value),
+    "filesCountLimit": ("files_count_limit", int),
+    "filesSizeLimit": ("files_size_limit", util.parse_memory_value),
+}
+
+
+def _serve(socket_path, executor_options, cgroup_values):
+    """
+    Listen on a Unix socket for run requests and execute them until interrupted.
+    @param socket_path: the path where the socket should be created
+    @param executor_options: kwargs for creating RunExecutor instances
+    @param cgroup_values: additional cgroup values to set for all runs
+    """
+    if os.path.lexists(socket_path):
+        sys.exit(f"Cannot listen on {socket_path}, file already exists.")
+
+    try:
+        server = _RunExecutorServer(socket_path, executor_options, cgroup_values)
+    except OSError as e:
+        sys.exit(f"Cannot listen on {socket_path}: {e.strerror}")
+
+    # The signal handler runs on the main thread, which might hold locks of the server
+    # at this time, so it only sets a flag.
+    stop_requested = False
+
+    def signal_handler_stop(signum, frame):
+        nonlocal stop_requested
+        stop_requested = True
+
+    signal.signal(signal.SIGTERM, signal_handler_stop)
+    signal.signal(signal.SIGQUIT, signal_handler_stop)
+    signal.signal(signal.SIGINT, signal_handler_stop)
+
+    logging.info("Waiting for run requests on %s", shlex.quote(socket_path))
+    try:
+        while not stop_requested:
+            server.handle_request()
+    finally:
+        server.stop_runs()
+        server.server_close()
+        server.wait_for_runs()
+        os.remove(socket_path)
+
+
+class _RunExecutorServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Server for runexec --serve.
+    Clients send run requests as JSON objects (one per line)
+    and receive a JSON object with the result of each run (one per line)
+    as soon as the run has finished.
+    All requests are executed concurrently, even those of the same connection,
+    so results may be sent in a different order than the requests.
+    """
+
+    # Connection threads may block while reading from clients,
+    # we explicitly wait only for the runs when shutting down.
+    daemon_threads = True
+
+    # how often handle_request() returns for checking whether we should stop
+    timeout = 0.5
+
+    def __init__(self, socket_path, executor_options, cgroup_values):
+        self._executor_options = executor_options
+        self._cgroup_values = cgroup_values
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._active_runs = 0
+        self._runs_finished = threading.Condition(self._lock)
+        self._cores_in_use = set()
+        # RunExecutor does not support concurrent runs, so we use one instance per
+        # concurrent run and keep them for later runs. Creating the first instance
+        # immediately ensures that problems with cgroups etc. are reported on startup.
+        self._executors = [RunExecutor(**executor_options)]
+        self._idle_executors = list(self._executors)
+
+        super().__init__(socket_path, _RunRequestHandler, bind_and_activate=False)
+        try:
+            self.server_bind()
+            # Everybody who can connect may execute commands as our user.
+            # Connecting is not possible before server_activate() calls listen().
+            os.chmod(socket_path, 0o600)
+            self.server_activate()
+        except BaseException:
+            self.server_close()
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            raise
+
+    def start_run(self, line, send_response):
+        """Start a thread that executes the given request and sends its result."""
+        thread = threading.Thread(
+            target=self._handle_run_request, args=(line, send_response)
+        )
+        with self._lock:
+            self._active_runs += 1
+        try:
+            thread.start()
+        except BaseException:
+            self._run_finished()
+            raise
+
+    def _run_finished(self):
+        with self._lock:
+            self._active_runs -= 1
+            self._runs_finished.notify_all()
+
+    def _handle_run_request(self, line, send_response):
+        try:
+            send_response(self._execute_request(line))
+        finally:
+            self._run_finished()
+
+    def _execute_request(self, line):
+        """Execute the given request and return the response for it."""
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise TypeError("Run request needs to be a JSON object.")
+            request_id = request.pop("id", None)
+            response = {"result": self._execute_run(request)}
+        except SystemExit as e:
+            # RunExecutor reports invalid parameters with sys.exit()
+            response = {"error": str(e.code)}
+        except (OSError, TypeError, ValueError) as e:
+            response = {"error": str(e)}
+        except Exception as e:
+            logging.exception("Unexpected error during execution of run request")
+            response = {"error": str(e)}
+        if request_id is not None:
+            response["id"] = request_id
+        return response
+
+    def _execute_run(self, request):
+        run_kwargs = _parse_run_request(
+            request, self._executor_options.get("use_namespaces", True)
+        )
+        input_file = request.get("input")
+        cores = run_kwargs.get("cores")
+        with (
+            open(input_file, "rt") if input_file else contextlib.nullcontext() as stdin
+        ):
+            executor = self._acquire_executor(cores)
+            try:
+                logging.info("Starting command %s", shlex.join(run_kwargs["args"]))
+                result = executor.execute_run(
+                    stdin=stdin, cgroupValues=self._cgroup_values, **run_kwargs
+                )
+            finally:
+                with self._lock:
+                    self._cores_in_use.difference_update(cores or [])
+                    self._idle_executors.append(executor)
+        return _result_to_json(result)
+
+    def _acquire_executor(self, cores):
+        with self._lock:
+            if self._stopped:
+                raise ValueError("runexec is shutting down.")
+            if cores:
+                used_cores = self._cores_in_use.intersection(cores)
+                if used_cores:
+                    raise ValueError(
+                        f"Cores {sorted(used_cores)} are already used by another run."
+                    )
+            self._cores_in_use.update(cores or [])
+            if self._idle_executors:
+                return self._idle_executors.pop()
+
+        # Creating an executor takes a while, other requests should not wait for it.
+        try:
+            executor = RunExecutor(**self._executor_options)
+        except BaseException:
+            with self._lock:
+                self._cores_in_use.difference_update(cores or [])
+            raise
+        with self._lock:
+            self._executors.append(executor)
+            if self._stopped:
+                # stop_runs() was called meanwhile and did not see this executor
+                self._cores_in_use.difference_update(cores or [])
+                self._idle_executors.append(executor)
+                raise ValueError("runexec is shutting down.")
+        return executor
+
+    def stop_runs(self):
+        """Kill all current runs and reject further requests."""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            for executor in self._executors:
+                executor.stop()
+
+    def wait_for_runs(self):
+        with self._lock:
+            self._runs_finished.wait_for(lambda: self._active_runs == 0)
+
+
+class _RunRequestHandler(socketserver.StreamRequestHandler):
+    """Handler for a connection to runexec --serve, which may send several requests."""
+
+    def handle(self):
+        lock = threading.Lock()
+        runs_finished = threading.Condition(lock)
+        active_runs = 0
+
+        def send_response(response):
+            nonlocal active_runs
+            try:
+                data = json.dumps(response).encode() + b"\n"
+                with lock:
+                    try:
+                        self.wfile.write(data)
+                    except OSError as e:
+                        logging.warning("Could not send result of run to client: %s", e)
+            finally:
+                with lock:
+                    active_runs -= 1
+                    runs_finished.notify_all()
+
+        for line in self.rfile:
+            if line.strip():
+                with lock:
+                    active_runs += 1
+                try:
+                    self.server.start_run(line, send_response)
+                except Exception as e:
+                    logging.warning("Could not start run: %s", e)
+                    send_response({"error": f"Could not start run: {e}"})
+
+        with lock:
+            runs_finished.wait_for(lambda: active_runs == 0)
+
+
+def _parse_run_request(request, use_namespaces):
+    """
+    Convert a run request for runexec --serve into kwargs for execute_run().
+    The request may use the same values as the respective command-line parameters.
+    """
+    request = dict(request)
+    args = request.pop("args", None)
+    if not (
+        isinstance(args, list) and args and all(isinstance(arg, str) for arg in args)
+    ):
+        raise TypeError('Run request needs "args" with a non-empty list of strings.')
+    output = request.pop("output", None)
+    if not isinstance(output, str):
+        raise TypeError('Run request needs "output" with the name of the output file.')
+    run_kwargs = {"args": args, "output_filename": output}
+    request.pop("input", None)
+
+    result_files = request.pop("resultFiles", None)
+    output_dir = request.pop("outputDirectory", None)
+    if result_files is not None or output_dir is not None:
+        if not use_namespaces:
+            raise ValueError("Result files are only supported in container mode.")
+        if not isinstance(result_files, list) or not isinstance(output_dir, str):
+            raise ValueError(
+                'Run request needs "resultFiles" with a list of patterns '
+                'together with "outputDirectory".'
+            )
+        result_files_patterns = [os.path.normpath(p) for p in result_files if p]
+        for pattern in result_files_patterns:
+            if pattern.startswith(".."):
+                raise ValueError(f"Invalid relative result-files pattern '{pattern}'.")
+        run_kwargs["output_dir"] = output_dir
+        run_kwargs["result_files_patterns"] = result_files_patterns
+
+    for key, value in request.items():
+        if key not in _RUN_REQUEST_PARAMETERS:
+            raise ValueError(f'Unknown key "{key}" in run request.')
+        parameter, parse_fn = _RUN_REQUEST_PARAMETERS[key]
+        if isinstance(value, str) and parse_fn:
+            value = parse_fn(value)
+        run_kwargs[parameter] = value
+    return run_kwargs
+
+
+def _result_to_json(result):
+    """
+    Convert a result of execute_run() into a dict that can be serialized as JSON,
+    with the same keys and units as the output of runexec.
+    """
+    result = dict(result)
+    exit_code = result.pop("exitcode", None)
+    if exit_code is not None and exit_code.value is not None:
+        result["returnvalue"] = exit_code.value
+    if exit_code is not None and exit_code.signal is not None:
+        result["exitsignal"] = exit_code.signal
+    energy = intel_cpu_energy.format_energy_results(result.pop("cpuenergy", None))
+    result.update(energy)
+    for key, value in result.items():
+        if isinstance(value, decimal.Decimal):
+            result[key] = float(value)
+        elif isinstance(value, datetime.datetime):
+            result[key] = value.isoformat()
+    return result
+
+
 class RunExecutor(containerexecutor.ContainerExecutor):
     # --- object initialization ---
 
@@ -544,8 +901,8 @@ class RunExecutor(containerexecutor.ContainerExecutor):
         @return None or the time-limit handler for calling cancel()
         """
         if any([hardtimelimit, softtimelimit, walltimelimit]):
-            # Start a timer to periodically check timelimit
-            timelimitThread = _TimelimitThread(
+            # Let the shared monitor check the timelimit
+            timelimit_watch = _TimelimitWatch(
                 cgroups=cgroups,
                 hardtimelimit=hardtimelimit,
                 softtimelimit=softtimelimit,
@@ -554,11 +911,11 @@ class RunExecutor(containerexecutor.ContainerExecutor):
                 cores=cores,
                 callbackFn=self._set_termination_reason,
             )
-            timelimitThread.start()
-            return timelimitThread
+            timelimit_watch.start()
+            return timelimit_watch
         return None
 
-    def _setup_cgroup_memory_limit_thread(self, memlimit, cgroups, pid_to_kill):
+    def _setup_cgroup_memory_limit_handler(self, memlimit, cgroups, pid_to_kill):
         """Start memory-limit handler.
         @return None or the memory-limit handler for calling cancel()
         """
@@ -566,16 +923,16 @@ class RunExecutor(containerexecutor.ContainerExecutor):
         # and we can detect OOMs reliably after the fact. So no need to do anything.
         if memlimit is not None and cgroups.version == 1:
             try:
-                oomThread = oomhandler.KillProcessOnOomThread(
+                oom_handler = oomhandler.KillProcessOnOom(
                     cgroups=cgroups,
                     pid_to_kill=pid_to_kill,
                     callbackFn=self._set_termination_reason,
                 )
-                oomThread.start()
-                return oomThread
+                oom_handler.start()
+                return oom_handler
             except OSError as e:
                 logging.critical(
-                    "OSError %s during setup of OomEventListenerThread: %s.",
+                    "OSError %s during setup of OOM handler: %s.",
                     e.errno,
                     e.strerror,
                 )
@@ -584,17 +941,17 @@ class RunExecutor(containerexecutor.ContainerExecutor):
     def _setup_file_hierarchy_limit(
         self, files_count_limit, files_size_limit, temp_dir, cgroups, pid_to_kill
     ):
-        """Start thread that enforces any file-hiearchy limits."""
+        """Start handler that enforces any file-hiearchy limits."""
         if files_count_limit is not None or files_size_limit is not None:
-            file_hierarchy_limit_thread = FileHierarchyLimitThread(
+            file_hierarchy_limit = FileHierarchyLimit(
                 self._get_result_files_base(temp_dir),
                 files_count_limit=files_count_limit,
                 files_size_limit=files_size_limit,
                 pid_to_kill=pid_to_kill,
                 callbackFn=self._set_termination_reason,
             )
-            file_hierarchy_limit_thread.start()
-            return file_hierarchy_limit_thread
+            file_hierarchy_limit.start()
+            return file_hierarchy_limit
         return None
 
     # --- run execution ---
@@ -803,9 +1160,9 @@ class RunExecutor(containerexecutor.ContainerExecutor):
         This method executes the command line and waits for the termination of it,
         handling all setup and cleanup, but does not check whether arguments are valid.
         """
-        timelimitThread = None
-        oomThread = None
-        file_hierarchy_limit_thread = None
+        timelimit_watch = None
+        oom_handler = None
+        file_hierarchy_limit = None
 
         if self._energy_measurement is not None:
             # Calculate which packages we should use for energy measurements
@@ -855,22 +1212,18 @@ class RunExecutor(containerexecutor.ContainerExecutor):
             # For a similar reason, we cancel all limits. Otherwise a run could have
             # terminationreason=walltime because copying output files took a long time.
             # Can be removed if #433 gets implemented properly.
-            if timelimitThread:
-                timelimitThread.cancel()
-            if oomThread:
-                oomThread.cancel()
-            if file_hierarchy_limit_thread:
-                file_hierarchy_limit_thread.cancel()
+            if timelimit_watch:
+                timelimit_watch.cancel()
+            if oom_handler:
+                oom_handler.cancel()
+            if file_hierarchy_limit:
+                file_hierarchy_limit.cancel()
 
             if exit_code.value not in [0, 1]:
                 _get_debug_output_after_crash(output_filename, base_path)
 
             return starttime, walltime, energy
 
-        def preSubprocess():
-            """Setup that is executed in the forked process before the actual tool is started."""
-            os.setpgrp()  # make subprocess to group-leader
-
         # preparations that are not time critical
         cgroups = self._setup_cgroups(cores, memlimit, memory_nodes, cgroup_values)
         temp_dir = tempfile.mkdtemp(prefix="BenchExec_run_")
@@ -910,7 +1263,8 @@ class RunExecutor(containerexecutor.ContainerExecutor):
                 memory_nodes=memory_nodes,
                 cgroups=cgroups,
                 parent_setup_fn=preParent,
-                child_setup_fn=preSubprocess,
+                # make subprocess to group-leader (needs to be picklable for zygote)
+                child_setup_fn=os.setpgrp,
                 parent_cleanup_fn=postParent,
                 **kwargs,
             )
@@ -918,7 +1272,7 @@ class RunExecutor(containerexecutor.ContainerExecutor):
             with self.SUB_PROCESS_PIDS_LOCK:
                 self.SUB_PROCESS_PIDS.add(tool_pid)
 
-            timelimitThread = self._setup_cgroup_time_limit(
+            timelimit_watch = self._setup_cgroup_time_limit(
                 hardtimelimit,
                 softtimelimit,
                 walltimelimit,
@@ -926,10 +1280,10 @@ class RunExecutor(containerexecutor.ContainerExecutor):
                 cores,
                 tool_pid,
             )
-            oomThread = self._setup_cgroup_memory_limit_thread(
+            oom_handler = self._setup_cgroup_memory_limit_handler(
                 memlimit, tool_cgroups, tool_pid
             )
-            file_hierarchy_limit_thread = self._setup_file_hierarchy_limit(
+            file_hierarchy_limit = self._setup_file_hierarchy_limit(
                 files_count_limit, files_size_limit, temp_dir, tool_cgroups, tool_pid
             )
 
@@ -945,14 +1299,14 @@ class RunExecutor(containerexecutor.ContainerExecutor):
             with self.SUB_PROCESS_PIDS_LOCK:
                 self.SUB_PROCESS_PIDS.discard(tool_pid)
 
-            if timelimitThread:
-                timelimitThread.cancel()
+            if timelimit_watch:
+                timelimit_watch.cancel()
 
-            if oomThread:
-                oomThread.cancel()
+            if oom_handler:
+                oom_handler.cancel()
 
-            if file_hierarchy_limit_thread:
-                file_hierarchy_limit_thread.cancel()
+            if file_hierarchy_limit:
+                file_hierarchy_limit.cancel()
 
             # Make sure to kill all processes if there are still some
             # (needs to come early to avoid accumulating more CPU time)
@@ -973,13 +1327,6 @@ class RunExecutor(containerexecutor.ContainerExecutor):
 
             self._cleanup_temp_dir(temp_dir)
 
-            if timelimitThread:
-                _try_join_cancelled_thread(timelimitThread)
-            if oomThread:
-                _try_join_cancelled_thread(oomThread)
-            if file_hierarchy_limit_thread:
-                _try_join_cancelled_thread(file_hierarchy_limit_thread)
-
             if self._energy_measurement:
                 self._energy_measurement.stop()
 
@@ -1047,10 +1394,17 @@ class RunExecutor(containerexecutor.ContainerExecutor):
             # and continue reading as long as the values differ.
             # This has never happened except when interrupting the script with Ctrl+C,
             # but just try to be on the safe side here.
+            # If the kernel tells us that all processes are gone (cgroups v2),
+            # the values are final except for the last scheduler slices of the
+            # exiting processes, so a much shorter delay is enough.
+            if cgroups.wait_until_empty(timeout=_CGROUP_EMPTY_TIMEOUT):
+                delay = 0.001
+            else:
+                delay = 0.1
             tmp = cgroups.read_cputime()
             tmp2 = None
             while tmp != tmp2:
-                time.sleep(0.1)
+                time.sleep(delay)
                 tmp2 = tmp
                 tmp = cgroups.read_cputime()
             cputime_cgroups = tmp
@@ -1178,21 +1532,12 @@ def _get_debug_output_after_crash(output_filename, base_path):
         )
 
 
-def _try_join_cancelled_thread(thread):
-    """Join a thread, but if the thread doesn't terminate for some time, ignore it
-    instead of waiting infinitely."""
-    thread.join(10)
-    if thread.is_alive():
-        logging.warning(
-            "Thread %s did not terminate within grace period after cancellation",
-            thread.name,
-        )
-
-
-class _TimelimitThread(threading.Thread):
+class _TimelimitWatch:
     """
-    Thread that periodically checks whether the given process has already
-    reached its timelimit. After this happens, the process is terminated.
+    Checks whether the given process has already reached its timelimit,
+    and terminates the process after this happens.
+    The checks are executed by the shared ResourceMonitor
+    and scheduled for the earliest point in time at which a limit can be reached.
     """
 
     def __init__(
@@ -1205,9 +1550,9 @@ class _TimelimitThread(threading.Thread):
         cores,
         callbackFn=lambda reason: None,
     ):
-        super().__init__()
-        self.name = "TimelimitThread-" + self.name
-        self.finished = threading.Event()
+        self._lock = threading.Lock()
+        self._finished = False
+        self._timer = None
 
         if hardtimelimit or softtimelimit:
             assert cgroups.CPU in cgroups
@@ -1228,62 +1573,84 @@ class _TimelimitThread(threading.Thread):
         self.latestKillTime = time.monotonic() + walltimelimit
         self.pid_to_kill = pid_to_kill
         self.callback = callbackFn
+        self._monitor = resourcemonitor.ResourceMonitor.get_instance()
 
-    def read_cputime(self):
-        while True:
+    def start(self):
+        with self._lock:
+            self._timer = self._monitor.call_at(time.monotonic(), self._check)
+
+    def _check(self):
+        with self._lock:
+            if self._finished:
+                return
             try:
-                return self.cgroups.read_cputime()
+                next_check = self._check_limits()
             except ValueError:
                 # Sometimes the kernel produces strange values with linebreaks in them
-                time.sleep(1)
-
-    def run(self):
-        while not self.finished.is_set():
-            usedCpuTime = self.read_cputime() if self.cgroups.CPU in self.cgroups else 0
-            remainingCpuTime = self.timelimit - usedCpuTime
-            remainingSoftCpuTime = self.softtimelimit - usedCpuTime
-            remainingWallTime = self.latestKillTime - time.monotonic()
-            logging.debug(
-                "TimelimitThread for process %s: used CPU time: %s, remaining CPU time: %s, "
-                "remaining soft CPU time: %s, remaining wall time: %s.",
-                self.pid_to_kill,
-                usedCpuTime,
-                remainingCpuTime,
-                remainingSoftCpuTime,
-                remainingWallTime,
-            )
-            if remainingCpuTime <= 0:
-                self.callback("cputime")
-                logging.debug(
-                    "Killing process %s due to CPU time timeout.", self.pid_to_kill
-                )
-                util.kill_process(self.pid_to_kill)
-                self.finished.set()
-                return
-            if remainingWallTime <= 0:
-                self.callback("walltime")
-                logging.warning(
-                    "Killing process %s due to wall time timeout.", self.pid_to_kill
+                next_check = 1
+            if next_check is None:
+                self._finished = True
+            else:
+                self._timer = self._monitor.call_at(
+                    time.monotonic() + next_check, self._check
                 )
-                util.kill_process(self.pid_to_kill)
-                self.finished.set()
-                return
-
-            if remainingSoftCpuTime <= 0:
-                self.callback("cputime-soft")
-                # soft time limit violated, ask process to terminate
-                util.kill_process(self.pid_to_kill, signal.SIGTERM)
-                self.softtimelimit = self.timelimit
 
-            remainingTime = min(
-                remainingCpuTime / self.cpuCount,
-                remainingSoftCpuTime / self.cpuCount,
-                remainingWallTime,
+    def _check_limits(self):
+        """
+        Check the limits and kill the process if necessary.
+        @return None if the process was killed, otherwise the seconds until the next check
+        """
+        usedCpuTime = (
+            self.cgroups.read_cputime() if self.cgroups.CPU in self.cgroups else 0
+        )
+        remainingCpuTime = self.timelimit - usedCpuTime
+        remainingSoftCpuTime = self.softtimelimit - usedCpuTime
+        remainingWallTime = self.latestKillTime - time.monotonic()
+        logging.debug(
+            "Time limit for process %s: used CPU time: %s, remaining CPU time: %s, "
+            "remaining soft CPU time: %s, remaining wall time: %s.",
+            self.pid_to_kill,
+            usedCpuTime,
+            remainingCpuTime,
+            remainingSoftCpuTime,
+            remainingWallTime,
+        )
+        if remainingCpuTime <= 0:
+            self.callback("cputime")
+            logging.debug(
+                "Killing process %s due to CPU time timeout.", self.pid_to_kill
             )
-            self.finished.wait(remainingTime + 1)
+            util.kill_process(self.pid_to_kill)
+            return None
+        if remainingWallTime <= 0:
+            self.callback("walltime")
+            logging.warning(
+                "Killing process %s due to wall time timeout.", self.pid_to_kill
+            )
+            util.kill_process(self.pid_to_kill)
+            return None
+
+        if remainingSoftCpuTime <= 0:
+            self.callback("cputime-soft")
+            # soft time limit violated, ask process to terminate
+            util.kill_process(self.pid_to_kill, signal.SIGTERM)
+            self.softtimelimit = self.timelimit
+            remainingSoftCpuTime = remainingCpuTime
+
+        # The process cannot use more CPU time than cpuCount seconds per second,
+        # so no limit can be reached before this time.
+        remainingTime = min(
+            remainingCpuTime / self.cpuCount,
+            remainingSoftCpuTime / self.cpuCount,
+            remainingWallTime,
+        )
+        return max(remainingTime, _MIN_TIMELIMIT_CHECK_INTERVAL)
 
     def cancel(self):
-        self.finished.set()
+        with self._lock:
+            self._finished = True
+            if self._timer:
+                self._timer.cancel()
 
 
 if __name__ == "__main__":
@@ -8,18 +8,23 @@
 import argparse
 import bz2
 import collections
+import contextlib
 import copy
 import functools
 import gzip
 import io
 import itertools
 import logging
+import mmap
 import os.path
+import pickle
 import platform
 import re
 import signal
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 import types
 import typing
@@ -31,7 +36,13 @@ from xml.etree import ElementTree
 
 import benchexec.util
 from benchexec import BenchExecException, __version__, model, result, tooladapter
-from benchexec.tablegenerator import htmltable, statistics, statisticstex, util
+from benchexec.tablegenerator import (
+    htmltable,
+    resultcache,
+    statistics,
+    statisticstex,
+    util,
+)
 from benchexec.tablegenerator.columns import Column
 from benchexec.tablegenerator.util import TaskId
 
@@ -56,6 +67,9 @@ MAIN_COLUMNS = [
 
 NAME_START = "results"  # first part of filename of table
 
+# Number of runs for which values are read from log files in one parallel task
+_LOGFILE_CHUNK_SIZE = 500
+
 DEFAULT_OUTPUT_PATH = "results"
 
 # All available formats
@@ -117,6 +131,7 @@ def load_results_from_table_definition(
 ) -> "Iterator[RunSetResult | None]":
     """
     Load all results in files that are listed in the given table-definition file.
+    Reading of log files is deferred, call finish_loading_results() afterwards.
     @return: a list of RunSetResult objects
     """
     default_columns = extract_columns_from_table_definition_file(
@@ -143,6 +158,7 @@ def load_results_from_table_definition(
                         run_set_id,
                         columns,
                         columns_relevant_for_diff,
+                        defer_logfiles=True,
                     )
                 )
 
@@ -199,7 +215,7 @@ def handle_union_tag(
     name = tag.get("title", name)
     if name:
         result.attributes["name"] = [name]
-    result.collect_data(options.correct_only)
+    result.collect_data(options.correct_only, defer_logfiles=True)
     return result
 
 
@@ -220,6 +236,7 @@ def load_results_with_table_definition(
 ) -> "Iterator[RunSetResult | None]":
     """
     Load results from given files with column definitions taken from a table-definition file.
+    Reading of log files is deferred, call finish_loading_results() afterwards.
     @return: a list of RunSetResult objects
     """
     columns = extract_columns_from_table_definition_file(
@@ -300,40 +317,6 @@ def load_tool(result):
     """
     Load the module with the tool-specific code.
     """
-
-    def load_tool_module(tool_module):
-        if not tool_module:
-            logging.warning(
-                "Cannot extract values from log files for benchmark results %s "
-                '(missing attribute "toolmodule" on tag "result").',
-                util.prettylist(result.attributes["name"]),
-            )
-            return None
-        try:
-            logging.debug("Loading %s", tool_module)
-            tool = __import__(tool_module, fromlist=["Tool"]).Tool()
-            return tooladapter.adapt_to_current_version(tool)
-        except ImportError as ie:
-            logging.warning(
-                'Missing module "%s", cannot extract values from log files (ImportError: %s).',
-                tool_module,
-                ie,
-            )
-        except AttributeError:
-            logging.warning(
-                'The module "%s" does not define the necessary class Tool, '
-                "cannot extract values from log files.",
-                tool_module,
-            )
-        except TypeError as te:
-            logging.warning(
-                'Unsupported module "%s", cannot extract values from log files '
-                "(TypeError: %s).",
-                tool_module,
-                te,
-            )
-        return None
-
     tool_module = (
         result.attributes["toolmodule"][0]
         if "toolmodule" in result.attributes
@@ -341,10 +324,45 @@ def load_tool(result):
     )
     if tool_module in loaded_tools:
         return loaded_tools[tool_module]
+
+    if tool_module:
+        loaded_tool = _load_tool_module(tool_module)
     else:
-        loaded_tool = load_tool_module(tool_module)
-        loaded_tools[tool_module] = loaded_tool
-        return loaded_tool
+        logging.warning(
+            "Cannot extract values from log files for benchmark results %s "
+            '(missing attribute "toolmodule" on tag "result").',
+            util.prettylist(result.attributes["name"]),
+        )
+        loaded_tool = None
+    loaded_tools[tool_module] = loaded_tool
+    return loaded_tool
+
+
+def _load_tool_module(tool_module):
+    try:
+        logging.debug("Loading %s", tool_module)
+        tool = __import__(tool_module, fromlist=["Tool"]).Tool()
+        return tooladapter.adapt_to_current_version(tool)
+    except ImportError as ie:
+        logging.warning(
+            'Missing module "%s", cannot extract values from log files (ImportError: %s).',
+            tool_module,
+            ie,
+        )
+    except AttributeError:
+        logging.warning(
+            'The module "%s" does not define the necessary class Tool, '
+            "cannot extract values from log files.",
+            tool_module,
+        )
+    except TypeError as te:
+        logging.warning(
+            'Unsupported module "%s", cannot extract values from log files '
+            "(TypeError: %s).",
+            tool_module,
+            te,
+        )
+    return None
 
 
 class RunSetResult:
@@ -382,7 +400,7 @@ class RunSetResult:
         Append the result for one run. Needs to be called before collect_data().
         """
         self._xml_results += [
-            (result, resultFile) for result in _get_run_tags_from_xml(resultElem)
+            (result, None, resultFile) for result in _get_run_tags_from_xml(resultElem)
         ]
         for attrib, values in RunSetResult._extract_attributes_from_result(
             resultFile, resultElem
@@ -394,10 +412,12 @@ class RunSetResult:
                 resultFile, resultElem, all_columns
             )
 
-    def collect_data(self, correct_only):
+    def collect_data(self, correct_only, defer_logfiles=False):
         """
         Load the actual result values from the XML file and the log files.
         This may take some time if many log files have to be opened and parsed.
+        With defer_logfiles, the log files are not read here,
+        and collect_logfile_values() needs to be called afterwards.
         """
         self.results = []
 
@@ -409,43 +429,45 @@ class RunSetResult:
             if len(set(versions)) == 1 and versions[0]:
                 self.attributes["version_url"] = [tool.url_for_version(versions[0])]
 
-        def get_value_from_logfile(lines, identifier):
-            """
-            This method searches for values in lines of the content.
-            It uses a tool-specific method to so.
-            """
-            if not tool:
-                return None
-            output = tooladapter.CURRENT_BASETOOL.RunOutput(lines)
-            return tool.get_value_from_output(output, identifier)
-
-        # Opening the ZIP archive with the logs for every run is too slow, we cache it.
-        log_zip_cache = {}
+        # list of pairs of RunResult and indices of values to read from log file
+        self._pending_logfile_values = []
         task_set = set()
-        try:
-            for xml_result, result_file in self._xml_results:
-                run_result = RunResult.create_from_xml(
-                    xml_result,
-                    get_value_from_logfile,
-                    self.columns,
-                    correct_only,
-                    log_zip_cache,
-                    self.columns_relevant_for_diff,
-                    result_file,
+        # Consume the XML elements in order and release each of them immediately,
+        # such that the XML tree and the results do not need to be in memory together.
+        # _xml_results can also be an iterator that parses the XML file incrementally.
+        xml_results = self._xml_results
+        del self._xml_results
+        if isinstance(xml_results, list):
+            xml_results = _pop_all(xml_results)
+        for xml_result, column_values, result_file in xml_results:
+            run_result = RunResult.create_from_xml(
+                xml_result,
+                self.columns,
+                correct_only,
+                self.columns_relevant_for_diff,
+                result_file,
+                column_values,
+            )
+            task = run_result.task_id
+            # Make sure to keep results free of duplicates
+            if task in task_set:
+                logging.warning(
+                    "Task %s is present twice in '%s', skipping it.", task, self
                 )
-                task = run_result.task_id
-                # Make sure to keep results free of duplicates
-                if task in task_set:
-                    logging.warning(
-                        "Task %s is present twice in '%s', skipping it.", task, self
-                    )
-                else:
-                    self.results.append(run_result)
-                    task_set.add(task)
-        finally:
-            for file in log_zip_cache.values():
-                file.close()
+            else:
+                self.results.append(run_result)
+                task_set.add(task)
+
+                logfile_columns = _get_logfile_columns(
+                    self.columns, correct_only, run_result.category
+                )
+                if tool and logfile_columns:
+                    self._pending_logfile_values.append((run_result, logfile_columns))
 
+        if not defer_logfiles:
+            collect_logfile_values([self])
+
+    def _set_column_types(self):
         for column in self.columns:
             column_values = (
                 run_result.values[run_result.columns.index(column)]
@@ -453,8 +475,6 @@ class RunSetResult:
             )
             column.set_column_type_from(column_values)
 
-        del self._xml_results
-
     def __str__(self):
         return util.prettylist(self.attributes["filename"])
 
@@ -486,7 +506,10 @@ class RunSetResult:
         summary = RunSetResult._extract_summary_from_result(resultElem, columns)
 
         return RunSetResult(
-            [(result, resultFile) for result in _get_run_tags_from_xml(resultElem)],
+            [
+                (result, None, resultFile)
+                for result in _get_run_tags_from_xml(resultElem)
+            ],
             attributes,
             columns,
             summary,
@@ -501,24 +524,10 @@ class RunSetResult:
             # completely empty results break stuff, add at least status column
             return [MAIN_COLUMNS[0]]
         else:  # show all available columns
-            column_names = {
-                c.get("title")
-                for s in run_results
-                for c in s.findall("column")
-                if all_columns or c.get("hidden") != "true"
-            }
-
-            if not column_names:
-                # completely empty results break stuff, add at least status column
-                return [MAIN_COLUMNS[0]]
-
-            # Put main columns first, then rest sorted alphabetically
-            custom_columns = column_names.difference(
-                column.title for column in MAIN_COLUMNS
-            )
-            return [
-                column for column in MAIN_COLUMNS if column.title in column_names
-            ] + [Column(title) for title in sorted(custom_columns)]
+            column_names = set()
+            for run_result in run_results:
+                _add_column_names_of_run(column_names, run_result, all_columns)
+            return _get_columns_with_names(column_names)
 
     @staticmethod
     def _extract_attributes_from_result(resultFile, resultTag):
@@ -569,6 +578,42 @@ class RunSetResult:
         return summary
 
 
+def _add_column_names_of_run(column_names, run_tag, all_columns):
+    column_names.update(
+        c.get("title")
+        for c in run_tag.findall("column")
+        if all_columns or c.get("hidden") != "true"
+    )
+
+
+def _get_columns_with_names(column_names):
+    if not column_names:
+        # completely empty results break stuff, add at least status column
+        return [MAIN_COLUMNS[0]]
+
+    # Put main columns first, then rest sorted alphabetically
+    custom_columns = column_names.difference(column.title for column in MAIN_COLUMNS)
+    return [column for column in MAIN_COLUMNS if column.title in column_names] + [
+        Column(title) for title in sorted(custom_columns)
+    ]
+
+
+def _pop_all(items):
+    """Iterate over a list and remove the items from it."""
+    items.reverse()
+    while items:
+        yield items.pop()
+
+
+def _get_column_values(run_tag):
+    """Return the values of the column tags of a run tag as a dict."""
+    column_values = {}
+    for column in run_tag.findall("column"):
+        # if a title occurs more than once, the first column is used
+        column_values.setdefault(column.get("title"), column.get("value"))
+    return column_values
+
+
 def _get_run_tags_from_xml(result_elem):
     # Here we keep support for <sourcefile> in order to be able to read old benchmark
     # results (no reason to forbid this).
@@ -582,7 +627,10 @@ def load_results(
     columns=None,
     columns_relevant_for_diff=set(),
 ) -> "Iterator[RunSetResult | None]":
-    """Version of load_result for multiple input files that will be loaded concurrently."""
+    """
+    Version of load_result for multiple input files that will be loaded concurrently.
+    Reading of log files is deferred, call finish_loading_results() afterwards.
+    """
     return parallel.map(
         load_result,
         result_files,
@@ -590,11 +638,17 @@ def load_results(
         itertools.repeat(run_set_id),
         itertools.repeat(columns),
         itertools.repeat(columns_relevant_for_diff),
+        itertools.repeat(True),
     )
 
 
 def load_result(
-    result_file, options, run_set_id=None, columns=None, columns_relevant_for_diff=set()
+    result_file,
+    options,
+    run_set_id=None,
+    columns=None,
+    columns_relevant_for_diff=set(),
+    defer_logfiles=False,
 ) -> "RunSetResult | None":
     """
     Completely handle loading a single result file.
@@ -604,23 +658,317 @@ def load_result(
     @param columns the list of columns
     @param columns_relevant_for_diff a set of columns that is relevant for
                                      the diff table
-    @return a fully ready RunSetResult instance or None
+    @param defer_logfiles whether reading the log files should be left
+                          to a later call to finish_loading_results()
+    @return a RunSetResult instance (fully ready unless defer_logfiles is set) or None
     """
-    xml = parse_results_file(
-        result_file, run_set_id=run_set_id, ignore_errors=options.ignore_errors
+    if options.stream:
+        return _load_result_streamed(
+            result_file, options, run_set_id, columns, columns_relevant_for_diff
+        )
+
+    cache_key = None
+    content = None
+    if options.cache_dir:
+        # The content is needed for the key and then reused for loading,
+        # such that remote files are not downloaded twice.
+        try:
+            with util.open_url_seekable(util.make_url(result_file), "rb") as f:
+                content = f.read()
+        except OSError:
+            pass  # error is reported when loading the file below
+        else:
+            cache_key = resultcache.get_key(
+                result_file,
+                content,
+                options,
+                run_set_id,
+                columns,
+                columns_relevant_for_diff,
+            )
+        if cache_key:
+            result = resultcache.load(options.cache_dir, cache_key)
+            if result is not None:
+                logging.info("    %s (cached)", result_file)
+                return result
+
+    result = _load_result_incrementally(
+        result_file, options, run_set_id, columns, columns_relevant_for_diff, content
     )
-    if xml is None:
+    if result is None:
         return None
 
-    result = RunSetResult.create_from_xml(
+    result.collect_data(options.correct_only, defer_logfiles)
+    if cache_key:
+        if defer_logfiles:
+            result._cache_key = cache_key  # result is cached when it is complete
+        else:
+            resultcache.store(options.cache_dir, cache_key, result)
+    return result
+
+
+def _iterparse_results_file(result_file, content=None):
+    """
+    Parse a result file incrementally, such that it does not need to be kept
+    in memory completely. The first element that is returned is a copy of the
+    root element with its attributes, to which all other top-level tags
+    (e.g., systeminfo and summary columns) are added once they were parsed.
+    Afterwards, each run tag is returned and removed from the tree.
+    """
+    try:
+        with (
+            io.BytesIO(content)
+            if content is not None
+            else util.open_url_seekable(util.make_url(result_file), mode="rb")
+        ) as f:
+            magic = f.read(3)
+            f.seek(0)
+            if magic[:2] == b"\x1f\x8b":
+                f = gzip.GzipFile(fileobj=f)
+            elif magic == b"BZh":
+                f = bz2.BZ2File(f)
+
+            root = None
+            root_copy = None
+            depth = 0
+            events = ElementTree.iterparse(f, events=("start", "end"))  # noqa: S314
+            for event, elem in events:
+                if event == "start":
+                    depth += 1
+                    if root is None:
+                        root = elem
+                        # the parser may have already added some children to root
+                        root_copy = ElementTree.Element(root.tag, root.attrib)
+                        yield root_copy
+                    continue
+
+                depth -= 1
+                if depth == 1:
+                    root.remove(elem)
+                    if elem.tag in ["run", "sourcefile"]:
+                        yield elem
+                    else:
+                        root_copy.append(elem)
+    except OSError as e:
+        handle_error("Could not read result file %s: %s", result_file, e)
+    except ElementTree.ParseError as e:
+        handle_error("Result file %s is invalid: %s", result_file, e)
+
+
+def _load_result_incrementally(
+    result_file, options, run_set_id, columns, columns_relevant_for_diff, content=None
+) -> "RunSetResult | None":
+    """
+    Parse a single result file without building the complete XML tree
+    and return a RunSetResult for it that still needs collect_data().
+    If the content of the file is given, the file is not read again.
+    If the columns are given, the run tags are parsed only while collect_data()
+    consumes them, otherwise they need to be kept until all column names are known,
+    but only with the parts that are relevant for the table.
+    """
+    logging.info("    %s", result_file)
+    runs = _iterparse_results_file(result_file, content)
+    root = next(runs)
+    if not _check_result_tag(result_file, root, options.ignore_errors):
+        return None
+    log_folder = _get_log_folder(result_file, root)
+
+    def prepare_run_tag(run, column_values=None):
+        if run_set_id is not None:
+            run.set("runset", run_set_id)
+        _insert_logfile_name(result_file, log_folder, run)
+        return run, column_values, result_file
+
+    attributes = RunSetResult._extract_attributes_from_result(result_file, root)
+    summary = collections.defaultdict(list)
+    if columns:
+
+        def xml_results():
+            yield from map(prepare_run_tag, runs)
+            # Only now all other tags like summary columns have been parsed.
+            attributes.update(
+                RunSetResult._extract_attributes_from_result(result_file, root)
+            )
+            summary.update(RunSetResult._extract_summary_from_result(root, columns))
+
+        xml_results = xml_results()
+    else:
+        column_names = set()
+        xml_results = []
+        for run in runs:
+            _add_column_names_of_run(column_names, run, options.all_columns)
+            column_values = _take_column_values(run)
+            xml_results.append(prepare_run_tag(run, column_values))
+        if not xml_results:
+            logging.warning("Result file '%s' is empty.", result_file)
+        columns = _get_columns_with_names(column_names)
+        attributes = RunSetResult._extract_attributes_from_result(result_file, root)
+        summary = RunSetResult._extract_summary_from_result(root, columns)
+
+    return RunSetResult(
+        xml_results,
+        attributes,
+        columns,
+        summary,
+        columns_relevant_for_diff,
+    )
+
+
+def _take_column_values(run):
+    """
+    Remove all children from a run tag and return the values of its columns
+    as a dict, which needs much less memory if the run needs to be kept for a while.
+    All columns are kept, because a column that is hidden in this run
+    might still be shown in the table if it is not hidden in other runs.
+    """
+    column_values = {}
+    for column in run.findall("column"):
+        # column titles are repeated for every run
+        column_values.setdefault(sys.intern(column.get("title")), column.get("value"))
+    del run[:]
+    run.text = None
+    return column_values
+
+
+def _load_result_streamed(
+    result_file, options, run_set_id, columns, columns_relevant_for_diff
+) -> "RunSetResult | None":
+    """
+    Load a single result file for --stream with bounded memory:
+    Instead of keeping the RunResult instances in memory, the values of the runs
+    are written to a temporary file whose name is stored in the attribute
+    _stream_file of the returned RunSetResult, together with a dict from task ids
+    to offsets of the runs in this file (attribute _stream_offsets).
+    The caller is responsible for deleting the temporary file.
+    """
+    logging.info("    %s", result_file)
+    runs = _iterparse_results_file(result_file)
+    root = next(runs)
+    if not _check_result_tag(result_file, root, options.ignore_errors):
+        return None
+
+    if not columns:
+        # need to read the file twice, first for finding out which columns exist
+        column_names = set()
+        has_runs = False
+        for run in runs:
+            has_runs = True
+            _add_column_names_of_run(column_names, run, options.all_columns)
+        if not has_runs:
+            logging.warning("Result file '%s' is empty.", result_file)
+        columns = _get_columns_with_names(column_names)
+
+        runs = _iterparse_results_file(result_file)
+        root = next(runs)
+
+    run_set = RunSetResult.create_from_xml(
         result_file,
-        xml,
+        root,
         columns=columns,
-        all_columns=options.all_columns,
         columns_relevant_for_diff=columns_relevant_for_diff,
     )
-    result.collect_data(options.correct_only)
-    return result
+    del run_set._xml_results
+    tool = load_tool(run_set)
+    tool_module = run_set.attributes["toolmodule"][0] if tool else None
+    log_folder = _get_log_folder(result_file, root)
+
+    fd, run_set._stream_file = tempfile.mkstemp(
+        prefix="table-generator-", suffix=".pickle"
+    )
+    run_set._stream_offsets = offsets = {}
+    # For determining the column types, the values of each column are needed,
+    # so these are written to separate files, too.
+    column_files = [
+        tempfile.TemporaryFile()  # noqa: SIM115
+        for _ in run_set.columns
+    ]
+    try:
+        with open(fd, "wb") as stream_file:
+            # Runs are buffered until the values from their log files are read
+            buffered_runs = []
+            pending_logfile_values = []
+
+            def flush():
+                requests = [
+                    (
+                        run_result.log_file,
+                        [run_result.columns[i].pattern for i in logfile_columns],
+                    )
+                    for run_result, logfile_columns in pending_logfile_values
+                ]
+                if requests:
+                    all_values = _get_values_from_logfiles(tool_module, requests)
+                    for (run_result, logfile_columns), values in zip(
+                        pending_logfile_values, all_values
+                    ):
+                        run_result.set_values(logfile_columns, values)
+                pending_logfile_values.clear()
+
+                for run_result in buffered_runs:
+                    offsets[run_result.task_id] = stream_file.tell()
+                    pickle.dump((run_result.task_id, run_result.values), stream_file)
+                    for value, column_file in zip(run_result.values, column_files):
+                        pickle.dump(value, column_file)
+                buffered_runs.clear()
+
+            for run in runs:
+                if run_set_id is not None:
+                    run.set("runset", run_set_id)
+                _insert_logfile_name(result_file, log_folder, run)
+                run_result = RunResult.create_from_xml(
+                    run,
+                    run_set.columns,
+                    options.correct_only,
+                    columns_relevant_for_diff,
+                    result_file,
+                )
+                task = run_result.task_id
+                # Make sure to keep results free of duplicates
+                if task in offsets:
+                    logging.warning(
+                        "Task %s is present twice in '%s', skipping it.",
+                        task,
+                        run_set,
+                    )
+                    continue
+
+                offsets[task] = None  # real offset is set when writing the run
+                buffered_runs.append(run_result)
+                logfile_columns = _get_logfile_columns(
+                    run_set.columns, options.correct_only, run_result.category
+                )
+                if tool and logfile_columns:
+                    pending_logfile_values.append((run_result, logfile_columns))
+                if len(buffered_runs) >= _LOGFILE_CHUNK_SIZE:
+                    flush()
+            flush()
+
+        for column, column_file in zip(run_set.columns, column_files):
+            column_file.seek(0)
+            column.set_column_type_from(
+                pickle.load(column_file) for _ in range(len(offsets))
+            )
+    except BaseException:
+        os.remove(run_set._stream_file)
+        raise
+    finally:
+        for column_file in column_files:
+            column_file.close()
+
+    return run_set
+
+
+def finish_loading_results(run_set_results, options):
+    """
+    Complete loading the given RunSetResult instances that were loaded
+    with defer_logfiles=True by reading their log files in parallel.
+    """
+    collect_logfile_values(run_set_results)
+    for run_set_result in run_set_results:
+        cache_key = getattr(run_set_result, "_cache_key", None)
+        if cache_key:
+            del run_set_result._cache_key
+            resultcache.store(options.cache_dir, cache_key, run_set_result)
 
 
 def parse_results_file(resultFile, run_set_id=None, ignore_errors=False):
@@ -650,6 +998,22 @@ def parse_results_file(resultFile, run_set_id=None, ignore_errors=False):
     except ElementTree.ParseError as e:
         handle_error("Result file %s is invalid: %s", resultFile, e)
 
+    if not _check_result_tag(resultFile, resultElem, ignore_errors):
+        return None
+
+    if run_set_id is not None:
+        for sourcefile in _get_run_tags_from_xml(resultElem):
+            sourcefile.set("runset", run_set_id)
+
+    insert_logfile_names(resultFile, resultElem)
+    return resultElem
+
+
+def _check_result_tag(resultFile, resultElem, ignore_errors):
+    """
+    Check the root tag of a result file.
+    @return False if the file should be ignored
+    """
     if resultElem.tag not in ["result", "test"]:
         handle_error(
             f"XML file '{resultFile}' with benchmark results seems to be invalid.\n"
@@ -664,17 +1028,17 @@ def parse_results_file(resultFile, run_set_id=None, ignore_errors=False):
             resultFile,
             resultElem.attrib["error"],
         )
-        return None
+        return False
+    return True
 
-    if run_set_id is not None:
-        for sourcefile in _get_run_tags_from_xml(resultElem):
-            sourcefile.set("runset", run_set_id)
 
-    insert_logfile_names(resultFile, resultElem)
-    return resultElem
+def insert_logfile_names(resultFile, resultElem):
+    log_folder = _get_log_folder(resultFile, resultElem)
+    for sourcefile in _get_run_tags_from_xml(resultElem):
+        _insert_logfile_name(resultFile, log_folder, sourcefile)
 
 
-def insert_logfile_names(resultFile, resultElem):
+def _get_log_folder(resultFile, resultElem):
     # get folder of logfiles (truncate end of XML file name and append .logfiles instead)
     log_folder = resultFile[0 : resultFile.rfind(".results.")] + ".logfiles/"
 
@@ -690,14 +1054,211 @@ def insert_logfile_names(resultFile, resultElem):
             assert runSetName.endswith("." + blockname)
             runSetName = runSetName[: -(1 + len(blockname))]  # remove last chars
             log_folder += runSetName + "."
+    return log_folder
 
-    # for each file: append original filename and insert log_file_name into sourcefileElement
-    for sourcefile in _get_run_tags_from_xml(resultElem):
-        if "logfile" in sourcefile.attrib:
-            log_file = urllib.parse.urljoin(resultFile, sourcefile.get("logfile"))
+
+def _insert_logfile_name(resultFile, log_folder, sourcefile):
+    # append original filename and insert log_file_name into sourcefileElement
+    if "logfile" in sourcefile.attrib:
+        log_file = urllib.parse.urljoin(resultFile, sourcefile.get("logfile"))
+    else:
+        log_file = f"{log_folder}{os.path.basename(sourcefile.get('name'))}.log"
+    sourcefile.set("logfile", log_file)
+
+
+def _get_logfile_columns(columns, correct_only, category):
+    """Return the indices of the columns whose values are read from the log file."""
+    if correct_only and category != result.CATEGORY_CORRECT:
+        return []
+    return [
+        i
+        for i, column in enumerate(columns)
+        if column.pattern and not column.href and column.title.lower() != "status"
+    ]
+
+
+def collect_logfile_values(run_set_results):
+    """
+    Finish loading the given RunSetResult instances by reading the values
+    from the log files that were deferred by collect_data().
+    Log files are read in parallel in chunks of runs,
+    such that even a single large result file makes use of all cores.
+    """
+    chunks = []
+    for run_set_result in run_set_results:
+        if not hasattr(run_set_result, "_pending_logfile_values"):
+            continue  # already complete, e.g., loaded from cache
+        pending = run_set_result._pending_logfile_values
+        tool_module = run_set_result.attributes["toolmodule"][0] if pending else None
+        for start in range(0, len(pending), _LOGFILE_CHUNK_SIZE):
+            chunk = pending[start : start + _LOGFILE_CHUNK_SIZE]
+            requests = [
+                (
+                    run_result.log_file,
+                    [run_result.columns[i].pattern for i in logfile_columns],
+                )
+                for run_result, logfile_columns in chunk
+            ]
+            chunks.append(
+                (
+                    chunk,
+                    parallel.submit(_get_values_from_logfiles, tool_module, requests),
+                )
+            )
+
+    for chunk, future in chunks:
+        for (run_result, logfile_columns), values in zip(chunk, future.result()):
+            run_result.set_values(logfile_columns, values)
+
+    for run_set_result in run_set_results:
+        if hasattr(run_set_result, "_pending_logfile_values"):
+            del run_set_result._pending_logfile_values
+            run_set_result._set_column_types()
+
+
+def _get_values_from_logfiles(tool_module, requests):
+    """
+    Extract values from log files with the given tool-info module.
+    @param requests: a list of pairs of log file and list of identifiers
+    @return a list with the list of values for each request
+    """
+    if tool_module not in loaded_tools:
+        loaded_tools[tool_module] = _load_tool_module(tool_module)
+    tool = loaded_tools[tool_module]
+
+    # Opening the ZIP archive with the logs for every run is too slow, we cache it.
+    log_zip_cache = {}
+    try:
+        all_values = []
+        for log_file, identifiers in requests:
+            with contextlib.closing(
+                _LazyRunOutput(_open_logfile(log_file, log_zip_cache))
+            ) as output:
+                all_values.append(tool.get_values_from_output(output, identifiers))
+        return all_values
+    finally:
+        for file in log_zip_cache.values():
+            file.close()
+
+
+class _LazyRunOutput(tooladapter.CURRENT_BASETOOL.RunOutput):
+    """
+    RunOutput that reads the lines from a text stream only when they are accessed.
+    Thus a log file does not need to be read (and decompressed) completely
+    if the tool-info module finds all values in the first lines.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream  # None after everything was read
+        self._lines_read = []
+        self._text = None
+
+    def _read_line(self):
+        """Read the next line into _lines_read and return whether there was one."""
+        line = self._stream.readline() if self._stream else ""
+        if line:
+            self._lines_read.append(line)
+            return True
+        self.close()
+        return False
+
+    @property
+    def _lines(self):
+        # also used by tooladapter for old tool-info modules
+        while self._read_line():
+            pass
+        return self._lines_read
+
+    def any_line_contains(self, substr):
+        assert "\n" not in substr  # would never match
+        return any(substr in line for line in self)
+
+    def __iter__(self):
+        i = 0
+        while i < len(self._lines_read) or self._read_line():
+            yield self._lines_read[i].rstrip(os.linesep)
+            i += 1
+
+    def __getitem__(self, index):
+        if isinstance(index, int) and index >= 0:
+            while index >= len(self._lines_read) and self._read_line():
+                pass
         else:
-            log_file = f"{log_folder}{os.path.basename(sourcefile.get('name'))}.log"
-        sourcefile.set("logfile", log_file)
+            self._lines  # noqa: B018 negative indices and slices need all lines
+        if isinstance(index, slice):
+            return tooladapter.CURRENT_BASETOOL.RunOutput(self._lines_read[index])
+        return self._lines_read[index].rstrip(os.linesep)
+
+    def __len__(self):
+        return len(self._lines)
+
+    def close(self):
+        if self._stream:
+            self._stream.close()
+            self._stream = None
+
+
+def _open_logfile(log_file, log_zip_cache):
+    """
+    Open a log file, either directly or from the ZIP archive with all log files.
+    @return a text stream or None if the log file does not exist
+    """
+    if not log_file:
+        return None
+    log_file_url = util.make_url(log_file)
+    url_parts = urllib.parse.urlparse(log_file_url, allow_fragments=False)
+    log_zip_path = os.path.dirname(url_parts.path) + ".zip"
+    log_zip_url = urllib.parse.urlunparse(
+        (
+            url_parts.scheme,
+            url_parts.netloc,
+            log_zip_path,
+            url_parts.params,
+            url_parts.query,
+            url_parts.fragment,
+        )
+    )
+    path_in_zip = urllib.parse.unquote(
+        # os.path.relpath creates os-dependant paths, but windows separators can produce errors with zipfile lib
+        util.fix_path_if_on_windows(
+            os.path.relpath(url_parts.path, os.path.dirname(log_zip_path))
+        )
+    )
+    if log_zip_url.startswith("file:///") and not log_zip_path.startswith("/"):
+        # Replace file:/// with file: for relative paths,
+        # otherwise opening fails.
+        log_zip_url = "file:" + log_zip_url[8:]
+
+    try:
+        return util.open_url_seekable(log_file_url, "rt")
+    except OSError:
+        try:
+            if log_zip_url not in log_zip_cache:
+                # The ZIP archive may be large and contain many more log files,
+                # so over HTTP only the central directory and the needed files
+                # should be downloaded.
+                log_zip_cache[log_zip_url] = zipfile.ZipFile(
+                    util.open_url_random_access(log_zip_url)
+                )
+            log_zip = log_zip_cache[log_zip_url]
+
+            try:
+                return io.TextIOWrapper(log_zip.open(path_in_zip))
+            except KeyError:
+                logging.warning(
+                    "Could not find logfile '%s' in archive '%s'.",
+                    log_file,
+                    log_zip_url,
+                )
+                return None
+
+        except OSError:
+            logging.warning(
+                "Could not find logfile '%s' nor log archive '%s'.",
+                log_file,
+                log_zip_url,
+            )
+            return None
 
 
 def apply_task_list(runset_results, tasks):
@@ -708,6 +1269,12 @@ def apply_task_list(runset_results, tasks):
     """
     missing = 0
     for runset in runset_results:
+        if len(runset.results) == len(tasks) and all(
+            run_result.task_id == task
+            for run_result, task in zip(runset.results, tasks)
+        ):
+            continue  # common case, results already match tasks
+
         # create mapping from id to RunResult object
         dic = {run_result.task_id: run_result for run_result in runset.results}
         assert len(dic) == len(runset.results)
@@ -736,6 +1303,19 @@ class RunResult:
     The class RunResult contains the results of a single verification run.
     """
 
+    # There are many instances of this class, so we avoid the per-instance dict.
+    __slots__ = (
+        "category",
+        "columns",
+        "columns_relevant_for_diff",
+        "log_file",
+        "score",
+        "sourcefiles_exist",
+        "status",
+        "task_id",
+        "values",
+    )
+
     def __init__(
         self,
         task_id,
@@ -762,74 +1342,21 @@ class RunResult:
     @staticmethod
     def create_from_xml(
         sourcefileTag,
-        get_value_from_logfile,
         listOfColumns,
         correct_only,
-        log_zip_cache,
         columns_relevant_for_diff,
         result_file_or_url,
+        column_values=None,
     ):
         """
         This function collects the values from one run.
         Only columns that should be part of the table are collected.
+        Values that need to be read from the log file are left empty.
+        @param column_values: the values of the column tags of the run as a dict,
+            if they are no longer present in sourcefileTag
         """
-
-        def read_logfile_lines(log_file):
-            if not log_file:
-                return []
-            log_file_url = util.make_url(log_file)
-            url_parts = urllib.parse.urlparse(log_file_url, allow_fragments=False)
-            log_zip_path = os.path.dirname(url_parts.path) + ".zip"
-            log_zip_url = urllib.parse.urlunparse(
-                (
-                    url_parts.scheme,
-                    url_parts.netloc,
-                    log_zip_path,
-                    url_parts.params,
-                    url_parts.query,
-                    url_parts.fragment,
-                )
-            )
-            path_in_zip = urllib.parse.unquote(
-                # os.path.relpath creates os-dependant paths, but windows separators can produce errors with zipfile lib
-                util.fix_path_if_on_windows(
-                    os.path.relpath(url_parts.path, os.path.dirname(log_zip_path))
-                )
-            )
-            if log_zip_url.startswith("file:///") and not log_zip_path.startswith("/"):
-                # Replace file:/// with file: for relative paths,
-                # otherwise opening fails.
-                log_zip_url = "file:" + log_zip_url[8:]
-
-            try:
-                with util.open_url_seekable(log_file_url, "rt") as logfile:
-                    return logfile.readlines()
-            except OSError:
-                try:
-                    if log_zip_url not in log_zip_cache:
-                        log_zip_cache[log_zip_url] = zipfile.ZipFile(
-                            util.open_url_seekable(log_zip_url, "rb")
-                        )
-                    log_zip = log_zip_cache[log_zip_url]
-
-                    try:
-                        with io.TextIOWrapper(log_zip.open(path_in_zip)) as logfile:
-                            return logfile.readlines()
-                    except KeyError:
-                        logging.warning(
-                            "Could not find logfile '%s' in archive '%s'.",
-                            log_file,
-                            log_zip_url,
-                        )
-                        return []
-
-                except OSError:
-                    logging.warning(
-                        "Could not find logfile '%s' nor log archive '%s'.",
-                        log_file,
-                        log_zip_url,
-                    )
-                    return []
+        if column_values is None:
+            column_values = _get_column_values(sourcefileTag)
 
         sourcefiles = sourcefileTag.get("files")
         if sourcefiles:
@@ -851,7 +1378,7 @@ class RunResult:
             sourcefileTag.get("propertyFile"),
             sourcefileTag.get("expectedVerdict"),
         )
-        witness_category = util.get_column_value(sourcefileTag, "witness-category")
+        witness_category = column_values.get("witness-category")
         task_id = TaskId(
             task_name,
             prop,
@@ -860,8 +1387,12 @@ class RunResult:
             sourcefileTag.get("runset"),
         )
 
-        status = util.get_column_value(sourcefileTag, "status", "")
-        category = util.get_column_value(sourcefileTag, "category")
+        # There are only few distinct values for status and category,
+        # so sharing the string objects saves memory for large results.
+        status = sys.intern(column_values.get("status", ""))
+        category = column_values.get("category")
+        if category:
+            category = sys.intern(category)
         if not category:
             if status:  # only category missing
                 category = result.CATEGORY_MISSING
@@ -871,25 +1402,22 @@ class RunResult:
         score = None
         if prop:
             score = prop.compute_score(category, status, witness_category)
-        logfileLines = None
 
+        logfile_columns = set(
+            _get_logfile_columns(listOfColumns, correct_only, category)
+        )
         values = []
 
-        for column in listOfColumns:  # for all columns that should be shown
+        # for all columns that should be shown
+        for i, column in enumerate(listOfColumns):
             value = None  # default value
             if column.title.lower() == "status":
                 value = status
 
             elif not correct_only or category == result.CATEGORY_CORRECT:
-                if not column.pattern or column.href:
+                if i not in logfile_columns:
                     # collect values from XML
-                    value = util.get_column_value(sourcefileTag, column.title)
-
-                else:  # collect values from logfile
-                    if logfileLines is None:  # cache content
-                        logfileLines = read_logfile_lines(sourcefileTag.get("logfile"))
-
-                    value = get_value_from_logfile(logfileLines, column.pattern)
+                    value = column_values.get(column.title)
 
             if column.title.lower() == "score" and value is None and score is not None:
                 # If no score column exists in the xml, take the internally computed score,
@@ -909,6 +1437,17 @@ class RunResult:
             sourcefiles_exist=sourcefiles_exist,
         )
 
+    def set_values(self, indices, values):
+        """Set the values of the columns with the given indices, e.g., from the log file."""
+        for i, value in zip(indices, values):
+            if (
+                self.columns[i].title.lower() == "score"
+                and value is None
+                and self.score is not None
+            ):
+                value = str(self.score)
+            self.values[i] = value
+
 
 class Row:
     """
@@ -918,6 +1457,8 @@ class Row:
     It corresponds to one complete row in the final tables.
     """
 
+    __slots__ = ("has_sourcefile", "id", "results", "short_filename")
+
     def __init__(self, results):
         assert results
         self.results = results
@@ -1015,27 +1556,34 @@ def filter_rows_with_differences(rows):
                 return i
         assert False, f"Column '{name}' not found in columns '{cols}'"
 
+    # All results of a run set share the same list of columns,
+    # so the indices of the relevant columns need to be searched only once per run set
+    # and each result can be reduced to a tuple of its relevant values,
+    # which can be compared as a whole.
+    indices_cache = {}
+
+    def get_fingerprint(res, relevant_columns):
+        key = (id(res.columns), relevant_columns)
+        indices = indices_cache.get(key)
+        if indices is None:
+            indices = indices_cache[key] = [
+                get_index_of_column(col, res.columns) for col in relevant_columns
+            ]
+        values = res.values
+        return tuple(values[i] for i in indices)
+
     def all_equal_result(listOfResults):
         relevant_columns = set()
         for res in listOfResults:
-            for relevant_column in res.columns_relevant_for_diff:
-                relevant_columns.add(relevant_column)
-        if len(relevant_columns) == 0:
-            relevant_columns.add("status")
-
-        status = []
-        for col in relevant_columns:
-            # It's necessary to search for the index of a column every time
-            # because they can differ between results
-            status.append(
-                {
-                    res.values[get_index_of_column(col, res.columns)]
-                    for res in listOfResults
-                    if res.values
-                }
-            )
+            relevant_columns.update(res.columns_relevant_for_diff)
+        relevant_columns = tuple(sorted(relevant_columns)) or ("status",)
 
-        return functools.reduce(lambda x, y: x and (len(y) <= 1), status, True)
+        fingerprints = {
+            get_fingerprint(res, relevant_columns)
+            for res in listOfResults
+            if res.values
+        }
+        return len(fingerprints) <= 1
 
     rowsDiff = [row for row in rows if not all_equal_result(row.results)]
 
@@ -1141,11 +1689,17 @@ def select_relevant_id_columns(rows):
     Find out which of the entries in Row.id are equal for all given rows.
     @return: A list of True/False values according to whether the i-th part of the id is always equal.
     """
+    return _select_relevant_id_columns_of_tasks([row.id for row in rows])
+
+
+def _select_relevant_id_columns_of_tasks(task_ids):
     relevant_id_columns = [True]  # first column (file name) is always relevant
-    if rows:
-        prototype_id = rows[0].id
+    if task_ids:
+        prototype_id = task_ids[0]
         for column in range(1, len(prototype_id)):
-            all_equal = all(row.id[column] == prototype_id[column] for row in rows)
+            all_equal = all(
+                task_id[column] == prototype_id[column] for task_id in task_ids
+            )
             relevant_id_columns.append(not all_equal)
     return relevant_id_columns
 
@@ -1238,11 +1792,7 @@ def create_tables(
     @return a list of futures to allow waiting for completion
     """
 
-    # get common folder of sourcefiles
-    # os.path.commonprefix can return a partial path component (does not truncate on /)
-    common_prefix = os.path.commonprefix([r.id.name for r in rows])
-    separator = "/" if "://" in common_prefix else os.sep
-    common_prefix = common_prefix[: common_prefix.rfind(separator) + 1]
+    common_prefix = _get_common_folder([r.id.name for r in rows])
     for row in rows:
         Row.set_relative_path(row, common_prefix, outputPath)
 
@@ -1258,7 +1808,8 @@ def create_tables(
         options=options,
     )
 
-    futures = []
+    tables = {}
+    jobs = []
 
     def write_table(table_type, title, rows, use_summary):
         summary_data = types.SimpleNamespace(title=title, rows=rows)
@@ -1268,6 +1819,7 @@ def create_tables(
             summary_data.stats = compute_stats(
                 rows, runSetResults, use_summary, options.correct_only
             )
+        tables[table_type] = summary_data.__dict__
 
         for template_format in options.format or DEFAULT_TEMPLATE_FORMATS:
             if outputFilePattern == "-":
@@ -1287,15 +1839,7 @@ def create_tables(
                     "Writing %s into %s ...", template_format.upper().ljust(4), outfile
                 )
 
-            futures.append(
-                parallel.submit(
-                    write_table_in_format,
-                    template_format,
-                    outfile,
-                    **data.__dict__,
-                    **summary_data.__dict__,
-                )
-            )
+            jobs.append((table_type, template_format, outfile))
 
     # write normal tables
     write_table(
@@ -1311,9 +1855,170 @@ def create_tables(
     if rowsDiff:
         write_table("diff", name + " differences", rowsDiff, use_summary=False)
 
+    if isinstance(parallel, util.DummyExecutor):
+        return [
+            parallel.submit(
+                write_table_in_format,
+                template_format,
+                outfile,
+                **data.__dict__,
+                **tables[table_type],
+            )
+            for table_type, template_format, outfile in jobs
+        ]
+
+    # Instead of pickling all rows for every submitted task, we write them once
+    # into a file that all worker processes map into memory.
+    # Rows of the diff table are shared with the normal table and stored only once.
+    table_data_file = _write_shared_table_data(
+        {"data": data.__dict__, "tables": tables}
+    )
+    futures = [
+        parallel.submit(
+            _write_table_in_format_from_file,
+            table_data_file,
+            table_type,
+            template_format,
+            outfile,
+        )
+        for table_type, template_format, outfile in jobs
+    ]
+
+    pending = len(futures)
+    pending_lock = threading.Lock()
+
+    def remove_table_data_file(future):
+        nonlocal pending
+        with pending_lock:
+            pending -= 1
+            if pending:
+                return
+        os.remove(table_data_file)
+
+    for future in futures:
+        future.add_done_callback(remove_table_data_file)
     return futures
 
 
+def _write_shared_table_data(table_data):
+    """
+    Write the given data for the table writers into a temporary file
+    and return its name. The caller is responsible for deleting the file.
+    """
+    fd, table_data_file = tempfile.mkstemp(prefix="table-generator-", suffix=".pickle")
+    with open(fd, "wb") as f:
+        pickle.dump(table_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return table_data_file
+
+
+@functools.lru_cache(maxsize=1)
+def _read_shared_table_data(table_data_file):
+    """
+    Load the data written by _write_shared_table_data().
+    The result is cached such that a worker process that writes several formats
+    of the same table loads the data only once.
+    """
+    with (
+        open(table_data_file, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as table_data,
+    ):
+        return pickle.loads(table_data)
+
+
+def _write_table_in_format_from_file(
+    table_data_file, table_type, template_format, outfile
+):
+    table_data = _read_shared_table_data(table_data_file)
+    write_table_in_format(
+        template_format,
+        outfile,
+        **table_data["data"],
+        **table_data["tables"][table_type],
+    )
+
+
+def _get_common_folder(task_names):
+    # get common folder of sourcefiles
+    # os.path.commonprefix can return a partial path component (does not truncate on /)
+    common_prefix = os.path.commonprefix(task_names)
+    separator = "/" if "://" in common_prefix else os.sep
+    return common_prefix[: common_prefix.rfind(separator) + 1]
+
+
+def write_streamed_csv_table(
+    name, runSetResults, outputPath, outputFilePattern, options
+):
+    """
+    Write the CSV table for RunSetResult instances that were loaded with --stream.
+    The rows are read one by one from the files written while loading.
+    """
+    try:
+        if len(runSetResults) == 1:
+            task_list = list(runSetResults[0]._stream_offsets)
+        else:
+            task_list = util.find_common_elements(
+                r._stream_offsets for r in runSetResults
+            )
+            if not task_list:
+                logging.warning("No tasks are present in all benchmark results.")
+        if not task_list:
+            handle_error("No results found, no tables produced.")
+        logging.info(
+            "The resulting table will have %s rows and %s columns (in %s run sets).",
+            len(task_list),
+            sum(len(runset.columns) for runset in runSetResults),
+            len(runSetResults),
+        )
+
+        common_prefix = _get_common_folder([task.name for task in task_list])
+        relevant_id_columns = _select_relevant_id_columns_of_tasks(task_list)
+        format_run_set_attributes_nicely(runSetResults)
+
+        if outputFilePattern == "-":
+            outfile = None
+            logging.info("Writing CSV  to stdout...")
+        else:
+            outfile = os.path.join(
+                outputPath, outputFilePattern.format(name=name, type="table", ext="csv")
+            )
+            logging.info("Writing CSV  into %s ...", outfile)
+
+        with contextlib.ExitStack() as stack:
+            stream_files = [
+                stack.enter_context(open(r._stream_file, "rb")) for r in runSetResults
+            ]
+
+            def read_rows():
+                for task in task_list:
+                    results = []
+                    for run_set, f in zip(runSetResults, stream_files):
+                        f.seek(run_set._stream_offsets[task])
+                        _, values = pickle.load(f)
+                        results.append(
+                            types.SimpleNamespace(
+                                values=values, columns=run_set.columns
+                            )
+                        )
+                    yield types.SimpleNamespace(
+                        id=task,
+                        short_filename=task.name.replace(common_prefix, "", 1),
+                        results=results,
+                    )
+
+            write_table_in_format(
+                "csv",
+                outfile,
+                options,
+                run_sets=runSetResults,
+                rows=read_rows(),
+                common_prefix=common_prefix,
+                relevant_id_columns=relevant_id_columns,
+            )
+    finally:
+        for run_set in runSetResults:
+            os.remove(run_set._stream_file)
+
+
 def write_csv_table(
     out, run_sets, rows, common_prefix, relevant_id_columns, sep="\t", **kwargs
 ):
@@ -1464,6 +2169,12 @@ def create_argument_parser():
         dest="dump_counts",
         help="Print summary statistics for regressions and the good, bad, and unknown counts.",
     )
+    parser.add_argument(
+        "--dump-only",
+        action="store_true",
+        help="Like --dump, but do not write any tables, "
+        "which is much faster for large results.",
+    )
     parser.add_argument(
         "--ignore-flapping-timeout-regressions",
         action="store_true",
@@ -1508,6 +2219,31 @@ def create_argument_parser():
         dest="summary_row",
         help='Hide row "summary measurements" in statistics of tables.',
     )
+    parser.add_argument(
+        "--cache",
+        action="store_const",
+        const=resultcache.default_cache_dir(),
+        dest="cache_dir",
+        help="Cache loaded result files such that they do not need to be parsed "
+        "again if they are unchanged. Old cache entries are removed automatically.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        action="store",
+        type=str,
+        dest="cache_dir",
+        metavar="DIR",
+        help="Like --cache, but store the cache in the given directory "
+        "instead of the default location.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write only a CSV table and process the runs one by one, "
+        "such that memory usage stays small even for many runs. "
+        "Supported only for a single result file or together with --common. "
+        "No difference table is written.",
+    )
     parser.add_argument(
         "--show",
         action="store_true",
@@ -1598,6 +2334,16 @@ def main(args=None):
 
     setup_process(options)
 
+    if options.dump_only:
+        options.dump_counts = True
+
+    if options.stream:
+        if (options.format or ["csv"]) != ["csv"]:
+            arg_parser.error("Only CSV tables can be written with --stream.")
+        if options.dump_counts:
+            arg_parser.error("Option --stream cannot be used together with --dump.")
+        options.format = ["csv"]
+
     global parallel
     import concurrent.futures
 
@@ -1622,6 +2368,8 @@ def main(args=None):
             table_definition = parse_table_definition_file(options.xmltablefile)
 
             if table_definition_lists_result_files(table_definition):
+                if options.stream and table_definition.find("union") is not None:
+                    arg_parser.error("<union> tags are not supported with --stream.")
                 if options.tables:
                     arg_parser.error(
                         f"Invalid additional arguments '{' '.join(options.tables)}'."
@@ -1688,6 +2436,25 @@ def main(args=None):
         outputPath = "."
 
     runSetResults = [r for r in runSetResults if r is not None]
+    if options.stream:
+        if not runSetResults:
+            handle_error("No benchmark results found.")
+        if len(runSetResults) > 1 and not options.common:
+            for run_set_result in runSetResults:
+                os.remove(run_set_result._stream_file)
+            handle_error("Option --stream needs --common for several result files.")
+        if not os.path.isdir(outputPath) and outputFilePattern != "-":
+            os.makedirs(outputPath)
+        write_streamed_csv_table(
+            name, runSetResults, outputPath, outputFilePattern, options
+        )
+        logging.info("done")
+        parallel.shutdown(wait=True)
+        return
+
+    finish_loading_results(runSetResults, options)
+    if options.cache_dir:
+        resultcache.evict(options.cache_dir)
     if not runSetResults:
         handle_error("No benchmark results found.")
 
@@ -1718,14 +2485,19 @@ def main(args=None):
         )
     if not rows:
         handle_error("No results found, no tables produced.")
-    rowsDiff = filter_rows_with_differences(rows) if options.write_diff_table else []
+    if options.dump_only:
+        futures = []
+    else:
+        rowsDiff = (
+            filter_rows_with_differences(rows) if options.write_diff_table else []
+        )
 
-    logging.info("Generating table...")
-    if not os.path.isdir(outputPath) and outputFilePattern != "-":
-        os.makedirs(outputPath)
-    futures = create_tables(
-        name, runSetResults, rows, rowsDiff, outputPath, outputFilePattern, options
-    )
+        logging.info("Generating table...")
+        if not os.path.isdir(outputPath) and outputFilePattern != "-":
+            os.makedirs(outputPath)
+        futures = create_tables(
+            name, runSetResults, rows, rowsDiff, outputPath, outputFilePattern, options
+        )
 
     if options.dump_counts:  # print some stats for Buildbot
         print("REGRESSIONS", get_regression_count(rows, options.ignoreFlappingTimeouts))
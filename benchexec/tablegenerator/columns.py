@@ -48,6 +48,9 @@ POSSIBLE_FORMAT_TARGETS = [
 
 DEFAULT_NUMBER_OF_SIGNIFICANT_DIGITS = 3
 
+# Maximum number of formatted values that are cached per column
+FORMAT_CACHE_SIZE = 10000
+
 _ONE = Decimal(1)
 UNIT_CONVERSION = {
     "s": {"ms": 1000, "min": _ONE / 60, "h": _ONE / 3600},
@@ -154,6 +157,14 @@ class Column:
             # expected maximum width (in characters)
             self.max_width = None
 
+            # cache of formatted values, needs to be reset if the type changes
+            self._format_cache = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_format_cache"] = {}
+        return state
+
     def is_numeric(self):
         return (
             self.type.type == ColumnType.measure or self.type.type == ColumnType.count
@@ -185,14 +196,25 @@ class Column:
         @param format_target the target the value should be formatted for
         @return: a formatted String representation of the given value.
         """
-        with decimal.localcontext(DECIMAL_CONTEXT):
-            # Only format counts and measures
-            if (
-                self.type.type != ColumnType.count
-                and self.type.type != ColumnType.measure
-            ):
-                return value
+        # Only format counts and measures
+        if self.type.type != ColumnType.count and self.type.type != ColumnType.measure:
+            return value
+
+        # Many cells share the same values, so formatting is cached.
+        # Only strings are used as keys because equal Decimals like 1.0 and 1.00
+        # would be formatted differently.
+        if not isinstance(value, str):
+            return self._format_value(value, format_target)
+        key = (value, format_target)
+        formatted_value = self._format_cache.get(key)
+        if formatted_value is None:
+            formatted_value = self._format_value(value, format_target)
+            if len(self._format_cache) < FORMAT_CACHE_SIZE:
+                self._format_cache[key] = formatted_value
+        return formatted_value
 
+    def _format_value(self, value, format_target):
+        with decimal.localcontext(DECIMAL_CONTEXT):
             if format_target not in POSSIBLE_FORMAT_TARGETS:
                 raise ValueError("Unknown format target")
 
@@ -257,6 +279,7 @@ class Column:
         Sets the type of this column using a heuristic reading the given column_values.
         """
         column_values = list(column_values)
+        self._format_cache = {}
         values_width = 0
         try:
             result = _get_column_type_heur(self, column_values)
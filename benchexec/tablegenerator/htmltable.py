@@ -5,11 +5,14 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import base64
 import collections
 import copy
 import json
 import logging
 import os
+import zlib
+from collections.abc import Iterator
 from urllib.parse import quote as url_quote
 
 import benchexec.util
@@ -21,6 +24,9 @@ _REACT_FILES = [
     for path in ["vendors.min.", "main.min."]
 ]
 
+# Number of bytes per line of base64-encoded data (results in lines of 76 chars)
+_BASE64_LINE_BYTES = 57
+
 
 def write_html_table(
     out,
@@ -46,25 +52,17 @@ def write_html_table(
     rows_js = _prepare_rows_for_js(rows, output_path, href_base, relevant_id_columns)
     initial_state = options.initial_table_state
 
-    def write_tags(tag_name, contents):
+    def write_tags(tag_name, contents, attributes=""):
         for content in contents:
             out.write("<")
             out.write(tag_name)
+            out.write(attributes)
             out.write(">\n")
             out.write(content)
             out.write("\n</")
             out.write(tag_name)
             out.write(">\n")
 
-    def write_json_part(name, value=None, last=False):
-        out.write('  "')
-        out.write(name)
-        out.write('": ')
-        out.write(json.dumps(value, sort_keys=True))
-        if not last:
-            out.write(",")
-        out.write("\n")
-
     out.write(
         f"""<!DOCTYPE html>
 <html>
@@ -101,32 +99,98 @@ def write_html_table(
 <script>
     try {
         [0].flat();
+        new DecompressionStream("deflate");
     } catch (err) {
         var msgContainer = document.getElementById("msg-container");
         msgContainer.innerHTML = "Your browser is not supported. Please consider using another browser such as Firefox or Google Chrome."
     }
 </script>
-<script>
-const data = {
+<script type="application/octet-stream" id="data">
 """
     )
-    write_json_part("version", __version__)
-    write_json_part("head", benchmark_setup)
-    write_json_part("tools", tools)
-    write_json_part("rows", rows_js)
-    write_json_part("initial", initial_state)
-    write_json_part("stats", stats, last=True)
+    _write_compressed_json(
+        out,
+        [
+            ("version", __version__),
+            ("head", benchmark_setup),
+            ("tools", tools),
+            ("rows", rows_js),
+            ("initial", initial_state),
+            ("stats", stats),
+        ],
+    )
     out.write(
-        """};
-window.data = data;
+        """</script>
+<script>
+    // The table data is compressed JSON, the app is started once it is decoded.
+    (async function () {
+        const encoded = atob(document.getElementById("data").textContent);
+        const bytes = new Uint8Array(encoded.length);
+        for (let i = 0; i < encoded.length; i++) {
+            bytes[i] = encoded.charCodeAt(i);
+        }
+        const decompressed = new Blob([bytes])
+            .stream()
+            .pipeThrough(new DecompressionStream("deflate"));
+        window.data = JSON.parse(await new Response(decompressed).text());
+
+        for (const app of document.querySelectorAll('script[type="text/x-app"]')) {
+            const script = document.createElement("script");
+            script.textContent = app.textContent;
+            document.body.appendChild(script);
+        }
+    })();
 </script>
 
 """
     )
-    write_tags("script", app_js)
+    write_tags("script", app_js, ' type="text/x-app"')
     out.write("</body>\n</html>\n")
 
 
+def _write_compressed_json(out, parts):
+    """
+    Write a JSON object with the given (key, value) pairs to out
+    as zlib-compressed data in base64 encoding.
+    If a value is an iterator, its elements are serialized one by one as a JSON list,
+    such that the full JSON string never needs to be kept in memory.
+    """
+    compressor = zlib.compressobj()
+    pending = b""
+
+    def write_bytes(data, final=False):
+        # only full lines are encoded, the remainder is kept for the next call
+        nonlocal pending
+        pending += data
+        size = len(pending)
+        if not final:
+            size -= size % _BASE64_LINE_BYTES
+        if size:
+            out.write(base64.encodebytes(pending[:size]).decode("ascii"))
+            pending = pending[size:]
+
+    def write_json(s):
+        write_bytes(compressor.compress(s.encode()))
+
+    separator = "{"
+    for key, value in parts:
+        write_json(separator)
+        separator = ","
+        write_json(json.dumps(key))
+        write_json(":")
+        if isinstance(value, Iterator):
+            element_separator = "["
+            for element in value:
+                write_json(element_separator)
+                element_separator = ","
+                write_json(json.dumps(element, sort_keys=True))
+            write_json("[]" if element_separator == "[" else "]")
+        else:
+            write_json(json.dumps(value, sort_keys=True))
+    write_json("}")
+    write_bytes(compressor.flush(), final=True)
+
+
 def _prepare_benchmark_setup_data(
     runSetResults, commonFileNamePrefix, relevant_id_columns
 ):
@@ -389,7 +453,11 @@ def _prepare_run_sets_for_js(run_sets):
     run_set_exclude_keys = {"filename"}
 
     def prepare_column(column):
-        result = {k: v for k, v in column.__dict__.items() if v is not None}
+        result = {
+            k: v
+            for k, v in column.__dict__.items()
+            if v is not None and not k.startswith("_")
+        }
         result.pop("scale_factor", None)
         result.pop("source_unit", None)
         if "href" in result:
@@ -479,7 +547,7 @@ def _prepare_rows_for_js(rows, base_dir, href_base, relevant_id_columns):
             result["href"] = _create_link(row.id.name, base_dir)
         return result
 
-    return [clean_up_row(row) for row in rows]
+    return (clean_up_row(row) for row in rows)
 
 
 def _create_link(href, base_dir, runResult=None, href_base=None, value=None):
@@ -0,0 +1,178 @@
+# This file is part of BenchExec, a framework for reliable benchmarking:
+# https://github.com/sosy-lab/benchexec
+#
+# SPDX-FileCopyrightText: 2007-2025 Dirk Beyer <https://www.sosy-lab.org>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+On-disk cache of fully loaded result files (RunSetResult instances) for
+table-generator, such that unchanged result files do not need to be parsed again.
+
+Each cache entry is a separate file named after a hash of the content of
+the result file and of all parameters that influence how it is loaded.
+The modification time of an entry is updated whenever it is used,
+such that the least recently used entries can be deleted if the cache is too large.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import os
+import pickle
+import tempfile
+
+from benchexec import __version__
+
+# Needs to be increased whenever the pickled classes change incompatibly.
+_CACHE_FORMAT_VERSION = 3
+_CACHE_FILE_SUFFIX = ".pickle"
+
+DEFAULT_MAX_CACHE_SIZE = 1024**3  # bytes
+
+
+def default_cache_dir():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "benchexec", "table-generator")
+
+
+def get_key(
+    result_file, content, options, run_set_id, columns, columns_relevant_for_diff
+):
+    """
+    Compute the key of the cache entry for loading the given result file
+    with the given content and parameters,
+    or return None if the results should not be cached.
+    """
+    key = hashlib.sha256(content)
+
+    if columns and any(column.pattern for column in columns):
+        # values are extracted from log files, which are thus relevant as well
+        log_base = result_file[0 : result_file.rfind(".results.")]
+        if os.path.isdir(log_base + ".logfiles"):
+            # Checking all individual log files for changes would be expensive.
+            logging.debug("Not caching %s because of unpacked log files.", result_file)
+            return None
+        log_zip = log_base + ".logfiles.zip"
+        try:
+            log_zip_stat = os.stat(log_zip)
+            log_zip_version = (log_zip_stat.st_size, log_zip_stat.st_mtime_ns)
+        except OSError:
+            log_zip_version = None
+    else:
+        log_zip_version = None
+
+    parameters = (
+        _CACHE_FORMAT_VERSION,
+        __version__,
+        result_file,
+        run_set_id,
+        options.ignore_errors,
+        options.all_columns,
+        options.correct_only,
+        [
+            (
+                column.title,
+                column.pattern,
+                column.number_of_significant_digits,
+                column.href,
+                column.unit,
+                column.source_unit,
+                str(column.scale_factor),
+                column.relevant_for_diff,
+                column.display_title,
+            )
+            for column in columns or []
+        ],
+        sorted(columns_relevant_for_diff),
+        log_zip_version,
+    )
+    key.update(repr(parameters).encode())
+    return key.hexdigest()
+
+
+def _get_tool_version(run_set_result):
+    """
+    Return an identification of the current version of the tool-info module
+    that was used for loading the given results.
+    """
+    tool_module = run_set_result.attributes.get("toolmodule", [None])[0]
+    if not tool_module:
+        return None
+    try:
+        spec = importlib.util.find_spec(tool_module)
+        stat = os.stat(spec.origin)
+    except (ImportError, ValueError, AttributeError, TypeError, OSError):
+        return None
+    return (tool_module, stat.st_size, stat.st_mtime_ns)
+
+
+def load(cache_dir, key):
+    """
+    Return the cached RunSetResult for the given key,
+    or None if there is no valid cache entry.
+    """
+    cache_file = os.path.join(cache_dir, key + _CACHE_FILE_SUFFIX)
+    try:
+        with open(cache_file, "rb") as f:
+            tool_version, run_set_result = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # any kind of corrupt or outdated file should just be ignored
+        logging.debug("Ignoring invalid cache entry %s: %s", cache_file, e)
+        return None
+
+    if tool_version != _get_tool_version(run_set_result):
+        logging.debug("Ignoring cache entry %s for outdated tool module.", cache_file)
+        return None
+
+    try:
+        os.utime(cache_file)  # mark as recently used
+    except OSError:
+        pass  # just removed by concurrent eviction
+    return run_set_result
+
+
+def store(cache_dir, key, run_set_result):
+    """Store the given RunSetResult in the cache under the given key."""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_dir, suffix=".tmp", delete=False
+        ) as f:
+            pickle.dump(
+                (_get_tool_version(run_set_result), run_set_result),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        # atomic such that concurrent readers never see incomplete files
+        os.replace(f.name, os.path.join(cache_dir, key + _CACHE_FILE_SUFFIX))
+    except (OSError, pickle.PicklingError) as e:
+        logging.warning("Could not store results in cache %s: %s", cache_dir, e)
+
+
+def evict(cache_dir, max_size=DEFAULT_MAX_CACHE_SIZE):
+    """Delete the least recently used cache entries until the cache is small enough."""
+    try:
+        with os.scandir(cache_dir) as entries:
+            cache_files = [
+                (entry.stat(), entry.path)
+                for entry in entries
+                if entry.name.endswith(_CACHE_FILE_SUFFIX)
+            ]
+    except OSError:
+        return
+
+    cache_files.sort(key=lambda entry: entry[0].st_mtime_ns, reverse=True)
+    size = 0
+    for stat, path in cache_files:
+        size += stat.st_size
+        if size > max_size:
+            logging.debug("Removing old cache entry %s.", path)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
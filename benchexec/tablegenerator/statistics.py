@@ -7,7 +7,7 @@
 
 import collections
 import decimal
-import itertools
+import heapq
 from decimal import Decimal, InvalidOperation
 
 from benchexec import result
@@ -74,11 +74,15 @@ class StatValue:
 
     @classmethod
     def from_list(cls, values):
-        with decimal.localcontext(DECIMAL_CONTEXT):
-            if any(v is not None and v.is_nan() for v in values):
-                return StatValue(nan, nan, nan, nan, nan, nan)
+        if any(v is not None and v.is_nan() for v in values):
+            return StatValue(nan, nan, nan, nan, nan, nan)
+
+        return cls._from_sorted_list(sorted(v for v in values if v is not None))
 
-            values = sorted(v for v in values if v is not None)
+    @classmethod
+    def _from_sorted_list(cls, values):
+        """Like from_list, but values need to be sorted and must not be None or NaN."""
+        with decimal.localcontext(DECIMAL_CONTEXT):
             if not values:
                 return None
 
@@ -104,10 +108,10 @@ class StatValue:
 
                 # The scaling is just to avoid having too few decimal digits when printing,
                 # the value is still just 0.
-                stdev = Decimal(0).scaleb(-decimal.getcontext().prec)
-                for v in values:
-                    diff = v - mean
-                    stdev += diff * diff
+                stdev = sum(
+                    (diff * diff for diff in (v - mean for v in values)),
+                    Decimal(0).scaleb(-decimal.getcontext().prec),
+                )
                 stdev = (stdev / values_len).sqrt()
 
             half, len_is_odd = divmod(values_len, 2)
@@ -132,7 +136,16 @@ def get_stats_of_run_set(runResults, correct_only):
     @param runResults: All the results of the execution of one run set (as list of RunResult objects)
     """
     columns = runResults[0].columns
-    status_list = [(runResult.category, runResult.status) for runResult in runResults]
+    # Classify each run only once instead of once per column,
+    # None marks runs without status that are only relevant for the total.
+    category_list = [
+        (
+            (runResult.category, result.get_result_classification(runResult.status))
+            if runResult.status is not None
+            else None
+        )
+        for runResult in runResults
+    ]
 
     # collect some statistics
     stats = []
@@ -148,7 +161,7 @@ def get_stats_of_run_set(runResults, correct_only):
             assert column.is_numeric()
             values = (run_result.values[index] for run_result in runResults)
             column_stats = _get_stats_of_number_column(
-                values, status_list, correct_only
+                values, category_list, correct_only
             )
 
         stats.append(column_stats)
@@ -161,21 +174,31 @@ def _get_stats_of_number_column(values, categoryList, correct_only):
     assert len(valueList) == len(categoryList)
 
     valuesPerCategory = collections.defaultdict(list)
-    for value, (category, status) in zip(valueList, categoryList):
-        if status is None:
+    categoriesWithNan = set()
+    for value, category in zip(valueList, categoryList):
+        if category is None or value is None:
             continue
-        valuesPerCategory[category, result.get_result_classification(status)].append(
-            value
-        )
+        if value.is_nan():
+            categoriesWithNan.add(category)
+        else:
+            valuesPerCategory[category].append(value)
+    # Sort the values of each category only once, the values for several categories
+    # can then be merged in linear time. Both sorting and merging are stable,
+    # so the result is the same as when sorting all values for the given keys.
+    for category_values in valuesPerCategory.values():
+        category_values.sort()
 
     stats = ColumnStatistics()
     stats.total = StatValue.from_list(valueList)
 
     def create_stat_value_for(*keys):
-        all_values_for_keys = list(
-            itertools.chain.from_iterable(valuesPerCategory[key] for key in keys)
-        )
-        return StatValue.from_list(all_values_for_keys)
+        if categoriesWithNan.intersection(keys):
+            return StatValue(nan, nan, nan, nan, nan, nan)
+        if len(keys) == 1:
+            sorted_values = valuesPerCategory[keys[0]]
+        else:
+            sorted_values = list(heapq.merge(*(valuesPerCategory[key] for key in keys)))
+        return StatValue._from_sorted_list(sorted_values)
 
     stats.correct = create_stat_value_for(
         (result.CATEGORY_CORRECT, result.RESULT_CLASS_TRUE),
@@ -480,3 +480,17 @@ class ColumnsTest(unittest.TestCase):
 
     def test_column_type_comma_decimal_is_text(self):
         self.check_expected_column_type(["1,2"], ColumnType.text)
+
+    def test_format_value_cached_per_format_target(self):
+        column = Column("CpuTime", num_of_digits=2)
+        column.set_column_type_from(["1.55s", "10.4s"])
+        for _ in range(2):
+            self.assertEqual(column.format_value("1.55s", "raw"), "1.55")
+            self.assertEqual(column.format_value("1.55s", "csv"), "1.6")
+
+    def test_format_value_cache_reset_with_column_type(self):
+        column = Column("CpuTime", num_of_digits=2)
+        column.set_column_type_from(["1.55s"])
+        self.assertEqual(column.format_value("1.55s", "csv"), "1.6")
+        column.set_column_type_from(["1.55s", "text"])
+        self.assertEqual(column.format_value("1.55s", "csv"), "1.55s")
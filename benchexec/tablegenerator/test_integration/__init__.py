@@ -5,6 +5,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import base64
 import json
 import os
 import shutil
@@ -12,6 +13,7 @@ import subprocess
 import sys
 import tempfile
 import unittest
+import zlib
 
 import benchexec
 import benchexec.tablegenerator.util
@@ -208,10 +210,11 @@ class TableGeneratorIntegrationTests(unittest.TestCase):
 
     def read_table_from_html(self, file):
         content = benchexec.util.read_file(file)
-        # only keep table
-        content = content[
-            content.index("const data = {") + 13 : content.index("\n};") + 2
-        ]
+        # only keep table, which is compressed
+        start_tag = '<script type="application/octet-stream" id="data">'
+        start = content.index(start_tag) + len(start_tag)
+        content = content[start : content.index("</script>", start)]
+        content = zlib.decompress(base64.b64decode(content)).decode()
         # Pretty-print JSON for better diffs
         content = json.dumps(json.loads(content), indent=" ", sort_keys=True)
         content = content.replace(
@@ -297,6 +300,39 @@ class TableGeneratorIntegrationTests(unittest.TestCase):
             "simple-table-with-columns.table",
         )
 
+    def test_simple_table_cached(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for _ in range(2):  # second execution reads from cache
+                self.generate_tables_and_compare_content(
+                    [
+                        "--cache-dir",
+                        cache_dir,
+                        result_file(
+                            "test.2015-03-03_1613.results.predicateAnalysis.xml"
+                        ),
+                    ],
+                    "test.2015-03-03_1613.results.predicateAnalysis",
+                )
+                shutil.rmtree(self.tmp)
+                os.mkdir(self.tmp)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_simple_table_xml_with_columns_cached(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for _ in range(2):  # second execution reads from cache
+                self.generate_tables_and_compare_content(
+                    [
+                        "--cache-dir",
+                        cache_dir,
+                        "-x",
+                        os.path.join(here, "simple-table-with-columns.xml"),
+                    ],
+                    "simple-table-with-columns.table",
+                )
+                shutil.rmtree(self.tmp)
+                os.mkdir(self.tmp)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
     def test_simple_table_xml_with_links(self):
         self.generate_tables_and_compare_content(
             ["-x", os.path.join(here, "simple-table-with-links.xml")],
@@ -500,6 +536,19 @@ class TableGeneratorIntegrationTests(unittest.TestCase):
             expected_counts="REGRESSIONS 2\nSTATS\n1 0 2\n2 0 1",
         )
 
+    def test_dump_only_multi_table(self):
+        output = self.run_cmd(
+            *tablegenerator,
+            "--dump-only",
+            result_file("test.2015-03-03_1613.results.predicateAnalysis.xml"),
+            result_file("test.2015-03-03_1613.results.valueAnalysis.xml"),
+            "--outputpath",
+            self.tmp,
+        )
+        output = benchexec.tablegenerator.util.normalize_line_endings(output)
+        self.assertIn("REGRESSIONS 2\nSTATS\n3 1 0\n2 0 1\n", output)
+        self.assertEqual(os.listdir(self.tmp), [], "no tables should be written")
+
     def test_dump_count_big_table(self):
         self.generate_tables_and_compare_content(
             [
@@ -724,6 +773,55 @@ class TableGeneratorIntegrationTests(unittest.TestCase):
             formats=["csv", "html"],
         )
 
+    def generate_streamed_table_and_compare_content(self, args, table_prefix):
+        self.generate_tables_and_check_produced_files(
+            ["--stream", *args], table_prefix, formats=["csv"]
+        )
+        generated_csv = benchexec.util.read_file(self.tmp, table_prefix + ".csv")
+        self.assert_file_content_equals(
+            generated_csv, [here, "expected", table_prefix + ".csv"]
+        )
+
+    def test_stream_simple_table(self):
+        self.generate_streamed_table_and_compare_content(
+            [result_file("test.2015-03-03_1613.results.predicateAnalysis.xml")],
+            "test.2015-03-03_1613.results.predicateAnalysis",
+        )
+
+    def test_stream_simple_table_xml_with_columns(self):
+        self.generate_streamed_table_and_compare_content(
+            ["-x", os.path.join(here, "simple-table-with-columns.xml")],
+            "simple-table-with-columns.table",
+        )
+
+    def test_stream_multi_table_common(self):
+        self.generate_streamed_table_and_compare_content(
+            [
+                "--name",
+                "test.2015-03-03_1613-common",
+                "--common",
+                result_file("test.2015-03-03_1613.results.predicateAnalysis.xml"),
+                result_file("test.2015-03-03_1613.results.valueAnalysis.xml"),
+            ],
+            "test.2015-03-03_1613-common.table",
+        )
+
+    def test_stream_multi_table_without_common(self):
+        cmdline = [
+            *tablegenerator,
+            "--stream",
+            "--outputpath",
+            self.tmp,
+            result_file("test.2015-03-03_1613.results.predicateAnalysis.xml"),
+            result_file("test.2015-03-03_1613.results.valueAnalysis.xml"),
+        ]
+        self.assertEqual(
+            1,
+            subprocess.run(cmdline, capture_output=True).returncode,
+            "expected error return code",
+        )
+        self.assertListEqual([], os.listdir(self.tmp))
+
     def test_table_with_nan_and_infinity(self):
         self.generate_tables_and_compare_content(
             [result_file("nan_and_inf.xml")], table_prefix="nan_and_inf"
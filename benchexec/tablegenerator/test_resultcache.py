@@ -0,0 +1,137 @@
+# This file is part of BenchExec, a framework for reliable benchmarking:
+# https://github.com/sosy-lab/benchexec
+#
+# SPDX-FileCopyrightText: 2007-2025 Dirk Beyer <https://www.sosy-lab.org>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import collections
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+
+from benchexec.tablegenerator import RunSetResult, resultcache
+from benchexec.tablegenerator.columns import Column
+
+_TOOL_MODULE = "benchexec_test_resultcache_tool"
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="BenchExec_test_resultcache_")
+        self.cache_dir = os.path.join(self.tmp, "cache")
+        self.result_file = os.path.join(self.tmp, "test.results.xml")
+        with open(self.result_file, "w") as f:
+            f.write("<result/>")
+        self.options = types.SimpleNamespace(
+            ignore_errors=False, all_columns=False, correct_only=False
+        )
+
+        self.tool_file = os.path.join(self.tmp, _TOOL_MODULE + ".py")
+        with open(self.tool_file, "w") as f:
+            f.write("# tool-info module\n")
+        sys.path.insert(0, self.tmp)
+        importlib.invalidate_caches()
+
+    def tearDown(self):
+        sys.path.remove(self.tmp)
+        shutil.rmtree(self.tmp)
+
+    def get_key(self, columns=()):
+        with open(self.result_file, "rb") as f:
+            content = f.read()
+        return resultcache.get_key(
+            self.result_file, content, self.options, None, list(columns), set()
+        )
+
+    def create_result(self):
+        attributes = collections.defaultdict(list)
+        attributes["toolmodule"].append(_TOOL_MODULE)
+        result = RunSetResult([], attributes, [])
+        result.results = []
+        return result
+
+    def store_and_load(self):
+        key = self.get_key()
+        resultcache.store(self.cache_dir, key, self.create_result())
+        return resultcache.load(self.cache_dir, key)
+
+    def cache_file(self, key):
+        return os.path.join(self.cache_dir, key + ".pickle")
+
+    def test_load_stored_result(self):
+        result = self.store_and_load()
+        self.assertIsNotNone(result)
+        self.assertEqual(result.attributes["toolmodule"], [_TOOL_MODULE])
+
+    def test_load_missing_entry(self):
+        self.assertIsNone(resultcache.load(self.cache_dir, self.get_key()))
+
+    def test_invalidation_on_changed_result_file(self):
+        self.assertIsNotNone(self.store_and_load())
+        old_key = self.get_key()
+
+        with open(self.result_file, "w") as f:
+            f.write('<result tool="changed"/>')
+        new_key = self.get_key()
+        self.assertNotEqual(old_key, new_key)
+        self.assertIsNone(resultcache.load(self.cache_dir, new_key))
+
+    def test_invalidation_on_changed_log_zip(self):
+        columns = [Column("value", pattern="Value:")]
+        log_zip = os.path.join(self.tmp, "test.logfiles.zip")
+        with open(log_zip, "w") as f:
+            f.write("old")
+        old_key = self.get_key(columns)
+        self.assertEqual(self.get_key(columns), old_key)
+        self.assertNotEqual(self.get_key(), old_key)
+
+        with open(log_zip, "a") as f:
+            f.write("new")
+        self.assertNotEqual(self.get_key(columns), old_key)
+
+    def test_no_caching_with_log_directory(self):
+        columns = [Column("value", pattern="Value:")]
+        os.mkdir(os.path.join(self.tmp, "test.logfiles"))
+        self.assertIsNone(self.get_key(columns))
+        self.assertIsNotNone(self.get_key())  # log files not needed without pattern
+
+    def test_invalidation_on_changed_tool_version(self):
+        self.assertIsNotNone(self.store_and_load())
+
+        with open(self.tool_file, "a") as f:
+            f.write("VERSION = 2\n")
+        self.assertIsNone(resultcache.load(self.cache_dir, self.get_key()))
+
+    def test_invalid_entry(self):
+        key = self.get_key()
+        os.makedirs(self.cache_dir)
+        with open(self.cache_file(key), "wb") as f:
+            f.write(b"invalid")
+        self.assertIsNone(resultcache.load(self.cache_dir, key))
+
+    def test_eviction(self):
+        keys = ["a" * 64, "b" * 64, "c" * 64]
+        for i, key in enumerate(keys):
+            resultcache.store(self.cache_dir, key, self.create_result())
+            os.utime(self.cache_file(key), ns=(i * 10**9, i * 10**9))
+        entry_size = os.path.getsize(self.cache_file(keys[0]))
+
+        # loading marks the oldest entry as recently used
+        self.assertIsNotNone(resultcache.load(self.cache_dir, keys[0]))
+
+        resultcache.evict(self.cache_dir, max_size=2 * entry_size)
+        self.assertTrue(os.path.exists(self.cache_file(keys[0])))
+        self.assertFalse(os.path.exists(self.cache_file(keys[1])))
+        self.assertTrue(os.path.exists(self.cache_file(keys[2])))
+
+        resultcache.evict(self.cache_dir, max_size=0)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_eviction_of_missing_cache_dir(self):
+        resultcache.evict(self.cache_dir, max_size=0)
+        self.assertFalse(os.path.exists(self.cache_dir))
@@ -8,6 +8,8 @@
 import unittest
 from decimal import Decimal
 
+from benchexec import result
+from benchexec.tablegenerator import statistics
 from benchexec.tablegenerator.statistics import StatValue
 
 
@@ -168,3 +170,32 @@ class TestStatValue(unittest.TestCase):
         self.assertEqual(s.min, ninf, f"Not -Inf, but {s.min}")
         self.assertEqual(s.median, v, f"Not 0.123, but {s.median}")
         self.assertTrue(s.stdev.is_nan(), f"Not NaN, but {s.stdev}")
+
+    def test_number_column_categories(self):
+        correct_true = (result.CATEGORY_CORRECT, result.RESULT_CLASS_TRUE)
+        correct_false = (result.CATEGORY_CORRECT, result.RESULT_CLASS_FALSE)
+        wrong_true = (result.CATEGORY_WRONG, result.RESULT_CLASS_TRUE)
+        values = ["3", "1.0", "2", "1.00", "nan", "5", None]
+        categories = [
+            correct_true,
+            correct_false,
+            correct_true,
+            correct_true,
+            wrong_true,
+            None,
+            correct_false,
+        ]
+
+        stats = statistics._get_stats_of_number_column(values, categories, False)
+        expected_correct = StatValue.from_list(
+            [Decimal(3), Decimal(2), Decimal("1.00"), Decimal("1.0")]
+        )
+        for attr in ["sum", "min", "max", "avg", "median", "stdev"]:
+            self.assertEqual(
+                str(getattr(stats.correct, attr)), str(getattr(expected_correct, attr))
+            )
+        self.assertEqual(stats.correct_true.sum, Decimal(6))
+        self.assertEqual(stats.correct_false.sum, Decimal(1))
+        self.assertTrue(stats.wrong.sum.is_nan())
+        self.assertIsNone(stats.wrong_false)
+        self.assertTrue(stats.total.sum.is_nan())
@@ -5,7 +5,11 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import http.server
+import io
+import threading
 import unittest
+import zipfile
 from decimal import Decimal
 
 from benchexec.tablegenerator import util
@@ -104,6 +108,16 @@ class TestUnit(unittest.TestCase):
         self.assertListEqual(
             [1, 2, 3, 4, 5, 6], util.merge_lists([[1, 2, 4, 6], [1, 2, 3, 4, 5]])
         )
+        self.assertListEqual(
+            [4, 1, 5, 2, 3], util.merge_lists([[1, 2, 3], [4, 1, 5], [2, 5]])
+        )
+        self.assertListEqual([None, 1], util.merge_lists([[None], [None, 1]]))
+
+    def test_merge_lists_many_elements(self):
+        # would take minutes with a quadratic algorithm
+        n = 10**5
+        lists = [[x for x in range(n) if x % 20 != k] for k in range(20)]
+        self.assertListEqual(list(range(n)), util.merge_lists(lists))
 
     def test_find_common_elements(self):
         self.assertListEqual([], util.find_common_elements([[]]))
@@ -140,3 +154,75 @@ class TestUnit(unittest.TestCase):
         self.assertEqual(Decimal("-1"), util.to_decimal(-1))  # noqa: FURB157 deliberate for testing
         self.assertEqual(Decimal(-1.234), util.to_decimal(-1.234))  # noqa: RUF032 deliberate for testing
         self.assertEqual(Decimal("-1.234"), util.to_decimal(Decimal("-1.234")))
+
+
+class TestOpenUrlRandomAccess(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zip_file:
+            for i in range(100):
+                zip_file.writestr(f"logs/{i}.log", f"log {i}\n" + "x" * 100000)
+        content = buffer.getvalue()
+        cls.requested_bytes = requested_bytes = []
+
+        class RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+            def do_HEAD(self):
+                if self.path.startswith("/no-head/"):
+                    self.send_error(405)
+                    return
+                self.send_response(200)
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+
+            def do_GET(self):
+                if "Range" not in self.headers:
+                    self.send_response(200)
+                    self.send_header("Content-Length", str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content)
+                    return
+                start, end = self.headers["Range"].removeprefix("bytes=").split("-")
+                data = content[int(start) : int(end) + 1]
+                requested_bytes.append(len(data))
+                self.send_response(206)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        cls.server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), RangeRequestHandler
+        )
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/logs.zip"
+        cls.url_without_head = (
+            f"http://127.0.0.1:{cls.server.server_port}/no-head/logs.zip"
+        )
+        cls.size = len(content)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_read_single_file_from_zip(self):
+        self.requested_bytes.clear()
+        with (
+            zipfile.ZipFile(util.open_url_random_access(self.url)) as zip_file,
+            zip_file.open("logs/42.log") as log_file,
+        ):
+            self.assertEqual(log_file.readline(), b"log 42\n")
+        self.assertLess(sum(self.requested_bytes), self.size / 10)
+
+    def test_read_from_zip_without_head_support(self):
+        with (
+            zipfile.ZipFile(
+                util.open_url_random_access(self.url_without_head)
+            ) as zip_file,
+            zip_file.open("logs/42.log") as log_file,
+        ):
+            self.assertEqual(log_file.readline(), b"log 42\n")
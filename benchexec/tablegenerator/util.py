@@ -14,6 +14,8 @@ import io
 import logging
 import os
 import platform
+import urllib.error
+import urllib.parse
 import urllib.request
 from collections.abc import Iterable
 from decimal import Decimal
@@ -117,6 +119,82 @@ def open_url_seekable(path_url, mode="rt"):
         return io.TextIOWrapper(response)
 
 
+def open_url_random_access(path_url):
+    """Open a URL in binary mode for reading at arbitrary positions.
+    For HTTP(S) URLs, range requests are used if the server supports them,
+    such that only the parts of the file that are actually read are transferred.
+    Otherwise, this is the same as open_url_seekable()."""
+    if urllib.parse.urlparse(path_url).scheme in ["http", "https"]:
+        logging.debug("Making HEAD request to '%s'", path_url)
+        request = urllib.request.Request(path_url, method="HEAD")  # noqa: S310
+        try:
+            with urllib.request.urlopen(request) as response:  # noqa: S310
+                accept_ranges = response.headers.get("Accept-Ranges")
+                size = response.headers.get("Content-Length")
+        except urllib.error.URLError as e:
+            # Some servers and proxies do not support HEAD requests.
+            logging.debug("HEAD request to '%s' failed: %s", path_url, e)
+            accept_ranges = size = None
+        if accept_ranges == "bytes" and size:
+            return io.BufferedReader(
+                _HTTPRangeReader(path_url, int(size)),
+                buffer_size=_HTTP_RANGE_REQUEST_SIZE,
+            )
+    return open_url_seekable(path_url, mode="rb")
+
+
+# Minimal number of bytes that are requested at once by _HTTPRangeReader
+_HTTP_RANGE_REQUEST_SIZE = 256 * 1024
+
+
+class _HTTPRangeReader(io.RawIOBase):
+    """Seekable binary file for an HTTP(S) URL that is read with range requests."""
+
+    def __init__(self, url, size):
+        self._url = url
+        self._size = size
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence {whence}")
+        if pos < 0:
+            raise OSError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, b):
+        end = min(self._pos + len(b), self._size)
+        if end <= self._pos:
+            return 0
+        logging.debug("Requesting bytes %s-%s of '%s'", self._pos, end - 1, self._url)
+        request = urllib.request.Request(  # noqa: S310
+            self._url, headers={"Range": f"bytes={self._pos}-{end - 1}"}
+        )
+        with urllib.request.urlopen(request) as response:  # noqa: S310
+            if response.status != 206:
+                raise OSError(f"Range request for '{self._url}' was not successful")
+            data = response.read()
+        b[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
 def split_number_and_unit(s):
     """
     Split a string into two parts: a number prefix and an arbitrary suffix.
@@ -155,7 +233,9 @@ def to_decimal(s):
         return None
     if isinstance(s, str):
         s = s.strip()
-        if s.lower() in ["nan", "inf", "+inf", "-inf"]:
+        if s[-1:].isdigit():
+            return Decimal(s)  # common case, no unit
+        elif s.lower() in ["nan", "inf", "+inf", "-inf"]:
             return Decimal(s)
         else:
             # remove trailing units (e.g., in '1.23s')
@@ -250,33 +330,27 @@ def merge_lists(list_of_lists: Iterable[Iterable[_T]]) -> list[_T]:
     This function merges several sequences, e.g. [A,C] + [A,B] --> [A,B,C].
     It keeps the order of elements.
     """
-    result_list = []
-    elem_set = set()
+    # The merged sequence is kept as a circular singly-linked list that is stored as
+    # a dict from each element to its successor (with a sentinel as first element),
+    # such that inserting after a given element is possible in constant time.
+    # Inserting into a Python list would make this quadratic.
+    head = object()
+    next_elem = {head: head}
     for current_list in list_of_lists:
-        # prev_index is for optimizing inserting consecutive sequences of new elems,
-        # e.g., in the first outer loop iteration.
-        prev_index = None
-        # In later iterations of the outer loop, it can happen that we see [a,b] where
-        # a already exists at some place in result_list and b does not.
-        # Then we want to insert b right after a, so we need to remember a and find it.
-        prev_elem = None
+        # New elements are inserted directly after the previous element
+        # of the current list, or at the beginning if there is none.
+        prev_elem = head
         for elem in current_list:
-            if elem not in elem_set:
-                elem_set.add(elem)
-                # calculate where to insert in result_list
-                if prev_index is not None:
-                    index = prev_index + 1
-                elif prev_elem is not None:
-                    index = result_list.index(prev_elem) + 1
-                else:
-                    index = 0
-                result_list.insert(index, elem)
-                prev_index = index
-                prev_elem = elem
-            else:
-                prev_index = None
-                prev_elem = elem
+            if elem not in next_elem:
+                next_elem[elem] = next_elem[prev_elem]
+                next_elem[prev_elem] = elem
+            prev_elem = elem
 
+    result_list = []
+    elem = next_elem[head]
+    while elem is not head:
+        result_list.append(elem)
+        elem = next_elem[elem]
     return result_list
 
 
@@ -0,0 +1,73 @@
+# This file is part of BenchExec, a framework for reliable benchmarking:
+# https://github.com/sosy-lab/benchexec
+#
+# SPDX-FileCopyrightText: 2007-2025 Dirk Beyer <https://www.sosy-lab.org>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import argparse
+import unittest
+
+import pytest
+
+from benchexec import container, containerexecutor, model
+
+_TOOL_MODULE = "benchexec.tools.dummy"
+
+
+class TestContainerizedTool(unittest.TestCase):
+    def setUp(self):
+        try:
+            container.execute_in_namespace(lambda: 0)
+        except OSError as e:
+            pytest.xfail(reason=f"Namespaces not supported: {e.strerror}")
+
+        parser = argparse.ArgumentParser()
+        containerexecutor.add_basic_container_args(parser)
+        self.config = parser.parse_args(
+            ["--read-only-dir", "/", "--hidden-dir", "/home", "--hidden-dir", "/tmp"]
+        )
+        self.config.container = True
+        self.config.tool_info_processes = None
+
+    def load_tool(self, num_of_threads):
+        tool_module, tool = model.load_tool_info("dummy", self.config, num_of_threads)
+        self.addCleanup(tool.close)
+        self.assertEqual(tool_module, _TOOL_MODULE)
+        return tool
+
+    def test_single_process(self):
+        tool = self.load_tool(1)
+        self.assertEqual(tool.name(), "DummyTool")
+        self.assertEqual(len(tool._pools), 1)
+
+    def test_several_processes(self):
+        tool = self.load_tool(2)
+        self.assertEqual(len(tool._pools), 1)  # further processes are started lazily
+
+        # simulate concurrent calls by keeping the first process busy
+        busy_pool = tool._acquire_pool()
+        try:
+            self.assertEqual(tool._forward_call("name", [], {}), "DummyTool")
+            self.assertEqual(len(tool._pools), 2)
+        finally:
+            tool._idle_pools.put(busy_pool)
+
+        # the limit is reached, so calls wait for a free process
+        first_pool = tool._acquire_pool()
+        second_pool = tool._acquire_pool()
+        self.assertIsNot(first_pool, second_pool)
+        self.assertTrue(tool._idle_pools.empty())
+        tool._idle_pools.put(first_pool)
+        tool._idle_pools.put(second_pool)
+        self.assertEqual(len(tool._pools), 2)
+
+    def test_tool_info_processes(self):
+        self.config.tool_info_processes = 1
+        tool = self.load_tool(4)
+        self.assertEqual(tool._max_processes, 1)
+
+    def test_no_tool_info_processes(self):
+        self.config.tool_info_processes = 0
+        with self.assertRaises(SystemExit):
+            model.load_tool_info("dummy", self.config, 4)
@@ -0,0 +1,135 @@
+# This file is part of BenchExec, a framework for reliable benchmarking:
+# https://github.com/sosy-lab/benchexec
+#
+# SPDX-FileCopyrightText: 2007-2025 Dirk Beyer <https://www.sosy-lab.org>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import errno
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from benchexec import filehierarchylimit, libc
+from benchexec.filehierarchylimit import FileHierarchyLimit
+
+
+class TestFileHierarchyLimit(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp(prefix="BenchExec_test_filehierarchylimit_")
+        self.addCleanup(shutil.rmtree, self.path)
+        self.process = subprocess.Popen(["sleep", "100"])
+        self.addCleanup(self.process.wait)
+        self.addCleanup(self.process.kill)
+        self.reasons = []
+        self.limit_reached = threading.Event()
+
+        # such that the tests do not need to wait long for periodic checks
+        interval_patch = patch.object(
+            filehierarchylimit, "_CHECK_INTERVAL_SECONDS", 0.1
+        )
+        interval_patch.start()
+        self.addCleanup(interval_patch.stop)
+
+    def callback(self, reason):
+        self.reasons.append(reason)
+        self.limit_reached.set()
+
+    def start_limit(self, files_count_limit=None, files_size_limit=None):
+        limit = FileHierarchyLimit(
+            self.path,
+            files_count_limit=files_count_limit,
+            files_size_limit=files_size_limit,
+            pid_to_kill=self.process.pid,
+            callbackFn=self.callback,
+        )
+        limit.start()
+        self.addCleanup(limit.cancel)
+        return limit
+
+    def create_files(self, count, directory=None):
+        directory = directory or self.path
+        for i in range(count):
+            with open(os.path.join(directory, str(i)), "w"):
+                pass
+
+    def assert_killed(self, reason):
+        self.assertTrue(self.limit_reached.wait(5), "limit was not detected")
+        self.assertEqual(self.reasons, [reason])
+        self.assertEqual(self.process.wait(5), -signal.SIGKILL)
+
+    def assert_not_killed(self):
+        time.sleep(0.5)  # several check intervals
+        self.assertEqual(self.reasons, [])
+        self.assertIsNone(self.process.poll())
+
+    def test_files_count_limit(self):
+        self.start_limit(files_count_limit=10)
+        os.mkdir(os.path.join(self.path, "subdir"))
+        self.create_files(5)
+        self.create_files(6, os.path.join(self.path, "subdir"))
+        self.assert_killed("files-count")
+
+    def test_files_count_limit_existing_files(self):
+        self.create_files(11)
+        self.start_limit(files_count_limit=10)
+        self.assert_killed("files-count")
+
+    def test_files_count_limit_deleted_files(self):
+        self.start_limit(files_count_limit=10)
+        for _ in range(3):
+            self.create_files(10)
+            for file in os.listdir(self.path):
+                os.remove(os.path.join(self.path, file))
+        self.assert_not_killed()
+
+    def test_files_size_limit(self):
+        self.start_limit(files_size_limit=100)
+        file = os.path.join(self.path, "file")
+        with open(file, "w") as f:
+            f.write("a" * 50)
+        self.assert_not_killed()
+        with open(file, "a") as f:
+            f.write("a" * 51)
+        self.assert_killed("files-size")
+
+    def test_files_size_limit_existing_files(self):
+        with open(os.path.join(self.path, "file"), "w") as f:
+            f.write("a" * 101)
+        self.start_limit(files_size_limit=100)
+        self.assert_killed("files-size")
+
+    def test_within_limits(self):
+        self.start_limit(files_count_limit=10, files_size_limit=100)
+        self.create_files(10)
+        self.assert_not_killed()
+
+    def test_cancel(self):
+        limit = self.start_limit(files_count_limit=10)
+        limit.cancel()
+        self.create_files(11)
+        self.assert_not_killed()
+
+    def test_fallback_without_inotify(self):
+        with (
+            patch.object(
+                libc,
+                "inotify_init1",
+                side_effect=OSError(errno.EMFILE, os.strerror(errno.EMFILE)),
+            ),
+            self.assertLogs(level="WARNING"),
+        ):
+            limit = self.start_limit(files_count_limit=10, files_size_limit=100)
+            self.create_files(10)
+            self.assert_not_killed()
+            self.assertIsNone(limit._inotify_fd)
+
+            # noticed only by periodically scanning the hierarchy again
+            self.create_files(11)
+            self.assert_killed("files-count")
@@ -0,0 +1,97 @@
+# This file is part of BenchExec, a framework for reliable benchmarking:
+# https://github.com/sosy-lab/benchexec
+#
+# SPDX-FileCopyrightText: 2007-2025 Dirk Beyer <https://www.sosy-lab.org>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import bz2
+import os
+import tempfile
+import types
+import unittest
+
+from benchexec import localexecution
+
+RESULT_XML = """<?xml version="1.0" ?>
+<result>
+  <run name="../tasks/a.c" files="[../tasks/a.c]">
+    <column title="walltime" value="1.5s"/>
+  </run>
+  <run name="../tasks/b.c" files="[../tasks/b.c]">
+    <column title="walltime" value="900.0s"/>
+  </run>
+  <run name="../tasks/c.c" files="[../tasks/c.c]">
+    <column title="cputime" value="20.0s"/>
+  </run>
+  <run name="no-file-task">
+    <column title="walltime" value="5s"/>
+  </run>
+</result>
+"""
+
+
+def _run(identifier, sourcefiles=True):
+    return types.SimpleNamespace(
+        identifier=identifier, sourcefiles=[identifier] if sourcefiles else []
+    )
+
+
+class TestRunOrder(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory(prefix="BenchExec_test_")
+        self.result_file = os.path.join(
+            self.tmp_dir.name, "results", "test.results.xml.bz2"
+        )
+        os.mkdir(os.path.dirname(self.result_file))
+        with bz2.open(self.result_file, "wt") as f:
+            f.write(RESULT_XML)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_load_expected_walltimes(self):
+        walltimes = localexecution._load_expected_walltimes([self.result_file])
+        task_dir = os.path.join(self.tmp_dir.name, "tasks")
+        self.assertEqual(
+            walltimes,
+            {
+                os.path.join(task_dir, "a.c"): 1.5,
+                os.path.join(task_dir, "b.c"): 900.0,
+                os.path.join(task_dir, "c.c"): 20.0,
+                "no-file-task": 5.0,
+            },
+        )
+
+    def test_load_missing_file(self):
+        with self.assertLogs(level="WARNING"):
+            walltimes = localexecution._load_expected_walltimes(
+                [os.path.join(self.tmp_dir.name, "missing.xml")]
+            )
+        self.assertEqual(walltimes, {})
+
+    def test_order_runs(self):
+        walltimes = localexecution._load_expected_walltimes([self.result_file])
+        task_dir = os.path.join(self.tmp_dir.name, "tasks")
+        runs = [
+            _run(os.path.join(task_dir, "a.c")),
+            _run(os.path.join(task_dir, "b.c")),
+            _run("no-file-task", sourcefiles=False),
+            _run(os.path.join(task_dir, "new.c")),
+            _run(os.path.join(task_dir, "c.c")),
+        ]
+        ordered = localexecution._order_runs(runs, walltimes)
+        self.assertEqual(
+            [run.identifier for run in ordered],
+            [
+                os.path.join(task_dir, "new.c"),
+                os.path.join(task_dir, "b.c"),
+                os.path.join(task_dir, "c.c"),
+                "no-file-task",
+                os.path.join(task_dir, "a.c"),
+            ],
+        )
+
+    def test_order_runs_without_history(self):
+        runs = [_run("a"), _run("b"), _run("c")]
+        self.assertEqual(localexecution._order_runs(runs, {}), runs)
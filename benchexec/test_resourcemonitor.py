@@ -0,0 +1,77 @@
+# This file is part of BenchExec, a framework for reliable benchmarking:
+# https://github.com/sosy-lab/benchexec
+#
+# SPDX-FileCopyrightText: 2007-2025 Dirk Beyer <https://www.sosy-lab.org>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import threading
+import time
+import unittest
+
+from benchexec.resourcemonitor import ResourceMonitor
+
+
+class TestResourceMonitor(unittest.TestCase):
+    def setUp(self):
+        self.monitor = ResourceMonitor.get_instance()
+
+    def test_shared_instance(self):
+        self.assertIs(ResourceMonitor.get_instance(), self.monitor)
+        self.assertTrue(self.monitor.is_alive())
+
+    def test_call_at_order(self):
+        calls = []
+        done = threading.Event()
+        now = time.monotonic()
+        self.monitor.call_at(now + 0.2, lambda: (calls.append(2), done.set()))
+        self.monitor.call_at(now + 0.1, lambda: calls.append(1))
+        self.monitor.call_at(now, lambda: calls.append(0))
+        self.assertTrue(done.wait(5))
+        self.assertEqual(calls, [0, 1, 2])
+
+    def test_cancel(self):
+        calls = []
+        done = threading.Event()
+        now = time.monotonic()
+        timer = self.monitor.call_at(now + 0.1, lambda: calls.append("cancelled"))
+        self.monitor.call_at(now + 0.2, done.set)
+        timer.cancel()
+        self.assertTrue(done.wait(5))
+        self.assertEqual(calls, [])
+
+    def test_exception_in_callback(self):
+        done = threading.Event()
+
+        def fail():
+            raise ValueError("expected in test")
+
+        with self.assertLogs(level="ERROR"):
+            self.monitor.call_at(time.monotonic(), fail)
+            self.monitor.call_at(time.monotonic() + 0.1, done.set)
+            self.assertTrue(done.wait(5))
+        self.assertTrue(self.monitor.is_alive())
+
+    def test_reader(self):
+        read_fd, write_fd = os.pipe()
+        received = []
+        done = threading.Event()
+
+        def callback():
+            received.append(os.read(read_fd, 100))
+            self.monitor.remove_reader(read_fd)
+            done.set()
+
+        self.monitor.add_reader(read_fd, callback)
+        os.write(write_fd, b"event")
+        self.assertTrue(done.wait(5))
+        self.assertEqual(received, [b"event"])
+
+        # wait until monitor has closed the file descriptor
+        closed = threading.Event()
+        self.monitor.call_soon(closed.set)
+        self.assertTrue(closed.wait(5))
+        with self.assertRaises(OSError):
+            os.fstat(read_fd)
+        os.close(write_fd)
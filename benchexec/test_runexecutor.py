@@ -6,12 +6,16 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import contextlib
+import datetime
+import decimal
+import json
 import logging
 import os
 import pprint
 import re
 import shlex
 import shutil
+import socket
 import subprocess
 import tempfile
 import threading
@@ -278,6 +282,56 @@ class TestRunExecutor(unittest.TestCase):
     def test_wrong_command_extern(self):
         self.execute_run("/does/not/exist", expect_terminationreason="failed")
 
+    @requires_sh
+    def test_serve(self):
+        temp_dir = tempfile.mkdtemp(prefix="BenchExec_test_runexec_serve_")
+        socket_path = os.path.join(temp_dir, "runexec.sock")
+        server = subprocess.Popen(
+            ["python3", runexec, "--no-container", "--serve", socket_path],
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while not os.path.exists(socket_path):
+                self.assertIsNone(server.poll(), "runexec --serve terminated")
+                time.sleep(0.1)
+
+            requests = [
+                {
+                    "id": 1,
+                    "args": ["/bin/sh", "-c", "echo TEST_TOKEN; exit 3"],
+                    "output": os.path.join(temp_dir, "output1.log"),
+                },
+                {
+                    "id": 2,
+                    "args": ["/bin/sh", "-c", "exit 0"],
+                    "output": os.path.join(temp_dir, "output2.log"),
+                },
+                {"id": 3, "args": [], "output": os.path.join(temp_dir, "output3.log")},
+            ]
+            with socket.socket(socket.AF_UNIX) as client:
+                client.connect(socket_path)
+                client.sendall(
+                    b"".join(json.dumps(r).encode() + b"\n" for r in requests)
+                )
+                client.shutdown(socket.SHUT_WR)
+                responses = {
+                    response["id"]: response
+                    for response in map(json.loads, client.makefile())
+                }
+            with open(os.path.join(temp_dir, "output1.log")) as output_file:
+                output = output_file.read()
+        finally:
+            server.terminate()
+            server.wait()
+            shutil.rmtree(temp_dir)
+
+        self.assertEqual(server.returncode, 0)
+        self.assertEqual(responses[1]["result"]["returnvalue"], 3)
+        self.assertIn("TEST_TOKEN", output)
+        self.assertEqual(responses[2]["result"]["returnvalue"], 0)
+        self.assertIn("walltime", responses[2]["result"])
+        self.assertIn("error", responses[3])
+
     @requires_sh
     def test_cputime_hardlimit(self):
         with self.skip_if_logs("Time limit cannot be specified without cpuacct cgroup"):
@@ -902,7 +956,7 @@ wait $child_pid
         self.check_exitcode(result, 9, "exit code of killed process is not 9")
         self.assertAlmostEqual(
             result["walltime"],
-            2,
+            1,
             delta=0.5,
             msg="walltime is not approximately the time after which the process should have been killed",
         )
@@ -966,6 +1020,9 @@ class TestRunExecutorWithContainer(TestRunExecutor):
     def test_no_cleanup_temp(self):
         self.skipTest("not relevant in container")
 
+    def test_serve(self):
+        self.skipTest("not relevant in container")
+
     @requires_sh
     def check_result_files(
         self, shell_cmd, result_files_patterns, expected_result_files
@@ -1392,3 +1449,59 @@ More output
 
             self.assertFalse(os.path.exists(report_file.name))
             self.assertEqual(output.read(), output_content + report_content)
+
+    def test_parse_run_request(self):
+        run_kwargs = runexecutor._parse_run_request(
+            {
+                "args": ["echo", "Test"],
+                "output": "output.log",
+                "input": "input.txt",
+                "timelimit": "1min",
+                "memlimit": 1000,
+                "cores": "0-2",
+            },
+            use_namespaces=False,
+        )
+        self.assertEqual(
+            run_kwargs,
+            {
+                "args": ["echo", "Test"],
+                "output_filename": "output.log",
+                "hardtimelimit": 60,
+                "memlimit": 1000,
+                "cores": [0, 1, 2],
+            },
+        )
+
+    def test_parse_invalid_run_request(self):
+        invalid_requests = [
+            {"output": "output.log"},
+            {"args": "echo", "output": "output.log"},
+            {"args": ["echo"]},
+            {"args": ["echo"], "output": "output.log", "unknown": 1},
+            {"args": ["echo"], "output": "output.log", "resultFiles": ["."]},
+        ]
+        for request in invalid_requests:
+            self.assertRaises(
+                (TypeError, ValueError),
+                runexecutor._parse_run_request,
+                request,
+                use_namespaces=True,
+            )
+
+    def test_result_to_json(self):
+        result = {
+            "starttime": datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+            "cputime": decimal.Decimal("1.5"),
+            "memory": 4096,
+            "exitcode": util.ProcessExitCode.create(value=3),
+        }
+        self.assertEqual(
+            json.loads(json.dumps(runexecutor._result_to_json(result))),
+            {
+                "starttime": "2020-01-01T00:00:00+00:00",
+                "cputime": 1.5,
+                "memory": 4096,
+                "returnvalue": 3,
+            },
+        )
@@ -85,6 +85,12 @@ class Tool1To2:
     def get_value_from_output(self, output, identifier):
         return self._wrapped.get_value_from_output(output._lines, identifier)
 
+    def get_values_from_output(self, output, identifiers):
+        return [
+            self._wrapped.get_value_from_output(output._lines, identifier)
+            for identifier in identifiers
+        ]
+
     def project_url(self):
         return None
 
@@ -297,22 +297,34 @@ class Tool(benchexec.tools.template.BaseTool2):
         return status
 
     def get_value_from_output(self, output, identifier):
+        return self._get_values_from_output(output, [identifier])[0]
+
+    def get_values_from_output(self, output, identifiers):
+        if type(self).get_value_from_output is not Tool.get_value_from_output:
+            # Subclasses that only override get_value_from_output need to get
+            # all identifiers passed to their implementation.
+            return super().get_values_from_output(output, identifiers)
+        return self._get_values_from_output(output, identifiers)
+
+    def _get_values_from_output(self, output, identifiers):
         # search for the text in output and get its value,
         # search the first line, that starts with the searched text
         # warn if there are more lines (multiple statistics from sequential analysis?)
-        match = None
+        matches = [None] * len(identifiers)
         for line in output:
-            if line.lstrip().startswith(identifier):
-                startPosition = line.find(":") + 1
-                endPosition = line.find("(", startPosition)
-                if endPosition == -1:
-                    endPosition = len(line)
-                if match is None:
-                    match = line[startPosition:endPosition].strip()
-                else:
-                    logging.warning(
-                        "skipping repeated match for identifier '%s': '%s'",
-                        identifier,
-                        line,
-                    )
-        return match
+            stripped_line = line.lstrip()
+            for i, identifier in enumerate(identifiers):
+                if stripped_line.startswith(identifier):
+                    startPosition = line.find(":") + 1
+                    endPosition = line.find("(", startPosition)
+                    if endPosition == -1:
+                        endPosition = len(line)
+                    if matches[i] is None:
+                        matches[i] = line[startPosition:endPosition].strip()
+                    else:
+                        logging.warning(
+                            "skipping repeated match for identifier '%s': '%s'",
+                            identifier,
+                            line,
+                        )
+        return matches
@@ -349,6 +349,21 @@ class BaseTool2(metaclass=ABCMeta):
         """
         pass
 
+    def get_values_from_output(self, output, identifiers):
+        """
+        OPTIONAL, extract several statistic values from the output of the tool.
+        The default implementation calls get_value_from_output() for each identifier,
+        tools with large outputs can override this to process the output only once.
+        The result needs to be the same as for calling get_value_from_output().
+
+        @param output: The output of the tool as instance of class RunOutput.
+        @param identifiers: A list of user-specified identifiers for statistic items.
+        @return a list with the result of get_value_from_output() for each identifier
+        """
+        return [
+            self.get_value_from_output(output, identifier) for identifier in identifiers
+        ]
+
     def close(self):  # noqa: B027 does not need to be overridden
         """
         OPTIONAL, called before tool-info module is no longer used,
@@ -74,11 +74,13 @@ def download_required_jars(config):
             temp_dir.cleanup()
 
 
-def load_tool_info_in_container(tool_name, config):
+def load_tool_info_in_container(tool_name, config, num_of_threads=1):
     """
     Load the tool-info class inside a Podman container.
     @param tool_name: The name of the tool-info module.
     Either a full Python package name or a name within the benchexec.tools package.
+    @param num_of_threads: Ignored, the tool-info module always uses a single
+    Podman container.
     @return: A tuple of the full name of the used tool-info module and an instance of the tool-info class.
     """
     tool_module = tool_name if "." in tool_name else f"benchexec.tools.{tool_name}"
@@ -177,10 +177,10 @@ class PodmanContainerizedTool(ContainerizedTool):
 
         super().__init__(tool_module, config)
 
-    def _setup_container(self, tool_module, config):
-        self.__doc__, self.container_id = self._pool.apply(
+    def _setup_container(self, pool):
+        self.__doc__, self.container_id = pool.apply(
             _init_container_and_load_tool,
-            [_init_container, tool_module],
+            [_init_container, self._tool_module],
             {
                 "image": self.image,
                 "tool_directory": self.tool_directory,